@@ -100,7 +100,7 @@ class RandomAgent(DoNothingAgent):
             attack_minions = [minion for minion in filter(lambda minion: minion.can_attack(), player.minions)]
             if player.hero.can_attack():
                 attack_minions.append(player.hero)
-            playable_cards = [card for card in filter(lambda card: card.can_use(player, player.game), player.hand)]
+            playable_cards = player.playable_cards()
             if player.hero.power.can_use():
                 possible_actions = len(attack_minions) + len(playable_cards) + 1
             else:
@@ -1,6 +1,8 @@
 import abc
 from functools import reduce
+import hearthbreaker.cards.catalog
 import hearthbreaker.constants
+import hearthbreaker.targeting
 from hearthbreaker.constants import CARD_RARITY, MINION_TYPE
 from hearthbreaker.game_objects import Bindable, GameObject, GameException, Hero
 
@@ -13,6 +15,18 @@ def _is_spell_targetable(target):
     return target.spell_targetable() and not target.dead
 
 
+def _is_static_mana_change(tag):
+    # A mana change can be cached if it changes the cost by a fixed amount, and always applies to the same cards
+    from hearthbreaker.tags.base import Function
+    from hearthbreaker.tags.selector import CardSelector
+    if tag.condition or isinstance(tag.status.amount, Function):
+        return False
+    selector = getattr(tag, "selector", None)
+    if selector is None:
+        return True
+    return type(selector) is CardSelector and (not selector.condition or selector.condition.is_stable())
+
+
 class Card(Bindable, GameObject):
     """
     Represents a card in Heathstone.  Every card is implemented as a subclass, either directly or through
@@ -109,25 +123,46 @@ class Card(Bindable, GameObject):
         This cost is the base cost for the card, modified by any tags from the card itself, or
         from other cards (such as :class:`hearthbreaker.cards.minions.neutral.VentureCoMercenary`)
 
+        The cost is cached in :attr:`Game.mana_cache <hearthbreaker.engine.Game.mana_cache>` until an aura or buff
+        which changes the cost of cards is added or removed, as long as every such aura and buff changes the cost by a
+        fixed amount.  Costs which depend on the state of the game, such as the
+        :class:`hearthbreaker.cards.minions.neutral.SeaGiant`'s, are calculated each time.
 
         :return: representing the actual mana cost of this card.
         :rtype: int
         """
         from hearthbreaker.tags.status import ManaChange
-        # Mana appears to be calculated in reverse order from other stats (auras first, then buffs)
-
-        mana = reduce(lambda a, b: b.update(self, a), [aura.status
-                                                       for p in self.player.game.players
-                                                       for aura in p.object_auras
-                                                       if aura.match(self) and isinstance(aura.status, ManaChange)],
-                      self.mana)
-        mana = reduce(lambda a, b: b.update(self, a), [buff.status for buff in self.buffs
-                                                       if isinstance(buff.status, ManaChange) and
-                                                       (not buff.condition or buff.condition.evaluate(self, self))],
-                      mana)
-
+        game = self.player.game
+        cached = game.mana_cache.get(id(self))
+        if cached is not None and cached[0] is self and cached[1] is self.player:
+            return cached[2]
+
+        # The cost is only cached if none of the auras or buffs which could change it depend on the state of the game
+        static = True
+        auras = []
+        for p in game.players:
+            for aura in p.object_auras:
+                if isinstance(aura.status, ManaChange):
+                    static = static and _is_static_mana_change(aura)
+                    if aura.match(self):
+                        auras.append(aura.status)
+        buffs = []
+        for buff in self.buffs:
+            if isinstance(buff.status, ManaChange):
+                static = static and _is_static_mana_change(buff)
+                if not buff.condition or buff.condition.evaluate(self, self):
+                    buffs.append(buff.status)
+
+        mana = self._apply_mana_changes(auras, buffs)
+        if static:
+            game.mana_cache[id(self)] = (self, self.player, mana)
         return mana
 
+    def _apply_mana_changes(self, auras, buffs):
+        # Mana appears to be calculated in reverse order from other stats (auras first, then buffs)
+        mana = reduce(lambda a, b: b.update(self, a), auras, self.mana)
+        return reduce(lambda a, b: b.update(self, a), buffs, mana)
+
     def use(self, player, game):
         """
         Use the card.
@@ -146,6 +181,14 @@ class Card(Bindable, GameObject):
     def is_card():
         return True
 
+    @property
+    def card_id(self):
+        """
+        The integer id of this card in the :mod:`card catalog <hearthbreaker.cards.catalog>`.  A card which isn't in the
+        catalog is registered with it the first time its id is needed.
+        """
+        return hearthbreaker.cards.catalog.register(self.ref_name)
+
     def __to_json__(self):
         r_val = super().__to_json__()
         r_val['name'] = self.name
@@ -263,6 +306,7 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
             player.minions.remove(self._placeholder)
             for m in player.minions[minion.index:]:
                 m.index -= 1
+            game.board_changed()
         else:
             minion.index = player.agent.choose_index(self, player)
         minion.add_to_board(minion.index)
@@ -431,25 +475,15 @@ class SpellCard(Card, metaclass=abc.ABCMeta):
         :rtype: bool
         """
 
-        if self.targetable:
-            self.targets = self.get_targets(game, self.filter_func)
-            if self.targets is not None and len(self.targets) is 0:
-                return False
+        if self.targetable and not hearthbreaker.targeting.has_target(game, self.get_targets, self.filter_func):
+            return False
 
         return super().can_use(player, game)
 
-    def mana_cost(self):
-        """
-        Calculates the mana cost for this card.
-
-        This cost is the base cost for the card, modified by any tags from the card itself, or
-        from other cards (such as :class:`hearthbreaker.cards.minions.neutral.VentureCoMercenary`)
-
-        :return: representing the actual mana cost of this card.
-        :rtype: int
-        """
-        from hearthbreaker.tags.status import ManaChange
-        return self.calculate_stat(ManaChange, self.mana)
+    def _apply_mana_changes(self, auras, buffs):
+        # Spells calculate their cost in the same order as other stats (buffs first, then auras)
+        mana = reduce(lambda a, b: b.update(self, a), buffs, self.mana)
+        return max(0, reduce(lambda a, b: b.update(self, a), auras, mana))
 
     def use(self, player, game):
         """
@@ -492,6 +526,16 @@ class SecretCard(Card, metaclass=abc.ABCMeta):
         super().use(player, game)
         player.secrets.append(self)
         self.player = player
+        self.activate(player)
+
+    def secret_triggered(self, *args):
+        """
+        Called for each event this secret is bound to.  Secrets stay bound from the time they are put into play until
+        they are revealed or removed, so this only passes the event on to :meth:`_reveal` while the secret's owner is
+        :attr:`Game.secret_player <hearthbreaker.engine.Game.secret_player>`, which is during the opponent's turn.
+        """
+        if self.player.game.secret_player is self.player:
+            self._reveal(*args)
 
     def reveal(self):
         self.player.trigger("secret_revealed", self)
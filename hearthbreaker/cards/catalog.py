@@ -0,0 +1,1670 @@
+__doc__ = """
+A stable catalog of integer ids for every card.
+
+Cards are normally referred to by their reference name (see :attr:`Card.ref_name <hearthbreaker.cards.base.Card>`).
+The catalog gives each reference name a small integer id, which is cheaper to compare and store than the name, and
+can be used to index into arrays.  It also records the official Hearthstone id (such as ``EX1_097``) used for each
+card in ``AllSets.enUS.json``.
+
+The ids are the positions of the cards in the ``_CARDS`` list in this module.  Ids must never change once assigned,
+so new cards must be added to the end of the list, and cards must never be removed or reordered.  Cards which are not
+in the list (such as cards defined by a plugin) are given ids after the end of the list when they are registered with
+:func:`register`, so their ids are only stable within a single process, and are written out by name instead (see
+:func:`portable_id`).  Looking up a card which hasn't been registered never adds it to the catalog.
+"""
+
+#: Official ids from ``AllSets.enUS.json``, mapped to the reference name used for that card.  Not every card listed
+#: here has been implemented yet.
+OFFICIAL_IDS = {
+    "EX1_097": "Abomination",
+    "CS2_188": "Abusive Sergeant",
+    "EX1_007": "Acolyte of Pain",
+    "NEW1_010": "Al'Akir the Windlord",
+    "EX1_006": "Alarm-o-Bot",
+    "EX1_382": "Aldor Peacekeeper",
+    "EX1_561": "Alexstrasza",
+    "EX1_393": "Amani Berserker",
+    "CS2_038": "Ancestral Spirit",
+    "EX1_057": "Ancient Brewmaster",
+    "EX1_584": "Ancient Mage",
+    "NEW1_008b": "Ancient Secrets",
+    "NEW1_008a": "Ancient Teachings",
+    "EX1_045": "Ancient Watcher",
+    "NEW1_008": "Ancient of Lore",
+    "EX1_178": "Ancient of War",
+    "EX1_009": "Angry Chicken",
+    "EX1_398": "Arathi Weaponsmith",
+    "EX1_089": "Arcane Golem",
+    "EX1_559": "Archmage Antonidas",
+    "EX1_067": "Argent Commander",
+    "EX1_362": "Argent Protector",
+    "EX1_008": "Argent Squire",
+    "EX1_402": "Armorsmith",
+    "EX1_383t": "Ashbringer",
+    "EX1_591": "Auchenai Soulpriest",
+    "EX1_384": "Avenging Wrath",
+    "EX1_284": "Azure Drake",
+    "EX1_110t": "Baine Bloodhoof",
+    "EX1_014t": "Bananas",
+    "EX1_320": "Bane of Doom",
+    "EX1_249": "Baron Geddon",
+    "EX1_398t": "Battle Axe",
+    "EX1_392": "Battle Rage",
+    "EX1_165b": "Bear Form",
+    "EX1_549": "Bestial Wrath",
+    "EX1_126": "Betrayal",
+    "EX1_005": "Big Game Hunter",
+    "EX1_570": "Bite",
+    "CS2_233": "Blade Flurry",
+    "EX1_355": "Blessed Champion",
+    "EX1_363": "Blessing of Wisdom",
+    "CS2_028": "Blizzard",
+    "EX1_323w": "Blood Fury",
+    "CS2_059": "Blood Imp",
+    "EX1_590": "Blood Knight",
+    "EX1_012": "Bloodmage Thalnos",
+    "NEW1_025": "Bloodsail Corsair",
+    "NEW1_018": "Bloodsail Raider",
+    "EX1_407": "Brawl",
+    "EX1_091": "Cabal Shadow Priest",
+    "EX1_110": "Cairne Bloodhoof",
+    "NEW1_024": "Captain Greenskin",
+    "EX1_165a": "Cat Form",
+    "EX1_573": "Cenarius",
+    "EX1_621": "Circle of Healing",
+    "CS2_073": "Cold Blood",
+    "EX1_050": "Coldlight Oracle",
+    "EX1_103": "Coldlight Seer",
+    "NEW1_036": "Commanding Shout",
+    "EX1_128": "Conceal",
+    "EX1_275": "Cone of Cold",
+    "EX1_287": "Counterspell",
+    "EX1_059": "Crazed Alchemist",
+    "EX1_603": "Cruel Taskmaster",
+    "EX1_595": "Cult Master",
+    "skele21": "Damaged Golem",
+    "EX1_046": "Dark Iron Dwarf",
+    "EX1_617": "Deadly Shot",
+    "NEW1_030": "Deathwing",
+    "EX1_130a": "Defender",
+    "EX1_093": "Defender of Argus",
+    "EX1_131t": "Defias Bandit",
+    "EX1_131": "Defias Ringleader",
+    "EX1_573a": "Demigod's Favor",
+    "EX1_102": "Demolisher",
+    "EX1_596": "Demonfire",
+    "EX1_tk29": "Devilsaur",
+    "EX1_162": "Dire Wolf Alpha",
+    "EX1_166b": "Dispel",
+    "EX1_349": "Divine Favor",
+    "EX1_310": "Doomguard",
+    "EX1_567": "Doomhammer",
+    "NEW1_021": "Doomsayer",
+    "NEW1_022": "Dread Corsair",
+    "DREAM_04": "Dream",
+    "EX1_165t2": "Druid of the Claw (bear)",
+    "EX1_165": "Druid of the Claw",
+    "EX1_165t1": "Druid of the Claw (cat)",
+    "EX1_243": "Dust Devil",
+    "EX1_536": "Eaglehorn Bow",
+    "EX1_250": "Earth Elemental",
+    "EX1_245": "Earth Shock",
+    "CS2_117": "Earthen Ring Farseer",
+    "EX1_613": "Edwin VanCleef",
+    "DREAM_03": "Emerald Drake",
+    "EX1_170": "Emperor Cobra",
+    "EX1_619": "Equality",
+    "EX1_274": "Ethereal Arcanist",
+    "EX1_124": "Eviscerate",
+    "EX1_537": "Explosive Shot",
+    "EX1_610": "Explosive Trap",
+    "EX1_132": "Eye for an Eye",
+    "EX1_564": "Faceless Manipulator",
+    "NEW1_023": "Faerie Dragon",
+    "CS2_053": "Far Sight",
+    "EX1_301": "Felguard",
+    "CS1_069": "Fen Creeper",
+    "EX1_248": "Feral Spirit",
+    "EX1_finkle": "Finkle Einhorn",
+    "EX1_319": "Flame Imp",
+    "EX1_614t": "Flame of Azzinoth",
+    "EX1_544": "Flare",
+    "tt_004": "Flesheating Ghoul",
+    "EX1_571": "Force of Nature",
+    "EX1_251": "Forked Lightning",
+    "EX1_611": "Freezing Trap",
+    "EX1_283": "Frost Elemental",
+    "EX1_604": "Frothing Berserker",
+    "EX1_095": "Gadgetzan Auctioneer",
+    "DS1_188": "Gladiator's Longbow",
+    "NEW1_040t": "Gnoll",
+    "EX1_411": "Gorehowl",
+    "EX1_414": "Grommash Hellscream",
+    "NEW1_038": "Gruul",
+    "EX1_558": "Harrison Jones",
+    "EX1_556": "Harvest Golem",
+    "EX1_137": "Headcrack",
+    "EX1_409t": "Heavy Axe",
+    "NEW1_040": "Hogger",
+    "EX1_624": "Holy Fire",
+    "EX1_365": "Holy Wrath",
+    "EX1_538t": "Hound",
+    "NEW1_017": "Hungry Crab",
+    "EX1_534t": "Hyena",
+    "EX1_289": "Ice Barrier",
+    "EX1_295": "Ice Block",
+    "CS2_031": "Ice Lance",
+    "EX1_614": "Illidan Stormrage",
+    "EX1_598": "Imp",
+    "EX1_597": "Imp Master",
+    "EX1_tk34": "Infernal",
+    "CS2_181": "Injured Blademaster",
+    "CS1_129": "Inner Fire",
+    "EX1_607": "Inner Rage",
+    "CS2_203": "Ironbeak Owl",
+    "EX1_017": "Jungle Panther",
+    "EX1_166": "Keeper of the Grove",
+    "NEW1_005": "Kidnapper",
+    "EX1_543": "King Krush",
+    "EX1_014": "King Mukla",
+    "EX1_612": "Kirin Tor Mage",
+    "NEW1_019": "Knife Juggler",
+    "DREAM_01": "Laughing Sister",
+    "EX1_241": "Lava Burst",
+    "EX1_354": "Lay on Hands",
+    "EX1_160b": "Leader of the Pack",
+    "EX1_116": "Leeroy Jenkins",
+    "EX1_029": "Leper Gnome",
+    "EX1_238": "Lightning Bolt",
+    "EX1_259": "Lightning Storm",
+    "EX1_335": "Lightspawn",
+    "EX1_001": "Lightwarden",
+    "EX1_341": "Lightwell",
+    "EX1_096": "Loot Hoarder",
+    "EX1_323": "Lord Jaraxxus",
+    "EX1_100": "Lorewalker Cho",
+    "EX1_082": "Mad Bomber",
+    "EX1_563": "Malygos",
+    "EX1_055": "Mana Addict",
+    "EX1_575": "Mana Tide Totem",
+    "EX1_616": "Mana Wraith",
+    "NEW1_012": "Mana Wyrm",
+    "EX1_155": "Mark of Nature",
+    "EX1_155b": "Mark of Nature",
+    "EX1_155a": "Mark of Nature",
+    "EX1_626": "Mass Dispel",
+    "NEW1_037": "Master Swordsmith",
+    "NEW1_014": "Master of Disguise",
+    "NEW1_029": "Millhouse Manastorm",
+    "EX1_085": "Mind Control Tech",
+    "EX1_345": "Mindgames",
+    "EX1_294": "Mirror Entity",
+    "EX1_533": "Misdirection",
+    "EX1_396": "Mogu'shan Warden",
+    "EX1_620": "Molten Giant",
+    "EX1_166a": "Moonfire",
+    "EX1_408": "Mortal Strike",
+    "EX1_105": "Mountain Giant",
+    "EX1_509": "Murloc Tidecaller",
+    "EX1_507": "Murloc Warleader",
+    "EX1_557": "Nat Pagle",
+    "EX1_161": "Naturalize",
+    "DREAM_05": "Nightmare",
+    "EX1_130": "Noble Sacrifice",
+    "EX1_164b": "Nourish",
+    "EX1_164a": "Nourish",
+    "EX1_164": "Nourish",
+    "EX1_560": "Nozdormu",
+    "EX1_562": "Onyxia",
+    "EX1_160t": "Panther",
+    "EX1_522": "Patient Assassin",
+    "EX1_133": "Perdition's Blade",
+    "EX1_076": "Pint-Sized Summoner",
+    "EX1_313": "Pit Lord",
+    "EX1_316": "Power Overwhelming",
+    "EX1_160": "Power of the Wild",
+    "EX1_145": "Preparation",
+    "EX1_583": "Priestess of Elune",
+    "EX1_350": "Prophet Velen",
+    "EX1_279": "Pyroblast",
+    "EX1_044": "Questing Adventurer",
+    "EX1_412": "Raging Worgen",
+    "EX1_298": "Ragnaros the Firelord",
+    "CS2_104": "Rampage",
+    "CS2_161": "Ravenholdt Assassin",
+    "EX1_136": "Redemption",
+    "EX1_379": "Repentance",
+    "EX1_178a": "Rooted",
+    "EX1_134": "SI:7 Agent",
+    "EX1_578": "Savagery",
+    "EX1_534": "Savannah Highmane",
+    "EX1_020": "Scarlet Crusader",
+    "EX1_531": "Scavenging Hyena",
+    "EX1_586": "Sea Giant",
+    "EX1_080": "Secretkeeper",
+    "EX1_317": "Sense Demons",
+    "EX1_334": "Shadow Madness",
+    "EX1_345t": "Shadow of Nothing",
+    "EX1_303": "Shadowflame",
+    "EX1_625": "Shadowform",
+    "EX1_144": "Shadowstep",
+    "EX1_573b": "Shan'do's Lesson",
+    "EX1_410": "Shield Slam",
+    "EX1_405": "Shieldbearer",
+    "EX1_332": "Silence",
+    "CS2_151": "Silver Hand Knight",
+    "EX1_023": "Silvermoon Guardian",
+    "EX1_309": "Siphon Soul",
+    "EX1_391": "Slam",
+    "EX1_554t": "Snake",
+    "EX1_554": "Snake Trap",
+    "EX1_609": "Snipe",
+    "EX1_608": "Sorcerer's Apprentice",
+    "EX1_158": "Soul of the Forest",
+    "NEW1_027": "Southsea Captain",
+    "CS2_146": "Southsea Deckhand",
+    "tt_010a": "Spellbender (minion)",
+    "tt_010": "Spellbender",
+    "EX1_048": "Spellbreaker",
+    "EX1_tk11": "Spirit Wolf",
+    "CS2_221": "Spiteful Smith",
+    "CS2_152": "Squire",
+    "EX1_tk28": "Squirrel",
+    "NEW1_041": "Stampeding Kodo",
+    "NEW1_007a": "Starfall",
+    "NEW1_007b": "Starfall",
+    "NEW1_007": "Starfall",
+    "EX1_247": "Stormforged Axe",
+    "EX1_028": "Stranglethorn Tiger",
+    "EX1_160a": "Summon a Panther",
+    "EX1_315": "Summoning Portal",
+    "EX1_058": "Sunfury Protector",
+    "EX1_032": "Sunwalker",
+    "EX1_366": "Sword of Justice",
+    "EX1_016": "Sylvanas Windrunner",
+    "EX1_390": "Tauren Warrior",
+    "EX1_623": "Temple Enforcer",
+    "EX1_577": "The Beast",
+    "EX1_002": "The Black Knight",
+    "EX1_339": "Thoughtsteal",
+    "EX1_021": "Thrallmar Farseer",
+    "EX1_083": "Tinkmaster Overspark",
+    "EX1_383": "Tirion Fordring",
+    "EX1_tk9": "Treant (charge)",
+    "EX1_573t": "Treant (taunt)",
+    "EX1_158t": "Treant",
+    "EX1_043": "Twilight Drake",
+    "EX1_312": "Twisting Nether",
+    "EX1_258": "Unbound Elemental",
+    "EX1_538": "Unleash the Hounds",
+    "EX1_409": "Upgrade!",
+    "EX1_178b": "Uproot",
+    "EX1_594": "Vaporize",
+    "CS2_227": "Venture Co. Mercenary",
+    "NEW1_026t": "Violet Apprentice",
+    "NEW1_026": "Violet Teacher",
+    "EX1_304": "Void Terror",
+    "ds1_whelptoken": "Whelp",
+    "EX1_116t": "Whelp",
+    "NEW1_020": "Wild Pyromancer",
+    "EX1_033": "Windfury Harpy",
+    "CS2_231": "Wisp",
+    "EX1_010": "Worgen Infiltrator",
+    "EX1_317t": "Worthless Imp",
+    "EX1_154b": "Wrath",
+    "EX1_154a": "Wrath",
+    "EX1_154": "Wrath",
+    "CS2_169": "Young Dragonhawk",
+    "EX1_004": "Young Priestess",
+    "EX1_049": "Youthful Brewmaster",
+    "EX1_572": "Ysera",
+    "DREAM_02": "Ysera Awakens",
+    "EX1_066": "Acidic Swamp Ooze",
+    "CS2_041": "Ancestral Healing",
+    "NEW1_031": "Animal Companion",
+    "CS2_025": "Arcane Explosion",
+    "CS2_023": "Arcane Intellect",
+    "EX1_277": "Arcane Missiles",
+    "DS1_185": "Arcane Shot",
+    "CS2_112": "Arcanite Reaper",
+    "CS2_155": "Archmage",
+    "CS2_080": "Assassin's Blade",
+    "CS2_076": "Assassinate",
+    "GAME_002": "Avatar of the Coin",
+    "CS2_072": "Backstab",
+    "CS2_092": "Blessing of Kings",
+    "CS2_087": "Blessing of Might",
+    "CS2_172": "Bloodfen Raptor",
+    "CS2_046": "Bloodlust",
+    "CS2_173": "Bluegill Warrior",
+    "CS2_boar": "Boar",
+    "CS2_187": "Booty Bay Bodyguard",
+    "CS2_200": "Boulderfist Ogre",
+    "CS2_103": "Charge",
+    "CS2_182": "Chillwind Yeti",
+    "CS2_005": "Claw",
+    "CS2_114": "Cleave",
+    "CS2_093": "Consecration",
+    "CS2_201": "Core Hound",
+    "CS2_063": "Corruption",
+    "EX1_582": "Dalaran Mage",
+    "DS1_055": "Darkscale Healer",
+    "CS2_074": "Deadly Poison",
+    "CS2_236": "Divine Spirit",
+    "EX1_025": "Dragonling Mechanic",
+    "CS2_061": "Drain Life",
+    "CS2_064": "Dread Infernal",
+    "CS2_189": "Elven Archer",
+    "CS2_013t": "Excess Mana",
+    "CS2_108": "Execute",
+    "EX1_129": "Fan of Knives",
+    "CS2_106": "Fiery War Axe",
+    "CS2_042": "Fire Elemental",
+    "CS2_029": "Fireball",
+    "CS2_032": "Flamestrike",
+    "EX1_565": "Flametongue Totem",
+    "hexfrog": "Frog",
+    "CS2_026": "Frost Nova",
+    "CS2_037": "Frost Shock",
+    "CS2_024": "Frostbolt",
+    "CS2_121": "Frostwolf Grunt",
+    "CS2_226": "Frostwolf Warlord",
+    "CS2_147": "Gnomish Inventor",
+    "CS1_042": "Goldshire Footman",
+    "EX1_508": "Grimscale Oracle",
+    "CS2_088": "Guardian of Kings",
+    "EX1_399": "Gurubashi Berserker",
+    "CS2_094": "Hammer of Wrath",
+    "EX1_371": "Hand of Protection",
+    "NEW1_009": "Healing Totem",
+    "CS2_007": "Healing Touch",
+    "CS2_062": "Hellfire",
+    "CS2_105": "Heroic Strike",
+    "EX1_246": "Hex",
+    "CS2_089": "Holy Light",
+    "CS1_112": "Holy Nova",
+    "CS1_130": "Holy Smite",
+    "DS1_070": "Houndmaster",
+    "NEW1_034": "Huffer",
+    "EX1_360": "Humility",
+    "CS2_084": "Hunter's Mark",
+    "EX1_169": "Innervate",
+    "CS2_232": "Ironbark Protector",
+    "CS2_141": "Ironforge Rifleman",
+    "CS2_125": "Ironfur Grizzly",
+    "EX1_539": "Kill Command",
+    "CS2_142": "Kobold Geomancer",
+    "NEW1_011": "Kor'kron Elite",
+    "NEW1_033": "Leokk",
+    "CS2_091": "Light's Justice",
+    "CS2_162": "Lord of the Arena",
+    "CS2_118": "Magma Rager",
+    "CS2_009": "Mark of the Wild",
+    "EX1_025t": "Mechanical Dragonling",
+    "DS1_233": "Mind Blast",
+    "CS1_113": "Mind Control",
+    "CS2_003": "Mind Vision",
+    "CS2_mirror": "Mirror Image (minion)",
+    "CS2_027": "Mirror Image",
+    "NEW1_032": "Misha",
+    "CS2_008": "Moonfire",
+    "EX1_302": "Mortal Coil",
+    "DS1_183": "Multi-Shot",
+    "CS2_168": "Murloc Raider",
+    "EX1_506a": "Murloc Scout",
+    "EX1_506": "Murloc Tidehunter",
+    "GAME_006": "NOOOOOOOOOOOO",
+    "EX1_593": "Nightblade",
+    "CS2_235": "Northshire Cleric",
+    "EX1_015": "Novice Engineer",
+    "CS2_119": "Oasis Snapjaw",
+    "CS2_197": "Ogre Magi",
+    "CS2_022": "Polymorph",
+    "CS2_004": "Power Word: Shield",
+    "CS2_122": "Raid Leader",
+    "CS2_196": "Razorfen Hunter",
+    "CS2_213": "Reckless Rocketeer",
+    "CS2_120": "River Crocolisk",
+    "CS2_045": "Rockbiter Weapon",
+    "NEW1_003": "Sacrificial Pact",
+    "EX1_581": "Sap",
+    "CS2_011": "Savage Roar",
+    "CS2_050": "Searing Totem",
+    "CS2_179": "Sen'jin Shieldmasta",
+    "CS2_057": "Shadow Bolt",
+    "EX1_622": "Shadow Word: Death",
+    "CS2_234": "Shadow Word: Pain",
+    "EX1_019": "Shattered Sun Cleric",
+    "CS2_tk1": "Sheep",
+    "EX1_606": "Shield Block",
+    "EX1_278": "Shiv",
+    "CS2_101t": "Silver Hand Recruit",
+    "CS2_127": "Silverback Patriarch",
+    "CS2_075": "Sinister Strike",
+    "skele11": "Skeleton",
+    "EX1_308": "Soulfire",
+    "CS2_077": "Sprint",
+    "EX1_173": "Starfire",
+    "CS2_237": "Starving Buzzard",
+    "CS2_051": "Stoneclaw Totem",
+    "CS2_171": "Stonetusk Boar",
+    "CS2_150": "Stormpike Commando",
+    "CS2_222": "Stormwind Champion",
+    "CS2_131": "Stormwind Knight",
+    "EX1_306": "Succubus",
+    "CS2_012": "Swipe",
+    "GAME_005": "The Coin",
+    "DS1_175": "Timber Wolf",
+    "EX1_244": "Totemic Might",
+    "DS1_184": "Tracking",
+    "CS2_097": "Truesilver Champion",
+    "DS1_178": "Tundra Rhino",
+    "NEW1_004": "Vanish",
+    "CS2_065": "Voidwalker",
+    "EX1_011": "Voodoo Doctor",
+    "CS2_186": "War Golem",
+    "EX1_084": "Warsong Commander",
+    "CS2_033": "Water Elemental",
+    "EX1_400": "Whirlwind",
+    "CS2_082": "Wicked Knife",
+    "CS2_013": "Wild Growth",
+    "CS2_039": "Windfury",
+    "EX1_587": "Windspeaker",
+    "CS2_124": "Wolfrider",
+    "CS2_052": "Wrath of Air Totem",
+    "FP1_026": "Anub'ar Ambusher",
+    "FP1_020": "Avenge",
+    "FP1_031": "Baron Rivendare",
+    "FP1_029": "Dancing Swords",
+    "FP1_023": "Dark Cultist",
+    "FP1_021": "Death's Bite",
+    "NAX6_03": "Deathbloom",
+    "FP1_006": "Deathcharger",
+    "FP1_009": "Deathlord",
+    "FP1_018": "Duplicate",
+    "FP1_003": "Echoing Ooze",
+    "NAX12_04": "Enrage",
+    "NAX11_03": "Fallout Slime",
+    "NAX13_04H": "Feugen",
+    "FP1_015": "Feugen",
+    "NAX14_03": "Frozen Champion",
+    "NAX15_03t": "Guardian of Icecrown",
+    "NAX15_03n": "Guardian of Icecrown",
+    "FP1_002": "Haunted Creeper",
+    "NAX10_02": "Hook",
+    "NAX10_02H": "Hook",
+    "NAX12_03": "Jaws",
+    "NAX12_03H": "Jaws",
+    "FP1_013": "Kel'Thuzad",
+    "NAX9_02H": "Lady Blaumeux",
+    "NAX9_02": "Lady Blaumeux",
+    "FP1_030": "Loatheb",
+    "NAX1_05": "Locust Swarm",
+    "FP1_004": "Mad Scientist",
+    "FP1_010": "Maexxna",
+    "NAX9_07": "Mark of the Horsemen",
+    "NAX7_04H": "Massive Runeblade",
+    "NAX7_04": "Massive Runeblade",
+    "NAX7_05": "Mind Control Crystal",
+    "NAX5_03": "Mindpocalypse",
+    "NAX15_05": "Mr. Bigglesworth",
+    "NAX11_04": "Mutating Injection",
+    "NAXM_001": "Necroknight",
+    "NAX3_03": "Necrotic Poison",
+    "FP1_017": "Nerub'ar Weblord",
+    "NAX1h_03": "Nerubian (normal)",
+    "NAX1_03": "Nerubian  (heroic)",
+    "FP1_007t": "Nerubian",
+    "FP1_007": "Nerubian Egg",
+    "NAX4_05": "Plague",
+    "FP1_019": "Poison Seeds",
+    "NAX14_04": "Pure Cold",
+    "FP1_025": "Reincarnate",
+    "NAX9_05H": "Runeblade",
+    "NAX9_05": "Runeblade",
+    "FP1_005": "Shade of Naxxramas",
+    "NAX9_04": "Sir Zeliek",
+    "NAX9_04H": "Sir Zeliek",
+    "NAXM_002": "Skeletal Smith",
+    "NAX4_03H": "Skeleton",
+    "NAX4_03": "Skeleton",
+    "FP1_012t": "Slime",
+    "FP1_012": "Sludge Belcher",
+    "FP1_008": "Spectral Knight",
+    "NAX8_05t": "Spectral Rider",
+    "FP1_002t": "Spectral Spider",
+    "NAX8_03t": "Spectral Trainee",
+    "NAX8_04t": "Spectral Warrior",
+    "NAX6_03t": "Spore",
+    "NAX6_04": "Sporeburst",
+    "NAX13_05H": "Stalagg",
+    "FP1_014": "Stalagg",
+    "FP1_027": "Stoneskin Gargoyle",
+    "NAX13_03": "Supercharge",
+    "FP1_014t": "Thaddius",
+    "NAX9_03H": "Thane Korth'azz",
+    "NAX9_03": "Thane Korth'azz",
+    "FP1_019t": "Treant (poison seeds)",
+    "NAX7_02": "Understudy",
+    "FP1_028": "Undertaker",
+    "NAX8_05": "Unrelenting Rider",
+    "NAX8_03": "Unrelenting Trainee",
+    "NAX8_04": "Unrelenting Warrior",
+    "FP1_024": "Unstable Ghoul",
+    "FP1_022": "Voidcaller",
+    "FP1_016": "Wailing Soul",
+    "FP1_011": "Webspinner",
+    "NAX2_05": "Worshipper",
+    "NAX2_05H": "Worshipper",
+    "FP1_001": "Zombie Chow",
+    "GVG_029": "Ancestor's Call",
+    "GVG_077": "Anima Golem",
+    "GVG_085": "Annoy-o-Tron",
+    "GVG_030": "Anodized Robo Cub",
+    "GVG_069": "Antique Healbot",
+    "GVG_091": "Arcane Nullifier X-21",
+    "PART_001": "Armor Plating",
+    "GVG_030a": "Attack Mode",
+    "GVG_119": "Blingtron 3000",
+    "GVG_063": "Bolvar Fordragon",
+    "GVG_099": "Bomb Lobber",
+    "GVG_110t": "Boom Bot",
+    "GVG_050": "Bouncing Blade",
+    "GVG_068": "Burly Rockjaw Trogg",
+    "GVG_056t": "Burrowing Mine",
+    "GVG_017": "Call Pet",
+    "GVG_092t": "Chicken (Gnomish Experimenter)",
+    "GVG_121": "Clockwork Giant",
+    "GVG_082": "Clockwork Gnome",
+    "GVG_062": "Cobalt Guardian",
+    "GVG_073": "Cobra Shot",
+    "GVG_059": "Coghammer",
+    "GVG_013": "Cogmaster",
+    "GVG_024": "Cogmaster's Wrench",
+    "GVG_038": "Crackle",
+    "GVG_052": "Crush",
+    "GVG_041": "Dark Wispers",
+    "GVG_041b": "Dark Wispers",
+    "GVG_041a": "Dark Wispers",
+    "GVG_015": "Darkbomb",
+    "GVG_019": "Demonheart",
+    "GVG_110": "Dr. Boom",
+    "GVG_080t": "Druid of the Fang (cobra)",
+    "GVG_080": "Druid of the Fang",
+    "GVG_066": "Dunemaul Shaman",
+    "GVG_005": "Echo of Medivh",
+    "PART_005": "Emergency Coolant",
+    "GVG_107": "Enhance-o Mechano",
+    "GVG_076": "Explosive Sheep",
+    "GVG_026": "Feign Death",
+    "GVG_020": "Fel Cannon",
+    "GVG_016": "Fel Reaver",
+    "PART_004": "Finicky Cloakfield",
+    "GVG_007": "Flame Leviathan",
+    "GVG_001": "Flamecannon",
+    "GVG_100": "Floating Watcher",
+    "GVG_084": "Flying Machine",
+    "GVG_113": "Foe Reaper 4000",
+    "GVG_079": "Force-Tank MAX",
+    "GVG_049": "Gahz'rilla",
+    "GVG_028t": "Gallywix's Coin",
+    "GVG_117": "Gazlowe",
+    "GVG_032b": "Gift of Cards",
+    "GVG_032a": "Gift of Mana",
+    "GVG_081": "Gilblin Stalker",
+    "GVG_043": "Glaivezooka",
+    "GVG_098": "Gnomeregan Infantry",
+    "GVG_092": "Gnomish Experimenter",
+    "GVG_023": "Goblin Auto-Barber",
+    "GVG_004": "Goblin Blastmage",
+    "GVG_095": "Goblin Sapper",
+    "GVG_032": "Grove Tender",
+    "GVG_120": "Hemet Nesingwary",
+    "GVG_104": "Hobgoblin",
+    "GVG_089": "Illuminator",
+    "GVG_045t": "Imp (warlock)",
+    "GVG_045": "Imp-losion",
+    "GVG_056": "Iron Juggernaut",
+    "GVG_027": "Iron Sensei",
+    "GVG_094": "Jeeves",
+    "GVG_106": "Junkbot",
+    "GVG_074": "Kezan Mystic",
+    "GVG_046": "King of Beasts",
+    "GVG_012": "Light of the Naaru",
+    "GVG_008": "Lightbomb",
+    "GVG_097": "Lil' Exorcist",
+    "GVG_071": "Lost Tallstrider",
+    "GVG_090": "Madder Bomber",
+    "GVG_021": "Mal'Ganis",
+    "GVG_035": "Malorne",
+    "GVG_034": "Mech-Bear-Cat",
+    "GVG_078": "Mechanical Yeti",
+    "GVG_006": "Mechwarper",
+    "GVG_116": "Mekgineer Thermaplugg",
+    "GVG_048": "Metaltooth Leaper",
+    "GVG_103": "Micro Machine",
+    "GVG_111": "Mimiron's Head",
+    "GVG_109": "Mini-Mage",
+    "GVG_018": "Mistress of Pain",
+    "GVG_112": "Mogor the Ogre",
+    "GVG_061": "Muster for Battle",
+    "GVG_042": "Neptulon",
+    "GVG_065": "Ogre Brute",
+    "GVG_088": "Ogre Ninja",
+    "GVG_054": "Ogre Warmaul",
+    "GVG_025": "One-eyed Cheat",
+    "GVG_096": "Piloted Shredder",
+    "GVG_105": "Piloted Sky Golem",
+    "GVG_036": "Powermace",
+    "GVG_064": "Puddlestomper",
+    "GVG_060": "Quartermaster",
+    "GVG_108": "Recombobulator",
+    "GVG_031": "Recycle",
+    "PART_006": "Reversing Switch",
+    "PART_003": "Rusty Horn",
+    "GVG_047": "Sabotage",
+    "GVG_070": "Salty Dog",
+    "GVG_101": "Scarlet Purifier",
+    "GVG_055": "Screwjank Clunker",
+    "GVG_057": "Seal of Light",
+    "GVG_009": "Shadowbomber",
+    "GVG_072": "Shadowboxer",
+    "GVG_058": "Shielded Minibot",
+    "GVG_053": "Shieldmaiden",
+    "GVG_075": "Ship's Cannon",
+    "GVG_011": "Shrinkmeister",
+    "GVG_086": "Siege Engine",
+    "GVG_040": "Siltfin Spiritwalker",
+    "GVG_114": "Sneed's Old Shredder",
+    "GVG_002": "Snowchugger",
+    "GVG_123": "Soot Spewer",
+    "GVG_044": "Spider Tank",
+    "GVG_087": "Steamwheedle Sniper",
+    "GVG_067": "Stonesplinter Trogg",
+    "GVG_030b": "Tank Mode",
+    "GVG_093": "Target Dummy",
+    "PART_002": "Time Rewinder",
+    "GVG_022": "Tinker's Sharpsword Oil",
+    "GVG_102": "Tinkertown Technician",
+    "GVG_115": "Toshley",
+    "GVG_028": "Trade Prince Gallywix",
+    "GVG_033": "Tree of Life",
+    "GVG_118": "Troggzor the Earthinator",
+    "GVG_003": "Unstable Portal",
+    "GVG_083": "Upgraded Repair Bot",
+    "GVG_111t": "V-07-TR-0N",
+    "GVG_010": "Velen's Chosen",
+    "GVG_039": "Vitality Totem",
+    "GVG_014": "Vol'jin",
+    "GVG_051": "Warbot",
+    "GVG_122": "Wee Spellstopper",
+    "PART_007": "Whirling Blades",
+    "GVG_037": "Whirling Zap-o-matic",
+    "NEW1_016": "Captain's Parrot",
+    "EX1_062": "Old Murk-Eye",
+    "Mekka4t": "Chicken",
+    "PRO_001": "Elite Tauren Chieftain",
+    "Mekka3": "Emboldener 3000",
+    "EX1_112": "Gelbin Mekkatorque",
+    "Mekka1": "Homing Chicken",
+    "PRO_001a": "I Am Murloc",
+    "PRO_001at": "Murloc",
+    "Mekka4": "Poultryizer",
+    "PRO_001c": "Power of the Horde",
+    "Mekka2": "Repair Bot",
+    "PRO_001b": "Rogues Do It...",
+    "BRM_016": "Axe Flinger",
+    "BRM_034": "Blackwing Corruptor",
+    "BRM_033": "Blackwing Technician",
+    "BRM_031": "Chromaggus",
+    "BRM_014": "Core Rager",
+    "BRM_008": "Dark Iron Skulker",
+    "BRM_005": "Demonwrath",
+    "BRM_018": "Dragon Consort",
+    "BRM_022": "Dragon Egg",
+    "BRM_003": "Dragon's Breath",
+    "BRM_020": "Dragonkin Sorcerer",
+    "BRM_024": "Drakonid Crusher",
+    "BRM_010": "Druid of the Flame",
+    "BRM_028": "Emperor Thaurissan",
+    "BRM_012": "Fireguard Destroyer",
+    "BRM_002": "Flamewaker",
+    "BRM_007": "Gang Up",
+    "BRM_019": "Grim Patron",
+    "BRM_026": "Hungry Dragon",
+    "BRM_006": "Imp Gang Boss",
+    "BRM_011": "Lava Shock",
+    "BRM_027": "Majordomo Executus",
+    "BRM_030": "Nefarian",
+    "BRM_013": "Quick Shot",
+    "BRM_029": "Rend Blackhand",
+    "BRM_017": "Resurrect",
+    "BRM_015": "Revenge",
+    "BRM_001": "Solemn Vigil",
+    "BRM_004": "Twilight Whelp",
+    "BRM_025": "Volcanic Drake",
+    "BRM_009": "Volcanic Lumberer",
+    "AT_063": "Acidmaw",
+    "AT_071": "Alexstrasza's Champion",
+    "AT_053": "Ancestral Knowledge",
+    "AT_036": "Anub'arak",
+    "AT_004": "Arcane Blast",
+    "AT_087": "Argent Horserider",
+    "AT_077": "Argent Lance",
+    "AT_109": "Argent Watchman",
+    "AT_108": "Armored Warhorse",
+    "AT_043": "Astral Communion",
+    "AT_045": "Aviana",
+    "AT_062": "Ball of Spiders",
+    "AT_064": "Bash",
+    "AT_060": "Bear Trap",
+    "AT_035": "Beneath the Grounds",
+    "AT_124": "Bolf Ramshield",
+    "AT_068": "Bolster",
+    "AT_089": "Boneguard Lieutenant",
+    "AT_059": "Brave Archer",
+    "AT_029": "Buccaneer",
+    "AT_033": "Burgle",
+    "AT_102": "Captured Jormungar",
+    "AT_050": "Charged Hammer",
+    "AT_123": "Chillmaw",
+    "AT_096": "Clockwork Knight",
+    "AT_008": "Coldarra Drake",
+    "AT_110": "Coliseum Manager",
+    "AT_073": "Competitive Spirit",
+    "AT_018": "Confessor Paletress",
+    "AT_016": "Confuse",
+    "AT_015": "Convert",
+    "AT_121": "Crowd Favorite",
+    "AT_031": "Cutpurse",
+    "AT_006": "Dalaran Aspirant",
+    "AT_025": "Dark Bargain",
+    "AT_038": "Darnassus Aspirant",
+    "AT_024": "Demonfuse",
+    "AT_047": "Draenei Totemcarver",
+    "AT_083": "Dragonhawk Rider",
+    "AT_063t": "Dreadscale",
+    "AT_019": "Dreadsteed",
+    "AT_042": "Druid of the Saber",
+    "AT_081": "Eadric the Pure",
+    "AT_002": "Effigy",
+    "AT_051": "Elemental Destruction",
+    "AT_078": "Enter the Coliseum",
+    "AT_114": "Evil Heckler",
+    "AT_131": "Eydis Darkbane",
+    "AT_003": "Fallen Hero",
+    "AT_020": "Fearsome Doomguard",
+    "AT_115": "Fencing Coach",
+    "AT_022": "Fist of Jaraxxus",
+    "AT_129": "Fjola Lightbane",
+    "AT_094": "Flame Juggler",
+    "AT_001": "Flame Lance",
+    "AT_055": "Flash Heal",
+    "AT_093": "Frigid Snobold",
+    "AT_120": "Frost Giant",
+    "AT_133": "Gadgetzan Jouster",
+    "AT_080": "Garrison Commander",
+    "AT_122": "Gormok the Impaler",
+    "AT_118": "Grand Crusader",
+    "AT_048": "Healing Wave",
+    "AT_011": "Holy Champion",
+    "AT_092": "Ice Rager",
+    "AT_125": "Icehowl",
+    "AT_105": "Injured Kvaldir",
+    "AT_132": "Justicar Trueheart",
+    "AT_065": "King's Defender",
+    "AT_058": "King's Elekk",
+    "AT_041": "Knight of the Wild",
+    "AT_099": "Kodorider",
+    "AT_119": "Kvaldir Raider",
+    "AT_084": "Lance Carrier",
+    "AT_106": "Light's Champion",
+    "AT_037": "Living Roots",
+    "AT_061": "Lock and Load",
+    "AT_082": "Lowly Squire",
+    "AT_067": "Magnataur Alpha",
+    "AT_085": "Maiden of the Lake",
+    "AT_112": "Master Jouster",
+    "AT_117": "Master of Ceremonies",
+    "AT_088": "Mogor's Champion",
+    "AT_090": "Mukla's Champion",
+    "AT_044": "Mulch",
+    "AT_076": "Murloc Knight",
+    "AT_079": "Mysterious Challenger",
+    "AT_127": "Nexus-Champion Saraad",
+    "AT_103": "North Sea Kraken",
+    "AT_066": "Orgrimmar Aspirant",
+    "AT_101": "Pit Fighter",
+    "AT_034": "Poisoned Blade",
+    "AT_005": "Polymorph: Boar",
+    "AT_013": "Power Word: Glory",
+    "AT_056": "Powershot",
+    "AT_010": "Ram Wrangler",
+    "AT_113": "Recruiter",
+    "AT_111": "Refreshment Vendor",
+    "AT_009": "Rhonin",
+    "AT_086": "Saboteur",
+    "AT_039": "Savage Combatant",
+    "AT_130": "Sea Reaver",
+    "AT_074": "Seal of Champions",
+    "AT_028": "Shado-Pan Rider",
+    "AT_014": "Shadowfiend",
+    "AT_032": "Shady Dealer",
+    "AT_098": "Sideshow Spelleater",
+    "AT_095": "Silent Knight",
+    "AT_100": "Silver Hand Regent",
+    "AT_070": "Skycap'n Kragg",
+    "AT_069": "Sparring Partner",
+    "AT_012": "Spawn of Shadows",
+    "AT_007": "Spellslinger",
+    "AT_057": "Stablemaster",
+    "AT_054": "The Mistcaller",
+    "AT_128": "The Skeleton Knight",
+    "AT_049": "Thunder Bluff Valiant",
+    "AT_021": "Tiny Knight of Evil",
+    "AT_052": "Totem Golem",
+    "AT_097": "Tournament Attendee",
+    "AT_091": "Tournament Medic",
+    "AT_104": "Tuskarr Jouster",
+    "AT_046": "Tuskarr Totemic",
+    "AT_017": "Twilight Guardian",
+    "AT_030": "Undercity Valiant",
+    "AT_072": "Varian Wrynn",
+    "AT_023": "Void Crusher",
+    "AT_075": "Warhorse Trainer",
+    "AT_040": "Wildwalker",
+    "AT_027": "Wilfred Fizzlebang",
+    "AT_026": "Wrathguard",
+    "AT_116": "Wyrmrest Agent",
+}
+
+
+# The reference name and official id of every card, in the order their ids were assigned.
+_CARDS = [
+    ("Abomination", "EX1_097"),
+    ("Abusive Sergeant", "CS2_188"),
+    ("Acidic Swamp Ooze", "EX1_066"),
+    ("Acidmaw", "AT_063"),
+    ("Acolyte of Pain", "EX1_007"),
+    ("Al'Akir the Windlord", "NEW1_010"),
+    ("Alarm-o-Bot", "EX1_006"),
+    ("Aldor Peacekeeper", "EX1_382"),
+    ("Alexstrasza", "EX1_561"),
+    ("Alexstrasza's Champion", "AT_071"),
+    ("Amani Berserker", "EX1_393"),
+    ("Ancestor's Call", "GVG_029"),
+    ("Ancestral Healing", "CS2_041"),
+    ("Ancestral Knowledge", "AT_053"),
+    ("Ancestral Spirit", "CS2_038"),
+    ("Ancient Brewmaster", "EX1_057"),
+    ("Ancient Mage", "EX1_584"),
+    ("Ancient Secrets", "NEW1_008b"),
+    ("Ancient Teachings", "NEW1_008a"),
+    ("Ancient Watcher", "EX1_045"),
+    ("Ancient of Lore", "NEW1_008"),
+    ("Ancient of War", "EX1_178"),
+    ("Anduin Wrynn", None),
+    ("Angry Chicken", "EX1_009"),
+    ("Anima Golem", "GVG_077"),
+    ("Animal Companion", "NEW1_031"),
+    ("Annoy-o-Tron", "GVG_085"),
+    ("Anodized Robo Cub", "GVG_030"),
+    ("Antique Healbot", "GVG_069"),
+    ("Anub'ar Ambusher", "FP1_026"),
+    ("Anub'arak", "AT_036"),
+    ("Arathi Weaponsmith", "EX1_398"),
+    ("Arcane Blast", "AT_004"),
+    ("Arcane Explosion", "CS2_025"),
+    ("Arcane Golem", "EX1_089"),
+    ("Arcane Intellect", "CS2_023"),
+    ("Arcane Missiles", "EX1_277"),
+    ("Arcane Nullifier X-21", "GVG_091"),
+    ("Arcane Shot", "DS1_185"),
+    ("Arcanite Reaper", "CS2_112"),
+    ("Archmage", "CS2_155"),
+    ("Archmage Antonidas", "EX1_559"),
+    ("Argent Commander", "EX1_067"),
+    ("Argent Horserider", "AT_087"),
+    ("Argent Lance", "AT_077"),
+    ("Argent Protector", "EX1_362"),
+    ("Argent Squire", "EX1_008"),
+    ("Argent Watchman", "AT_109"),
+    ("Armor Plating", "PART_001"),
+    ("Armored Warhorse", "AT_108"),
+    ("Armorsmith", "EX1_402"),
+    ("Ashbringer", "EX1_383t"),
+    ("Assassin's Blade", "CS2_080"),
+    ("Assassinate", "CS2_076"),
+    ("Astral Communion", "AT_043"),
+    ("Attack Mode", "GVG_030a"),
+    ("Auchenai Soulpriest", "EX1_591"),
+    ("Avenge", "FP1_020"),
+    ("Avenging Wrath", "EX1_384"),
+    ("Axe Flinger", "BRM_016"),
+    ("Azure Drake", "EX1_284"),
+    ("Backstab", "CS2_072"),
+    ("Baine Bloodhoof", "EX1_110t"),
+    ("Bananas", "EX1_014t"),
+    ("Bane of Doom", "EX1_320"),
+    ("Baron Geddon", "EX1_249"),
+    ("Baron Rivendare", "FP1_031"),
+    ("Battle Axe", "EX1_398t"),
+    ("Battle Rage", "EX1_392"),
+    ("Bear Form", "EX1_165b"),
+    ("Bear Trap", "AT_060"),
+    ("Bestial Wrath", "EX1_549"),
+    ("Betrayal", "EX1_126"),
+    ("Big Game Hunter", "EX1_005"),
+    ("Bite", "EX1_570"),
+    ("Black Whelp", None),
+    ("Blackwing Corruptor", "BRM_034"),
+    ("Blackwing Technician", "BRM_033"),
+    ("Blade Flurry", "CS2_233"),
+    ("Blessed Champion", "EX1_355"),
+    ("Blessing of Kings", "CS2_092"),
+    ("Blessing of Might", "CS2_087"),
+    ("Blessing of Wisdom", "EX1_363"),
+    ("Blingtron 3000", "GVG_119"),
+    ("Blizzard", "CS2_028"),
+    ("Blood Fury", "EX1_323w"),
+    ("Blood Imp", "CS2_059"),
+    ("Blood Knight", "EX1_590"),
+    ("Bloodfen Raptor", "CS2_172"),
+    ("Bloodlust", "CS2_046"),
+    ("Bloodmage Thalnos", "EX1_012"),
+    ("Bloodsail Corsair", "NEW1_025"),
+    ("Bloodsail Raider", "NEW1_018"),
+    ("Bluegill Warrior", "CS2_173"),
+    ("Boar", "CS2_boar"),
+    ("Bolvar Fordragon", "GVG_063"),
+    ("Bomb Lobber", "GVG_099"),
+    ("Boom Bot", "GVG_110t"),
+    ("Booty Bay Bodyguard", "CS2_187"),
+    ("Boulderfist Ogre", "CS2_200"),
+    ("Bouncing Blade", "GVG_050"),
+    ("Brawl", "EX1_407"),
+    ("Burly Rockjaw Trogg", "GVG_068"),
+    ("Burrowing Mine", "GVG_056t"),
+    ("Cabal Shadow Priest", "EX1_091"),
+    ("Cairne Bloodhoof", "EX1_110"),
+    ("Call Pet", "GVG_017"),
+    ("Captain Greenskin", "NEW1_024"),
+    ("Captain's Parrot", "NEW1_016"),
+    ("Cat Form", "EX1_165a"),
+    ("Cenarius", "EX1_573"),
+    ("Charge", "CS2_103"),
+    ("Chicken", "Mekka4t"),
+    ("Chicken (Gnomish Experimenter)", "GVG_092t"),
+    ("Chillwind Yeti", "CS2_182"),
+    ("Chromaggus", "BRM_031"),
+    ("Circle of Healing", "EX1_621"),
+    ("Claw", "CS2_005"),
+    ("Cleave", "CS2_114"),
+    ("Clockwork Giant", "GVG_121"),
+    ("Clockwork Gnome", "GVG_082"),
+    ("Cobalt Guardian", "GVG_062"),
+    ("Cobra Shot", "GVG_073"),
+    ("Coghammer", "GVG_059"),
+    ("Cogmaster", "GVG_013"),
+    ("Cogmaster's Wrench", "GVG_024"),
+    ("Cold Blood", "CS2_073"),
+    ("Coldlight Oracle", "EX1_050"),
+    ("Coldlight Seer", "EX1_103"),
+    ("Commanding Shout", "NEW1_036"),
+    ("Conceal", "EX1_128"),
+    ("Cone of Cold", "EX1_275"),
+    ("Consecration", "CS2_093"),
+    ("Core Hound", "CS2_201"),
+    ("Core Rager", "BRM_014"),
+    ("Corruption", "CS2_063"),
+    ("Counterspell", "EX1_287"),
+    ("Crackle", "GVG_038"),
+    ("Crazed Alchemist", "EX1_059"),
+    ("Cruel Taskmaster", "EX1_603"),
+    ("Crush", "GVG_052"),
+    ("Cult Master", "EX1_595"),
+    ("Dalaran Mage", "EX1_582"),
+    ("Damaged Golem", "skele21"),
+    ("Dancing Swords", "FP1_029"),
+    ("Dark Cultist", "FP1_023"),
+    ("Dark Iron Dwarf", "EX1_046"),
+    ("Dark Iron Skulker", "BRM_008"),
+    ("Dark Wispers", "GVG_041"),
+    ("Darkbomb", "GVG_015"),
+    ("Darkscale Healer", "DS1_055"),
+    ("Deadly Poison", "CS2_074"),
+    ("Deadly Shot", "EX1_617"),
+    ("Death's Bite", "FP1_021"),
+    ("Deathlord", "FP1_009"),
+    ("Deathwing", "NEW1_030"),
+    ("Defender", "EX1_130a"),
+    ("Defender of Argus", "EX1_093"),
+    ("Defias Bandit", "EX1_131t"),
+    ("Defias Ringleader", "EX1_131"),
+    ("Demolisher", "EX1_102"),
+    ("Demonfire", "EX1_596"),
+    ("Demonheart", "GVG_019"),
+    ("Demonwrath", "BRM_005"),
+    ("Devilsaur", "EX1_tk29"),
+    ("Dire Wolf Alpha", "EX1_162"),
+    ("Dispel", "EX1_166b"),
+    ("Divine Favor", "EX1_349"),
+    ("Divine Spirit", "CS2_236"),
+    ("Do five damage to an enemy minion", None),
+    ("Do two damage to all enemy minions", None),
+    ("Doomguard", "EX1_310"),
+    ("Doomhammer", "EX1_567"),
+    ("Doomsayer", "NEW1_021"),
+    ("Dr. Boom", "GVG_110"),
+    ("Dragon Consort", "BRM_018"),
+    ("Dragon Egg", "BRM_022"),
+    ("Dragon's Breath", "BRM_003"),
+    ("Dragonkin Sorcerer", "BRM_020"),
+    ("Dragonling Mechanic", "EX1_025"),
+    ("Drain Life", "CS2_061"),
+    ("Drakonid Crusher", "BRM_024"),
+    ("Dread Corsair", "NEW1_022"),
+    ("Dread Infernal", "CS2_064"),
+    ("Dream", "DREAM_04"),
+    ("Druid of the Claw", "EX1_165"),
+    ("Druid of the Claw (bear)", "EX1_165t2"),
+    ("Druid of the Claw (cat)", "EX1_165t1"),
+    ("Druid of the Fang", "GVG_080"),
+    ("Druid of the Fang (cobra)", "GVG_080t"),
+    ("Druid of the Flame", "BRM_010"),
+    ("Druid of the Flame (bird)", None),
+    ("Druid of the Flame (cat)", None),
+    ("Dunemaul Shaman", "GVG_066"),
+    ("Duplicate", "FP1_018"),
+    ("Dust Devil", "EX1_243"),
+    ("Eaglehorn Bow", "EX1_536"),
+    ("Earth Elemental", "EX1_250"),
+    ("Earth Shock", "EX1_245"),
+    ("Earthen Ring Farseer", "CS2_117"),
+    ("Echo of Medivh", "GVG_005"),
+    ("Echoing Ooze", "FP1_003"),
+    ("Edwin VanCleef", "EX1_613"),
+    ("Elite Tauren Chieftain", "PRO_001"),
+    ("Elven Archer", "CS2_189"),
+    ("Emboldener 3000", "Mekka3"),
+    ("Emerald Drake", "DREAM_03"),
+    ("Emergency Coolant", "PART_005"),
+    ("Emperor Cobra", "EX1_170"),
+    ("Emperor Thaurissan", "BRM_028"),
+    ("Enhance-o Mechano", "GVG_107"),
+    ("Equality", "EX1_619"),
+    ("Ethereal Arcanist", "EX1_274"),
+    ("Eviscerate", "EX1_124"),
+    ("Excess Mana", "CS2_013t"),
+    ("Execute", "CS2_108"),
+    ("Explosive Sheep", "GVG_076"),
+    ("Explosive Shot", "EX1_537"),
+    ("Explosive Trap", "EX1_610"),
+    ("Eye for an Eye", "EX1_132"),
+    ("Faceless Manipulator", "EX1_564"),
+    ("Faerie Dragon", "NEW1_023"),
+    ("Fan of Knives", "EX1_129"),
+    ("Far Sight", "CS2_053"),
+    ("Feign Death", "GVG_026"),
+    ("Fel Cannon", "GVG_020"),
+    ("Fel Reaver", "GVG_016"),
+    ("Felguard", "EX1_301"),
+    ("Fen Creeper", "CS1_069"),
+    ("Feral Spirit", "EX1_248"),
+    ("Feugen", "FP1_015"),
+    ("Fiery War Axe", "CS2_106"),
+    ("Finicky Cloakfield", "PART_004"),
+    ("Finkle Einhorn", "EX1_finkle"),
+    ("Fire Elemental", "CS2_042"),
+    ("Fireball", "CS2_029"),
+    ("Fireguard Destroyer", "BRM_012"),
+    ("Fist of Jaraxxus", "AT_022"),
+    ("Flame Bird Form", None),
+    ("Flame Cat Form", None),
+    ("Flame Imp", "EX1_319"),
+    ("Flame Leviathan", "GVG_007"),
+    ("Flame of Azzinoth", "EX1_614t"),
+    ("Flamecannon", "GVG_001"),
+    ("Flamestrike", "CS2_032"),
+    ("Flametongue Totem", "EX1_565"),
+    ("Flamewaker", "BRM_002"),
+    ("Flare", "EX1_544"),
+    ("Flesheating Ghoul", "tt_004"),
+    ("Floating Watcher", "GVG_100"),
+    ("Flying Machine", "GVG_084"),
+    ("Foe Reaper 4000", "GVG_113"),
+    ("Force of Nature", "EX1_571"),
+    ("Force-Tank MAX", "GVG_079"),
+    ("Forked Lightning", "EX1_251"),
+    ("Freezing Trap", "EX1_611"),
+    ("Frog", "hexfrog"),
+    ("Frost Elemental", "EX1_283"),
+    ("Frost Nova", "CS2_026"),
+    ("Frost Shock", "CS2_037"),
+    ("Frostbolt", "CS2_024"),
+    ("Frostwolf Grunt", "CS2_121"),
+    ("Frostwolf Warlord", "CS2_226"),
+    ("Frothing Berserker", "EX1_604"),
+    ("Gadgetzan Auctioneer", "EX1_095"),
+    ("Gahz'rilla", "GVG_049"),
+    ("Gallywix's Coin", "GVG_028t"),
+    ("Gang Up", "BRM_007"),
+    ("Garrosh Hellscream", None),
+    ("Gazlowe", "GVG_117"),
+    ("Gelbin Mekkatorque", "EX1_112"),
+    ("Gift of Cards", "GVG_032b"),
+    ("Gift of Mana", "GVG_032a"),
+    ("Gilblin Stalker", "GVG_081"),
+    ("Give your other minions +2/+2 and taunt", None),
+    ("Gladiator's Longbow", "DS1_188"),
+    ("Glaivezooka", "GVG_043"),
+    ("Gnoll", "NEW1_040t"),
+    ("Gnomeregan Infantry", "GVG_098"),
+    ("Gnomish Experimenter", "GVG_092"),
+    ("Gnomish Inventor", "CS2_147"),
+    ("Goblin Auto-Barber", "GVG_023"),
+    ("Goblin Blastmage", "GVG_004"),
+    ("Goblin Sapper", "GVG_095"),
+    ("Goldshire Footman", "CS1_042"),
+    ("Gorehowl", "EX1_411"),
+    ("Grim Patron", "BRM_019"),
+    ("Grimscale Oracle", "EX1_508"),
+    ("Grommash Hellscream", "EX1_414"),
+    ("Grove Tender", "GVG_032"),
+    ("Gruul", "NEW1_038"),
+    ("Guardian of Kings", "CS2_088"),
+    ("Gul'dan", None),
+    ("Gurubashi Berserker", "EX1_399"),
+    ("Hammer of Wrath", "CS2_094"),
+    ("Hand of Protection", "EX1_371"),
+    ("Harrison Jones", "EX1_558"),
+    ("Harvest Golem", "EX1_556"),
+    ("Haunted Creeper", "FP1_002"),
+    ("Headcrack", "EX1_137"),
+    ("Healing Totem", "NEW1_009"),
+    ("Healing Touch", "CS2_007"),
+    ("Heavy Axe", "EX1_409t"),
+    ("Hellfire", "CS2_062"),
+    ("Hemet Nesingwary", "GVG_120"),
+    ("Heroic Strike", "CS2_105"),
+    ("Hex", "EX1_246"),
+    ("Hobgoblin", "GVG_104"),
+    ("Hogger", "NEW1_040"),
+    ("Holy Fire", "EX1_624"),
+    ("Holy Light", "CS2_089"),
+    ("Holy Nova", "CS1_112"),
+    ("Holy Smite", "CS1_130"),
+    ("Holy Wrath", "EX1_365"),
+    ("Homing Chicken", "Mekka1"),
+    ("Hound", "EX1_538t"),
+    ("Houndmaster", "DS1_070"),
+    ("Huffer", "NEW1_034"),
+    ("Humility", "EX1_360"),
+    ("Hungry Crab", "NEW1_017"),
+    ("Hungry Dragon", "BRM_026"),
+    ("Hunter's Mark", "CS2_084"),
+    ("Hyena", "EX1_534t"),
+    ("I Am Murloc", "PRO_001a"),
+    ("Ice Barrier", "EX1_289"),
+    ("Ice Block", "EX1_295"),
+    ("Ice Lance", "CS2_031"),
+    ("Illidan Stormrage", "EX1_614"),
+    ("Illuminator", "GVG_089"),
+    ("Imp", "EX1_598"),
+    ("Imp (warlock)", "GVG_045t"),
+    ("Imp Gang Boss", "BRM_006"),
+    ("Imp Master", "EX1_597"),
+    ("Imp-losion", "GVG_045"),
+    ("Infernal", "EX1_tk34"),
+    ("Injured Blademaster", "CS2_181"),
+    ("Inner Fire", "CS1_129"),
+    ("Inner Rage", "EX1_607"),
+    ("Innervate", "EX1_169"),
+    ("Iron Juggernaut", "GVG_056"),
+    ("Iron Sensei", "GVG_027"),
+    ("Ironbark Protector", "CS2_232"),
+    ("Ironbeak Owl", "CS2_203"),
+    ("Ironforge Rifleman", "CS2_141"),
+    ("Ironfur Grizzly", "CS2_125"),
+    ("Jaina Proudmoore", None),
+    ("Jeeves", "GVG_094"),
+    ("Jungle Panther", "EX1_017"),
+    ("Junkbot", "GVG_106"),
+    ("Keeper of the Grove", "EX1_166"),
+    ("Kel'Thuzad", "FP1_013"),
+    ("Kezan Mystic", "GVG_074"),
+    ("Kidnapper", "NEW1_005"),
+    ("Kill Command", "EX1_539"),
+    ("King Krush", "EX1_543"),
+    ("King Mukla", "EX1_014"),
+    ("King of Beasts", "GVG_046"),
+    ("Kirin Tor Mage", "EX1_612"),
+    ("Knife Juggler", "NEW1_019"),
+    ("Kobold Geomancer", "CS2_142"),
+    ("Kor'kron Elite", "NEW1_011"),
+    ("Laughing Sister", "DREAM_01"),
+    ("Lava Burst", "EX1_241"),
+    ("Lava Shock", "BRM_011"),
+    ("Lay on Hands", "EX1_354"),
+    ("Leader of the Pack", "EX1_160b"),
+    ("Leeroy Jenkins", "EX1_116"),
+    ("Leokk", "NEW1_033"),
+    ("Leper Gnome", "EX1_029"),
+    ("Light of the Naaru", "GVG_012"),
+    ("Light's Justice", "CS2_091"),
+    ("Lightbomb", "GVG_008"),
+    ("Lightning Bolt", "EX1_238"),
+    ("Lightning Storm", "EX1_259"),
+    ("Lightspawn", "EX1_335"),
+    ("Lightwarden", "EX1_001"),
+    ("Lightwell", "EX1_341"),
+    ("Lil' Exorcist", "GVG_097"),
+    ("Loatheb", "FP1_030"),
+    ("Loot Hoarder", "EX1_096"),
+    ("Lord Jaraxxus", "EX1_323"),
+    ("Lord Jarraxus (hero)", None),
+    ("Lord of the Arena", "CS2_162"),
+    ("Lorewalker Cho", "EX1_100"),
+    ("Lost Tallstrider", "GVG_071"),
+    ("Mad Bomber", "EX1_082"),
+    ("Mad Scientist", "FP1_004"),
+    ("Madder Bomber", "GVG_090"),
+    ("Maexxna", "FP1_010"),
+    ("Magma Rager", "CS2_118"),
+    ("Majordomo Executus", "BRM_027"),
+    ("Mal'Ganis", "GVG_021"),
+    ("Malfurion Stormrage", None),
+    ("Malorne", "GVG_035"),
+    ("Malygos", "EX1_563"),
+    ("Mana Addict", "EX1_055"),
+    ("Mana Tide Totem", "EX1_575"),
+    ("Mana Wraith", "EX1_616"),
+    ("Mana Wyrm", "NEW1_012"),
+    ("Mark of Nature", "EX1_155"),
+    ("Mark of the Wild", "CS2_009"),
+    ("Mass Dispel", "EX1_626"),
+    ("Master Swordsmith", "NEW1_037"),
+    ("Master of Disguise", "NEW1_014"),
+    ("Mech-Bear-Cat", "GVG_034"),
+    ("Mechanical Dragonling", "EX1_025t"),
+    ("Mechanical Yeti", "GVG_078"),
+    ("Mechwarper", "GVG_006"),
+    ("Mekgineer Thermaplugg", "GVG_116"),
+    ("Metaltooth Leaper", "GVG_048"),
+    ("Micro Machine", "GVG_103"),
+    ("Millhouse Manastorm", "NEW1_029"),
+    ("Mimiron's Head", "GVG_111"),
+    ("Mind Blast", "DS1_233"),
+    ("Mind Control", "CS1_113"),
+    ("Mind Control Tech", "EX1_085"),
+    ("Mind Vision", "CS2_003"),
+    ("Mindgames", "EX1_345"),
+    ("Mini-Mage", "GVG_109"),
+    ("Mirror Entity", "EX1_294"),
+    ("Mirror Image", "CS2_027"),
+    ("Mirror Image (minion)", "CS2_mirror"),
+    ("Misdirection", "EX1_533"),
+    ("Misha", "NEW1_032"),
+    ("Mistress of Pain", "GVG_018"),
+    ("Mogor the Ogre", "GVG_112"),
+    ("Mogu'shan Warden", "EX1_396"),
+    ("Molten Giant", "EX1_620"),
+    ("Moonfire", "CS2_008"),
+    ("Mortal Coil", "EX1_302"),
+    ("Mortal Strike", "EX1_408"),
+    ("Mountain Giant", "EX1_105"),
+    ("Multi-Shot", "DS1_183"),
+    ("Murloc", "PRO_001at"),
+    ("Murloc Raider", "CS2_168"),
+    ("Murloc Scout", "EX1_506a"),
+    ("Murloc Tidecaller", "EX1_509"),
+    ("Murloc Tidehunter", "EX1_506"),
+    ("Murloc Warleader", "EX1_507"),
+    ("Muster for Battle", "GVG_061"),
+    ("Nat Pagle", "EX1_557"),
+    ("Naturalize", "EX1_161"),
+    ("Nefarian", "BRM_030"),
+    ("Neptulon", "GVG_042"),
+    ("Nerub'ar Weblord", "FP1_017"),
+    ("Nerubian", "FP1_007t"),
+    ("Nerubian Egg", "FP1_007"),
+    ("Nightblade", "EX1_593"),
+    ("Nightmare", "DREAM_05"),
+    ("Noble Sacrifice", "EX1_130"),
+    ("Northshire Cleric", "CS2_235"),
+    ("Nourish", "EX1_164"),
+    ("Novice Engineer", "EX1_015"),
+    ("Nozdormu", "EX1_560"),
+    ("Oasis Snapjaw", "CS2_119"),
+    ("Ogre Brute", "GVG_065"),
+    ("Ogre Magi", "CS2_197"),
+    ("Ogre Ninja", "GVG_088"),
+    ("Ogre Warmaul", "GVG_054"),
+    ("Old Murk-Eye", "EX1_062"),
+    ("One-eyed Cheat", "GVG_025"),
+    ("Onyxia", "EX1_562"),
+    ("Panther", "EX1_160t"),
+    ("Patient Assassin", "EX1_522"),
+    ("Perdition's Blade", "EX1_133"),
+    ("Piloted Shredder", "GVG_096"),
+    ("Piloted Sky Golem", "GVG_105"),
+    ("Pint-Sized Summoner", "EX1_076"),
+    ("Pit Lord", "EX1_313"),
+    ("Poison Seeds", "FP1_019"),
+    ("Polymorph", "CS2_022"),
+    ("Poultryizer", "Mekka4"),
+    ("Power Overwhelming", "EX1_316"),
+    ("Power Word: Shield", "CS2_004"),
+    ("Power of the Horde", "PRO_001c"),
+    ("Power of the Wild", "EX1_160"),
+    ("Powermace", "GVG_036"),
+    ("Powershot", "AT_056"),
+    ("Preparation", "EX1_145"),
+    ("Priestess of Elune", "EX1_583"),
+    ("Prophet Velen", "EX1_350"),
+    ("Puddlestomper", "GVG_064"),
+    ("Pyroblast", "EX1_279"),
+    ("Quartermaster", "GVG_060"),
+    ("Questing Adventurer", "EX1_044"),
+    ("Quick Shot", "BRM_013"),
+    ("Raging Worgen", "EX1_412"),
+    ("Ragnaros the Firelord", "EX1_298"),
+    ("Ragnaros the Firelord (hero)", None),
+    ("Raid Leader", "CS2_122"),
+    ("Rampage", "CS2_104"),
+    ("Ravenholdt Assassin", "CS2_161"),
+    ("Razorfen Hunter", "CS2_196"),
+    ("Reckless Rocketeer", "CS2_213"),
+    ("Recombobulator", "GVG_108"),
+    ("Recycle", "GVG_031"),
+    ("Redemption", "EX1_136"),
+    ("Reincarnate", "FP1_025"),
+    ("Rend Blackhand", "BRM_029"),
+    ("Repair Bot", "Mekka2"),
+    ("Repentance", "EX1_379"),
+    ("Resurrect", "BRM_017"),
+    ("Revenge", "BRM_015"),
+    ("Reversing Switch", "PART_006"),
+    ("Rexxar", None),
+    ("River Crocolisk", "CS2_120"),
+    ("Rockbiter Weapon", "CS2_045"),
+    ("Rogues Do It...", "PRO_001b"),
+    ("Rooted", "EX1_178a"),
+    ("Rusty Horn", "PART_003"),
+    ("SI:7 Agent", "EX1_134"),
+    ("Sabotage", "GVG_047"),
+    ("Sacrificial Pact", "NEW1_003"),
+    ("Salty Dog", "GVG_070"),
+    ("Sap", "EX1_581"),
+    ("Savage Roar", "CS2_011"),
+    ("Savagery", "EX1_578"),
+    ("Savannah Highmane", "EX1_534"),
+    ("Scarlet Crusader", "EX1_020"),
+    ("Scarlet Purifier", "GVG_101"),
+    ("Scavenging Hyena", "EX1_531"),
+    ("Screwjank Clunker", "GVG_055"),
+    ("Sea Giant", "EX1_586"),
+    ("Seal of Light", "GVG_057"),
+    ("Searing Totem", "CS2_050"),
+    ("Secretkeeper", "EX1_080"),
+    ("Sen'jin Shieldmasta", "CS2_179"),
+    ("Sense Demons", "EX1_317"),
+    ("Shade of Naxxramas", "FP1_005"),
+    ("Shadow Bolt", "CS2_057"),
+    ("Shadow Madness", "EX1_334"),
+    ("Shadow Word: Death", "EX1_622"),
+    ("Shadow Word: Pain", "CS2_234"),
+    ("Shadow of Nothing", "EX1_345t"),
+    ("Shadowbomber", "GVG_009"),
+    ("Shadowboxer", "GVG_072"),
+    ("Shadowflame", "EX1_303"),
+    ("Shadowform", "EX1_625"),
+    ("Shadowstep", "EX1_144"),
+    ("Shattered Sun Cleric", "EX1_019"),
+    ("Sheep", "CS2_tk1"),
+    ("Shield Block", "EX1_606"),
+    ("Shield Slam", "EX1_410"),
+    ("Shieldbearer", "EX1_405"),
+    ("Shielded Minibot", "GVG_058"),
+    ("Shieldmaiden", "GVG_053"),
+    ("Ship's Cannon", "GVG_075"),
+    ("Shiv", "EX1_278"),
+    ("Shrinkmeister", "GVG_011"),
+    ("Siege Engine", "GVG_086"),
+    ("Silence", "EX1_332"),
+    ("Siltfin Spiritwalker", "GVG_040"),
+    ("Silver Hand Knight", "CS2_151"),
+    ("Silver Hand Recruit", "CS2_101t"),
+    ("Silverback Patriarch", "CS2_127"),
+    ("Silvermoon Guardian", "EX1_023"),
+    ("Sinister Strike", "CS2_075"),
+    ("Siphon Soul", "EX1_309"),
+    ("Slam", "EX1_391"),
+    ("Slime", "FP1_012t"),
+    ("Sludge Belcher", "FP1_012"),
+    ("Snake", "EX1_554t"),
+    ("Snake Trap", "EX1_554"),
+    ("Sneed's Old Shredder", "GVG_114"),
+    ("Snipe", "EX1_609"),
+    ("Snowchugger", "GVG_002"),
+    ("Solemn Vigil", "BRM_001"),
+    ("Soot Spewer", "GVG_123"),
+    ("Sorcerer's Apprentice", "EX1_608"),
+    ("Soul of the Forest", "EX1_158"),
+    ("Soulfire", "EX1_308"),
+    ("Southsea Captain", "NEW1_027"),
+    ("Southsea Deckhand", "CS2_146"),
+    ("Spectral Knight", "FP1_008"),
+    ("Spectral Spider", "FP1_002t"),
+    ("Spellbender", "tt_010"),
+    ("Spellbender (minion)", "tt_010a"),
+    ("Spellbreaker", "EX1_048"),
+    ("Spider Tank", "GVG_044"),
+    ("Spirit Wolf", "EX1_tk11"),
+    ("Spiteful Smith", "CS2_221"),
+    ("Sprint", "CS2_077"),
+    ("Squire", "CS2_152"),
+    ("Squirrel", "EX1_tk28"),
+    ("Stalagg", "FP1_014"),
+    ("Stampeding Kodo", "NEW1_041"),
+    ("Starfall", "NEW1_007"),
+    ("Starfire", "EX1_173"),
+    ("Starving Buzzard", "CS2_237"),
+    ("Steamwheedle Sniper", "GVG_087"),
+    ("Stoneclaw Totem", "CS2_051"),
+    ("Stoneskin Gargoyle", "FP1_027"),
+    ("Stonesplinter Trogg", "GVG_067"),
+    ("Stonetusk Boar", "CS2_171"),
+    ("Stormforged Axe", "EX1_247"),
+    ("Stormpike Commando", "CS2_150"),
+    ("Stormwind Champion", "CS2_222"),
+    ("Stormwind Knight", "CS2_131"),
+    ("Stranglethorn Tiger", "EX1_028"),
+    ("Succubus", "EX1_306"),
+    ("Summon a Panther", "EX1_160a"),
+    ("Summon two 2/2 Treants with taunt", None),
+    ("Summoning Portal", "EX1_315"),
+    ("Sunfury Protector", "EX1_058"),
+    ("Sunwalker", "EX1_032"),
+    ("Swipe", "CS2_012"),
+    ("Sword of Justice", "EX1_366"),
+    ("Sylvanas Windrunner", "EX1_016"),
+    ("Tank Mode", "GVG_030b"),
+    ("Target Dummy", "GVG_093"),
+    ("Tauren Warrior", "EX1_390"),
+    ("Temple Enforcer", "EX1_623"),
+    ("Thaddius", "FP1_014t"),
+    ("The Beast", "EX1_577"),
+    ("The Black Knight", "EX1_002"),
+    ("The Coin", "GAME_005"),
+    ("Thoughtsteal", "EX1_339"),
+    ("Thrall", None),
+    ("Thrallmar Farseer", "EX1_021"),
+    ("Timber Wolf", "DS1_175"),
+    ("Time Rewinder", "PART_002"),
+    ("Tinker's Sharpsword Oil", "GVG_022"),
+    ("Tinkertown Technician", "GVG_102"),
+    ("Tinkmaster Overspark", "EX1_083"),
+    ("Tirion Fordring", "EX1_383"),
+    ("Toshley", "GVG_115"),
+    ("Totemic Might", "EX1_244"),
+    ("Tournament Medic", "AT_091"),
+    ("Tracking", "DS1_184"),
+    ("Trade Prince Gallywix", "GVG_028"),
+    ("Treant", "EX1_158t"),
+    ("Treant (charge)", "EX1_tk9"),
+    ("Treant (poison seeds)", "FP1_019t"),
+    ("Treant (taunt)", "EX1_573t"),
+    ("Tree of Life", "GVG_033"),
+    ("Troggzor the Earthinator", "GVG_118"),
+    ("Truesilver Champion", "CS2_097"),
+    ("Tundra Rhino", "DS1_178"),
+    ("Twilight Drake", "EX1_043"),
+    ("Twilight Whelp", "BRM_004"),
+    ("Twisting Nether", "EX1_312"),
+    ("Unbound Elemental", "EX1_258"),
+    ("Undertaker", "FP1_028"),
+    ("Unleash the Hounds", "EX1_538"),
+    ("Unstable Ghoul", "FP1_024"),
+    ("Unstable Portal", "GVG_003"),
+    ("Upgrade!", "EX1_409"),
+    ("Upgraded Repair Bot", "GVG_083"),
+    ("Uproot", "EX1_178b"),
+    ("Uther the Lightbringer", None),
+    ("V-07-TR-0N", "GVG_111t"),
+    ("Valeera Sanguinar", None),
+    ("Vanish", "NEW1_004"),
+    ("Vaporize", "EX1_594"),
+    ("Velen's Chosen", "GVG_010"),
+    ("Venture Co. Mercenary", "CS2_227"),
+    ("Violet Apprentice", "NEW1_026t"),
+    ("Violet Teacher", "NEW1_026"),
+    ("Vitality Totem", "GVG_039"),
+    ("Void Terror", "EX1_304"),
+    ("Voidcaller", "FP1_022"),
+    ("Voidwalker", "CS2_065"),
+    ("Vol'jin", "GVG_014"),
+    ("Volcanic Drake", "BRM_025"),
+    ("Volcanic Lumberer", "BRM_009"),
+    ("Voodoo Doctor", "EX1_011"),
+    ("Wailing Soul", "FP1_016"),
+    ("War Golem", "CS2_186"),
+    ("Warbot", "GVG_051"),
+    ("Warsong Commander", "EX1_084"),
+    ("Water Elemental", "CS2_033"),
+    ("Webspinner", "FP1_011"),
+    ("Wee Spellstopper", "GVG_122"),
+    ("Whelp", "EX1_116t"),
+    ("Whirling Blades", "PART_007"),
+    ("Whirling Zap-o-matic", "GVG_037"),
+    ("Whirlwind", "EX1_400"),
+    ("Wicked Knife", "CS2_082"),
+    ("Wild Growth", "CS2_013"),
+    ("Wild Pyromancer", "NEW1_020"),
+    ("Windfury", "CS2_039"),
+    ("Windfury Harpy", "EX1_033"),
+    ("Windspeaker", "EX1_587"),
+    ("Wisp", "CS2_231"),
+    ("Wolfrider", "CS2_124"),
+    ("Worgen Infiltrator", "EX1_010"),
+    ("Worthless Imp", "EX1_317t"),
+    ("Wrath", "EX1_154"),
+    ("Wrath of Air Totem", "CS2_052"),
+    ("Young Dragonhawk", "CS2_169"),
+    ("Young Priestess", "EX1_004"),
+    ("Youthful Brewmaster", "EX1_049"),
+    ("Ysera", "EX1_572"),
+    ("Ysera Awakens", "DREAM_02"),
+    ("Zombie Chow", "FP1_001"),
+    ("moonfire_keeper", None),
+]
+
+#: The number of cards in the catalog with permanently assigned ids
+CATALOG_SIZE = len(_CARDS)
+
+_names = [name for name, official_id in _CARDS]
+_ids = {name: index for index, name in enumerate(_names)}
+_official_ids = {name: official_id for name, official_id in _CARDS}
+
+
+def card_id(ref_name):
+    """
+    Find the integer id of a card.
+
+    :param str ref_name: The reference name of the card
+    :return: The card's id
+    :rtype: int
+    :raises KeyError: if the card is not in the catalog, and hasn't been registered with :func:`register`
+    """
+    return _ids[ref_name]
+
+
+def register(ref_name):
+    """
+    Add a card which is not in the catalog, giving it the next free id after the end of the catalog.  Registering a
+    card which already has an id does nothing.
+
+    :param str ref_name: The reference name of the card
+    :return: The card's id
+    :rtype: int
+    """
+    index = _ids.get(ref_name)
+    if index is None:
+        index = len(_names)
+        _names.append(ref_name)
+        _ids[ref_name] = index
+    return index
+
+
+def card_name(card_id):
+    """
+    Find the reference name of the card with the given id.
+
+    :param int card_id: The id of the card, as returned by :func:`card_id` or :func:`register`
+    :return: The reference name of the card, which can be passed to :func:`hearthbreaker.engine.card_lookup`
+    :rtype: str
+    :raises IndexError: if no card has been given that id
+    """
+    if card_id < 0:
+        raise IndexError("Invalid card id {}".format(card_id))
+    return _names[card_id]
+
+
+def portable_id(card_id):
+    """
+    Find the form in which a card should be written out, so that it can be read by another process.  Ids from the
+    catalog are the same in every process, but ids given to cards which are not in the catalog are not, so those
+    cards are written as their reference name instead.  Both forms can be passed to
+    :func:`hearthbreaker.engine.card_lookup`.
+
+    :param int card_id: The id of the card, as returned by :func:`card_id`
+    :return: The id itself if the card is in the catalog, otherwise the card's reference name
+    :rtype: int or str
+    """
+    if card_id < CATALOG_SIZE:
+        return card_id
+    return card_name(card_id)
+
+
+def official_id(ref_name):
+    """
+    Find the official id of a card, as used in ``AllSets.enUS.json``.  Where several official ids are implemented by
+    the same card, the id of the collectible version is used.
+
+    :param str ref_name: The reference name of the card
+    :return: The official id of the card, or None if it doesn't have one
+    :rtype: str
+    """
+    return _official_ids.get(ref_name)
+
+
+def from_official_id(official_id):
+    """
+    Find the reference name used for the card with the given official id.
+
+    :param str official_id: The id of the card in ``AllSets.enUS.json``, such as ``EX1_097``
+    :return: The reference name of the card
+    :rtype: str
+    :raises KeyError: if the official id is not known
+    """
+    return OFFICIAL_IDS[official_id]
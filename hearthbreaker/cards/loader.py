@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+from hearthbreaker.cards import catalog
+from hearthbreaker.cards.base import MinionCard, WeaponCard
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
+from hearthbreaker.game_objects import Minion, Weapon
+from hearthbreaker.tags.base import Battlecry, Choice, Deathrattle, Effect, Aura, Buff
+
+__doc__ = """
+Defines cards from a JSON file of card definitions, such as ``card_defs.json``.
+
+Each definition is turned into a subclass of :class:`MinionCard <hearthbreaker.cards.base.MinionCard>` or
+:class:`WeaponCard <hearthbreaker.cards.base.WeaponCard>` which behaves the same way as the hand written class for
+that card.  Decoding the tags in a definitions file is slow, so the decoded definitions are stored in a cache file
+next to it.  The cache is keyed by a hash of the contents of the definitions file, so editing the definitions
+automatically invalidates the cache.
+
+The decoded tags for each card are kept pickled, and each new card, minion or weapon unpickles its own copy, which is
+quicker than deep copying a prototype.
+"""
+
+#: Increase this whenever the structure of the cached definitions changes, so that old caches are ignored
+CACHE_VERSION = 1
+
+
+def _decode_all(cls, tags):
+    return [cls.from_json(**tag) for tag in tags]
+
+
+def _decode_definition(card_def):
+    """
+    Decode all of the tags in a card definition, returning a dict with the pickled arguments for the card's
+    constructor under ``'card'``, and the pickled arguments for the constructor of the minion or weapon it creates under
+    ``'creates'``.
+    """
+    card_args = {
+        'name': card_def['name'],
+        'mana': card_def['mana'],
+        'character_class': CHARACTER_CLASS.from_str(card_def.get('character_class', '')),
+        'rarity': CARD_RARITY.from_str(card_def['rarity']),
+        'collectible': card_def.get('collectible', True),
+    }
+    if 'overload' in card_def:
+        card_args['overload'] = card_def['overload']
+    if 'combo' in card_def:
+        card_args['combo'] = Battlecry.from_json(**card_def['combo'])
+    impl = card_def.get('impl', {})
+
+    if card_def['type'] == 'minion':
+        if 'ref_name' in card_def:
+            card_args['ref_name'] = card_def['ref_name']
+        if 'minion_type' in card_def:
+            card_args['minion_type'] = MINION_TYPE.from_str(card_def['minion_type'])
+        if 'battlecry' in card_def:
+            card_args['battlecry'] = tuple(_decode_all(Battlecry, card_def['battlecry']))
+        if 'choices' in card_def:
+            card_args['choices'] = _decode_all(Choice, card_def['choices'])
+        if 'effects' in card_def:
+            card_args['effects'] = _decode_all(Effect, card_def['effects'])
+        if 'buffs' in card_def:
+            card_args['buffs'] = _decode_all(Buff, card_def['buffs'])
+        creates = {
+            'attack': card_def['attack'],
+            'health': card_def['health'],
+        }
+        if 'enrage' in card_def:
+            creates['enrage'] = _decode_all(Aura, card_def['enrage'])
+        if 'deathrattle' in card_def:
+            creates['deathrattle'] = _decode_all(Deathrattle, card_def['deathrattle'])
+    elif card_def['type'] == 'weapon':
+        if 'battlecry' in card_def:
+            card_args['battlecry'] = Battlecry.from_json(**card_def['battlecry'])
+        creates = {
+            'attack_power': card_def['attack'],
+            'durability': card_def['durability'],
+        }
+        if 'deathrattle' in card_def:
+            creates['deathrattle'] = Deathrattle.from_json(**card_def['deathrattle'])
+    else:
+        raise TypeError("Cannot load a card of type {}".format(card_def['type']))
+
+    if 'effects' in impl:
+        creates['effects'] = _decode_all(Effect, impl['effects'])
+    if 'auras' in impl:
+        creates['auras'] = _decode_all(Aura, impl['auras'])
+    if 'buffs' in impl:
+        creates['buffs'] = _decode_all(Buff, impl['buffs'])
+
+    return {
+        'type': card_def['type'],
+        'ref_name': card_def.get('ref_name', card_def['name']),
+        'card': pickle.dumps(card_args, pickle.HIGHEST_PROTOCOL),
+        'creates': pickle.dumps(creates, pickle.HIGHEST_PROTOCOL),
+    }
+
+
+def load_definitions(filename, cache_filename=None):
+    """
+    Read and decode the card definitions in the given file.  If the cache file exists and was made from a file with
+    the same contents, the definitions are read from it instead.  Otherwise the definitions are decoded and written to
+    the cache file for next time.
+
+    :param str filename: The name of the JSON file containing the card definitions
+    :param str cache_filename: The name of the cache file to use.  Defaults to ``filename`` with ``.cache`` added
+    :return: The decoded definitions, one per card, to be passed to :func:`define_card`
+    :rtype: [dict]
+    """
+    if cache_filename is None:
+        cache_filename = filename + ".cache"
+    with open(filename, "rb") as file:
+        contents = file.read()
+    key = hashlib.sha1(contents).hexdigest()
+
+    try:
+        with open(cache_filename, "rb") as file:
+            cached = pickle.load(file)
+        if cached['version'] == CACHE_VERSION and cached['key'] == key:
+            return cached['definitions']
+    except Exception:
+        # A missing, corrupt or outdated cache is rebuilt below
+        pass
+
+    definitions = [_decode_definition(card_def) for card_def in json.loads(contents.decode("utf-8"))]
+    try:
+        # Each process writes to a file of its own, so processes rebuilding the cache at the same time can never
+        # replace it with a file another one is half way through writing
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(cache_filename)), delete=False) as file:
+            temporary_filename = file.name
+            try:
+                pickle.dump({'version': CACHE_VERSION, 'key': key, 'definitions': definitions}, file,
+                            pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                file.close()
+                os.remove(temporary_filename)
+                raise
+        try:
+            os.replace(temporary_filename, cache_filename)
+        except OSError:
+            os.remove(temporary_filename)
+            raise
+    except OSError:
+        # The cache is only an optimization, so a read only directory shouldn't stop the cards from loading
+        pass
+    return definitions
+
+
+def define_card(definition):
+    """
+    Create a card class from a definition returned by :func:`load_definitions`.  Every instance of the class (and
+    every minion or weapon it creates) gets its own copy of the definition's tags.
+
+    :param dict definition: The decoded definition of the card
+    :return: A subclass of :class:`MinionCard <hearthbreaker.cards.base.MinionCard>` or
+             :class:`WeaponCard <hearthbreaker.cards.base.WeaponCard>`
+    :rtype: type
+    """
+    card_args = definition['card']
+    creates = definition['creates']
+    name = re.sub("[:'.()-]", "", definition['ref_name'])
+    class_name = "".join([word[0].upper() + word[1:] for word in name.split()])
+
+    if definition['type'] == 'minion':
+        def __init__(self):
+            MinionCard.__init__(self, **pickle.loads(card_args))
+
+        def create_minion(self, player):
+            return Minion(**pickle.loads(creates))
+
+        return type(class_name, (MinionCard,), {
+            '__init__': __init__,
+            'create_minion': create_minion,
+            '__module__': __name__,
+        })
+    else:
+        def __init__(self):
+            WeaponCard.__init__(self, **pickle.loads(card_args))
+
+        def create_weapon(self, player):
+            return Weapon(**pickle.loads(creates))
+
+        return type(class_name, (WeaponCard,), {
+            '__init__': __init__,
+            'create_weapon': create_weapon,
+            '__module__': __name__,
+        })
+
+
+def load_cards(filename, cache_filename=None, register=False):
+    """
+    Define a card class for every card in the given definitions file.
+
+    :param str filename: The name of the JSON file containing the card definitions
+    :param str cache_filename: The name of the cache file to use.  See :func:`load_definitions`
+    :param bool register: If True, the loaded classes replace the classes in
+                          :data:`hearthbreaker.engine.card_table` with the same reference names, so that
+                          :func:`hearthbreaker.engine.card_lookup` and decks loaded afterwards use them.  Cards which
+                          aren't in the :mod:`card catalog <hearthbreaker.cards.catalog>` are registered with it
+    :return: A dict mapping the reference name of each card to its class
+    :rtype: {str: type}
+    """
+    classes = {}
+    for definition in load_definitions(filename, cache_filename):
+        classes[definition['ref_name']] = define_card(definition)
+    if register:
+        from hearthbreaker.engine import card_table
+        card_table.update(classes)
+        for ref_name in classes:
+            catalog.register(ref_name)
+    return classes
@@ -164,7 +164,7 @@ class Panther(MinionCard):
         super().__init__("Panther", 2, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON, False, MINION_TYPE.BEAST)
 
     def create_minion(self, _):
-        return Minion(3, 2, MINION_TYPE.BEAST)
+        return Minion(3, 2)
 
 
 class IncreaseStats(ChoiceCard):
@@ -298,8 +298,8 @@ class DamageOne(ChoiceCard):
                                  False)
 
             def can_use(self, player, game):
-                return super().can_use(player, game) and len(hearthbreaker.targeting.find_minion_spell_target(
-                    game, lambda t: t.spell_targetable())) > 0
+                return super().can_use(player, game) and hearthbreaker.targeting.has_target(
+                    game, hearthbreaker.targeting.find_minion_spell_target, lambda t: t.spell_targetable())
 
             def use(self, player, game):
                 targets = hearthbreaker.targeting.find_minion_spell_target(game, lambda t: t.spell_targetable())
@@ -404,7 +404,8 @@ class DarkWispers(SpellCard):
                     wisp.summon(player, game, len(player.minions))
 
         # In the official interface, both options are shown, but only one is highlighted.
-        if len(hearthbreaker.targeting.find_minion_spell_target(game, lambda t: t.spell_targetable())) == 0:
+        if not hearthbreaker.targeting.has_target(game, hearthbreaker.targeting.find_minion_spell_target,
+                                                  lambda t: t.spell_targetable()):
             option = Wisps5()
         else:
             option = player.agent.choose_option([Wisps5(), Buff5()], player)
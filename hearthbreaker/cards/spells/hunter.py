@@ -83,10 +83,10 @@ class ExplosiveTrap(SecretCard):
         super().__init__("Explosive Trap", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
     def _reveal(self, attacker, target):
         if isinstance(target, Hero):
@@ -104,10 +104,10 @@ class FreezingTrap(SecretCard):
         super().__init__("Freezing Trap", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
 
     def activate(self, player):
-        player.game.current_player.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
     def _reveal(self, attacker, target):
         if isinstance(attacker, Minion) and not attacker.removed:
@@ -121,10 +121,10 @@ class Misdirection(SecretCard):
         super().__init__("Misdirection", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.RARE)
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
     def _reveal(self, character, target):
         if isinstance(target, Hero) and not character.removed:
@@ -144,10 +144,10 @@ class Snipe(SecretCard):
         super().__init__("Snipe", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
 
     def activate(self, player):
-        player.game.current_player.bind("minion_played", self._reveal)
+        player.opponent.bind("minion_played", self.secret_triggered)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("minion_played", self._reveal)
+        player.opponent.unbind("minion_played", self.secret_triggered)
 
     def _reveal(self, minion):
         minion.damage(4, None)
@@ -257,10 +257,10 @@ class SnakeTrap(SecretCard):
         super().__init__("Snake Trap", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.EPIC)
 
     def activate(self, player):
-        player.game.current_player.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
     def _reveal(self, attacker, target):
         if isinstance(target, Minion) and len(target.player.game.other_player.minions) < 7:
@@ -330,10 +330,10 @@ class BearTrap(SecretCard):
         super().__init__("Bear Trap", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
 
     def activate(self, player):
-        player.game.current_player.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
     def _reveal(self, attacker, target):
         if isinstance(target, Hero) and len(target.player.game.other_player.minions) < 7:
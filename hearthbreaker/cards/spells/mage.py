@@ -18,9 +18,7 @@ class ArcaneMissiles(SpellCard):
     def use(self, player, game):
         super().use(player, game)
         for i in range(0, player.effective_spell_damage(3)):
-            targets = copy.copy(game.other_player.minions)
-            targets.append(game.other_player.hero)
-            target = game.random_choice(targets)
+            target = game.random_choice_from(game.other_player.minions, [game.other_player.hero])
             target.damage(1, self)
 
 
@@ -105,10 +103,10 @@ class Counterspell(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("card_played", self._reveal)
+        player.opponent.bind("card_played", self.secret_triggered)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("card_played", self._reveal)
+        player.opponent.unbind("card_played", self.secret_triggered)
 
 
 class IceBarrier(SecretCard):
@@ -122,10 +120,10 @@ class IceBarrier(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
 
 class MirrorEntity(SecretCard):
@@ -142,11 +140,11 @@ class MirrorEntity(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("minion_played", self._reveal)
+        player.opponent.bind("minion_played", self.secret_triggered)
         self.player = player
 
     def deactivate(self, player):
-        player.game.current_player.unbind("minion_played", self._reveal)
+        player.opponent.unbind("minion_played", self.secret_triggered)
         self.player = None
 
 
@@ -164,11 +162,11 @@ class Spellbender(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("card_played", self._reveal)
+        player.opponent.bind("card_played", self.secret_triggered)
         self.player = player
 
     def deactivate(self, player):
-        player.game.current_player.unbind("card_played", self._reveal)
+        player.opponent.unbind("card_played", self.secret_triggered)
         self.player = None
 
 
@@ -183,10 +181,10 @@ class Vaporize(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
 
 class IceBlock(SecretCard):
@@ -202,10 +200,10 @@ class IceBlock(SecretCard):
                 super().reveal()
 
     def activate(self, player):
-        player.bind("pre_damage", self._reveal)
+        player.bind("pre_damage", self.secret_triggered)
 
     def deactivate(self, player):
-        player.unbind("pre_damage", self._reveal)
+        player.unbind("pre_damage", self.secret_triggered)
 
 
 class ConeOfCold(SpellCard):
@@ -294,11 +292,11 @@ class Duplicate(SecretCard):
         self.player = None
 
     def activate(self, player):
-        player.bind("minion_died", self._reveal)
+        player.bind("minion_died", self.secret_triggered)
         self.player = player
 
     def deactivate(self, player):
-        player.unbind("minion_died", self._reveal)
+        player.unbind("minion_died", self.secret_triggered)
         self.player = None
 
     def _reveal(self, minion, by):
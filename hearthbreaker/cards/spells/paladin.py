@@ -18,9 +18,7 @@ class AvengingWrath(SpellCard):
     def use(self, player, game):
         super().use(player, game)
         for i in range(0, player.effective_spell_damage(8)):
-            targets = copy.copy(game.other_player.minions)
-            targets.append(game.other_player.hero)
-            target = game.random_choice(targets)
+            target = game.random_choice_from(game.other_player.minions, [game.other_player.hero])
             target.damage(1, self)
 
 
@@ -198,10 +196,10 @@ class Avenge(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.bind("minion_died", self._reveal)
+        player.bind("minion_died", self.secret_triggered)
 
     def deactivate(self, player):
-        player.unbind("minion_died", self._reveal)
+        player.unbind("minion_died", self.secret_triggered)
 
 
 class EyeForAnEye(SecretCard):
@@ -214,10 +212,10 @@ class EyeForAnEye(SecretCard):
         super().reveal()
 
     def activate(self, player):
-        player.bind("character_damaged", self._reveal)
+        player.bind("character_damaged", self.secret_triggered)
 
     def deactivate(self, player):
-        player.unbind("character_damaged", self._reveal)
+        player.unbind("character_damaged", self.secret_triggered)
 
 
 class NobleSacrifice(SecretCard):
@@ -234,10 +232,10 @@ class NobleSacrifice(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.opponent.bind("character_attack", self._reveal)
+        player.opponent.bind("character_attack", self.secret_triggered)
 
     def deactivate(self, player):
-        player.opponent.unbind("character_attack", self._reveal)
+        player.opponent.unbind("character_attack", self.secret_triggered)
 
 
 class Redemption(SecretCard):
@@ -251,10 +249,10 @@ class Redemption(SecretCard):
             super().reveal()
 
     def activate(self, player):
-        player.bind("minion_died", self._reveal)
+        player.bind("minion_died", self.secret_triggered)
 
     def deactivate(self, player):
-        player.unbind("minion_died", self._reveal)
+        player.unbind("minion_died", self.secret_triggered)
 
 
 class Repentance(SecretCard):
@@ -267,10 +265,10 @@ class Repentance(SecretCard):
         super().reveal()
 
     def activate(self, player):
-        player.game.current_player.bind("minion_played", self._reveal)
+        player.opponent.bind("minion_played", self.secret_triggered)
 
     def deactivate(self, player):
-        player.game.current_player.unbind("minion_played", self._reveal)
+        player.opponent.unbind("minion_played", self.secret_triggered)
 
 
 class SealOfLight(SpellCard):
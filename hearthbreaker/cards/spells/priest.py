@@ -339,6 +339,6 @@ class Resurrect(SpellCard):
         from hearthbreaker.engine import card_lookup
         super().use(player, game)
         if len(player.graveyard) > 0 and len(player.minions) < 7:
-            card_name = game.random_choice(player.graveyard)
-            card = card_lookup(card_name)
+            card_id = game.random_choice(player.graveyard)
+            card = card_lookup(card_id)
             card.summon(player, game, len(player.minions))
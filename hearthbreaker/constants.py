@@ -95,3 +95,32 @@ class MINION_TYPE:
     def to_str(minion_number):
         types = dict(zip(MINION_TYPE.__types.values(), MINION_TYPE.__types.keys()))
         return types[minion_number].capitalize()
+
+
+class KEYWORD:
+    """
+    The bits of :attr:`Character.keywords <hearthbreaker.game_objects.Character.keywords>`.  Each bit is set while the
+    attribute with the same name is non zero.
+    """
+    TAUNT = 1
+    STEALTH = 2
+    DIVINE_SHIELD = 4
+    FROZEN = 8
+    IMMUNE = 16
+
+    __keywords = {
+        "TAUNT": TAUNT,
+        "STEALTH": STEALTH,
+        "DIVINE_SHIELD": DIVINE_SHIELD,
+        "FROZEN": FROZEN,
+        "IMMUNE": IMMUNE,
+    }
+
+    @staticmethod
+    def from_str(keyword_name):
+        return KEYWORD.__keywords[keyword_name.upper()]
+
+    @staticmethod
+    def to_str(keyword_number):
+        keywords = dict(zip(KEYWORD.__keywords.values(), KEYWORD.__keywords.keys()))
+        return keywords[keyword_number].lower()
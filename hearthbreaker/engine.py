@@ -1,5 +1,7 @@
 import copy
+import heapq
 import random
+import hearthbreaker.cards.catalog
 from hearthbreaker.cards.heroes import hero_from_name
 import hearthbreaker.constants
 from hearthbreaker.game_objects import Bindable, GameException, Minion, Hero, Weapon
@@ -28,12 +30,16 @@ def card_lookup(card_name):
     """
     Given a the name of a card as a string, return an object corresponding to that card
 
-    :param str card_name: A string representing the name of the card in English
+    :param card_name: A string representing the name of the card in English, or the card's integer id from
+                      :mod:`hearthbreaker.cards.catalog`
+    :type card_name: str or int
     :return: An instance of a subclass of Card corresponding to the given card name or None if no Card
              by that name exists.
     :rtype: hearthbreaker.game_objects.Card
     """
 
+    if isinstance(card_name, int):
+        card_name = hearthbreaker.cards.catalog.card_name(card_name)
     card = card_table[card_name]
     if card is not None:
         return card()
@@ -49,7 +55,8 @@ def get_cards():
 class Game(Bindable):
     def __init__(self, decks, agents):
         super().__init__()
-        self.delayed_minions = set()
+        self.delayed_queue = []
+        self.delayed_count = 0
         self.first_player = self._generate_random_between(0, 1)
         if self.first_player is 0:
             play_order = [0, 1]
@@ -66,30 +73,127 @@ class Game(Bindable):
         self.__pre_game_run = False
         self.last_card = None
         self._has_turn_ended = True
+        # The player whose secrets can currently be revealed, see SecretCard.secret_triggered
+        self.secret_player = None
         self._all_cards_played = []
         self._turns_passed = 0
         self.selected_card = None
+        self.board_version = 0
+        self.keyword_version = 0
+        self.target_cache = {}
+        self.mana_cache = {}
 
     def random_draw(self, cards, requirement):
-        filtered_cards = [card for card in filter(requirement, cards)]
-        if len(filtered_cards) > 0:
-            return filtered_cards[self._generate_random_between(0, len(filtered_cards) - 1)]
-        return None
+        """
+        Picks a random card (or other object) which meets a requirement.  The matching cards are counted, one random
+        number is generated and then the matching card at that position is found, so no list of matching cards is
+        built.  This uses the random number generator in exactly the same way as picking from a list of the matching
+        cards would.
+
+        :param list cards: The cards to choose from.  This must be a sequence, since it is read twice
+        :param function requirement: A function which returns True for the cards which can be chosen.  It is called
+                                     more than once for each card, so it must not have side effects
+        :return: The chosen card, or None if no card meets the requirement
+        """
+        count = 0
+        for card in cards:
+            if requirement(card):
+                count += 1
+        if count == 0:
+            return None
+        index = self._generate_random_between(0, count - 1)
+        for card in cards:
+            if requirement(card):
+                if index == 0:
+                    return card
+                index -= 1
 
     def random_choice(self, choice):
         return choice[self._generate_random_between(0, len(choice) - 1)]
 
+    def random_choice_from(self, *choices):
+        """
+        Picks a random item from several sequences, as if they had been joined together into one list first.  For
+        example, ``game.random_choice_from(player.minions, [player.hero])`` picks a random character belonging to
+        ``player`` without copying the list of minions.
+
+        :param list choices: The sequences to choose from
+        :return: The chosen item
+        """
+        index = self._generate_random_between(0, sum(len(choice) for choice in choices) - 1)
+        for choice in choices:
+            if index < len(choice):
+                return choice[index]
+            index -= len(choice)
+
     def random_amount(self, minimum, maximum):
         return self._generate_random_between(minimum, maximum)
 
     def _generate_random_between(self, lowest, highest):
         return random.randint(lowest, highest)
 
+    def board_changed(self):
+        """
+        Records that the board has changed, because a minion was added, removed or replaced, a character died, or a
+        new turn started.  Anything computed from the board, such as the targets in :attr:`target_cache`, is
+        discarded.
+        """
+        self.board_version += 1
+        if self.target_cache:
+            self.target_cache = {}
+
+    def mana_changed(self):
+        """
+        Records that an aura or buff which changes the cost of cards has been added or removed, so the costs in
+        :attr:`mana_cache` are discarded.
+        """
+        if self.mana_cache:
+            self.mana_cache = {}
+
+    def queue_delayed(self, character):
+        """
+        Adds a character with delayed events to the queue processed by :meth:`check_delayed`.  Characters are kept in
+        a heap ordered by when they were played, which is the order their events are processed in.
+
+        :param hearthbreaker.game_objects.Character character: The character with delayed events
+        """
+        self.delayed_count += 1
+        heapq.heappush(self.delayed_queue, (character.born, self.delayed_count, character))
+
     def check_delayed(self):
-        sorted_minions = sorted(self.delayed_minions, key=lambda m: m.born)
-        self.delayed_minions = set()
-        for minion in sorted_minions:
-            minion.activate_delayed()
+        """
+        Activates the delayed events of every character queued by :meth:`queue_delayed`, oldest first.  Events which
+        are delayed while this is happening are left for the next call.
+        """
+        if not self.delayed_queue:
+            return
+        queue = self.delayed_queue
+        self.delayed_queue = []
+        while queue:
+            heapq.heappop(queue)[2].activate_delayed()
+
+    def resolve_death(self, minion, by, deathrattle):
+        """
+        Processes the death of a minion, once its delayed ``died`` event has been triggered.  The minion is taken off
+        the board, its deathrattles are run and the ``minion_died`` and ``after_death`` events are triggered.
+
+        :param hearthbreaker.game_objects.Minion minion: The minion which has died
+        :param by: The object which killed the minion, or None
+        :param list deathrattle: The minion's deathrattles when it died, which may since have been silenced
+        """
+        minion.remove_from_board()
+        minion.unattach()
+        if deathrattle is not None:
+            for rattle in deathrattle:
+                rattle.do(minion)
+
+                if minion.player.double_deathrattle:
+                    rattle.do(minion)
+        minion.player.trigger("minion_died", minion, by)
+        # Used to activate any secrets applied during the death phase
+        minion.player.trigger("after_death", minion.player)
+
+        minion.player.graveyard.append(minion.card.card_id)
 
     def pre_game(self):
         if self.__pre_game_run:
@@ -151,6 +255,7 @@ class Game(Bindable):
             self.current_player = self.players[0]
             self.other_player = self.players[1]
             self._turns_passed += 1
+        self.board_changed()
         if self._turns_passed >= 50:
             self.players[0].hero.dead = True
             self.players[1].hero.dead = True
@@ -158,8 +263,7 @@ class Game(Bindable):
         if self.current_player.max_mana < 10:
             self.current_player.max_mana += 1
 
-        for secret in self.other_player.secrets:
-            secret.activate(self.other_player)
+        self.secret_player = self.other_player
         for minion in self.current_player.minions:
             minion.attacks_performed = 0
         self.current_player.mana = self.current_player.max_mana - self.current_player.upcoming_overload
@@ -197,9 +301,9 @@ class Game(Bindable):
             if aura.expires:
                 self.current_player.object_auras.remove(aura)
                 aura.unapply()
+                self.mana_changed()
 
-        for secret in self.other_player.secrets:
-            secret.deactivate(self.other_player)
+        self.secret_player = None
 
         self.check_delayed()
         self._has_turn_ended = True
@@ -208,6 +312,9 @@ class Game(Bindable):
         copied_game = copy.copy(self)
         copied_game.events = {}
         copied_game._all_cards_played = []
+        copied_game.target_cache = {}
+        copied_game.mana_cache = {}
+        copied_game.delayed_queue = []
         copied_game.players = [player.copy(copied_game) for player in self.players]
         if self.current_player is self.players[0]:
             copied_game.current_player = copied_game.players[0]
@@ -219,6 +326,10 @@ class Game(Bindable):
         copied_game.current_player.opponent = copied_game.other_player
         copied_game.other_player.opponent = copied_game.current_player
         copied_game._has_turn_ended = self._has_turn_ended
+        if self.secret_player is None:
+            copied_game.secret_player = None
+        else:
+            copied_game.secret_player = copied_game.players[self.players.index(self.secret_player)]
 
         for player in copied_game.players:
             player.hero.attach(player.hero, player)
@@ -226,9 +337,8 @@ class Game(Bindable):
                 player.weapon.attach(player.hero, player)
             for minion in player.minions:
                 minion.attach(minion, player)
-
-        for secret in copied_game.other_player.secrets:
-            secret.activate(copied_game.other_player)
+            for secret in player.secrets:
+                secret.activate(player)
         return copied_game
 
     def play_card(self, card):
@@ -236,6 +346,8 @@ class Game(Bindable):
             raise GameException("The game has ended")
         if not card.can_use(self.current_player, self):
             raise GameException("That card cannot be used")
+        if card.targetable:
+            card.targets = card.get_targets(self, card.filter_func)
         card_index = self.current_player.hand.index(card)
         self.current_player.hand.pop(card_index)
         self.current_player.mana -= card.mana_cost()
@@ -255,6 +367,7 @@ class Game(Bindable):
             card._placeholder.index = index
             card._placeholder.card = card
             card._placeholder.player = self.current_player
+            self.board_changed()
         self.current_player.trigger("card_played", card, card_index)
 
         if not card.cancel:
@@ -278,6 +391,7 @@ class Game(Bindable):
             'active_player': active_player,
             'current_sequence_id': self.minion_counter,
             'turn_count': self._turns_passed,
+            'turn_ended': self._has_turn_ended,
         }
 
     @staticmethod
@@ -286,12 +400,18 @@ class Game(Bindable):
         new_game._all_cards_played = []
         new_game.minion_counter = d["current_sequence_id"]
         new_game._turns_passed = d['turn_count']
-        new_game.delayed_minions = set()
+        new_game.delayed_queue = []
+        new_game.delayed_count = 0
         new_game.game_ended = False
         new_game.random_func = random.randint
         new_game.events = {}
+        new_game.board_version = 0
+        new_game.keyword_version = 0
+        new_game.target_cache = {}
+        new_game.mana_cache = {}
         new_game.players = [Player.__from_json__(pd, new_game, None) for pd in d["players"]]
-        new_game._has_turn_ended = False
+        # Older saves don't record it, and have always been loaded as if saved during a turn
+        new_game._has_turn_ended = d.get('turn_ended', False)
         if d["active_player"] == 1:
             new_game.current_player = new_game.players[0]
             new_game.other_player = new_game.players[1]
@@ -302,6 +422,8 @@ class Game(Bindable):
             new_game.other_player = new_game.players[0]
             new_game.current_player.opponent = new_game.players[0]
             new_game.other_player.opponent = new_game.players[1]
+        # The opponent's secrets can be revealed during a turn, but nobody's can between turns
+        new_game.secret_player = None if new_game._has_turn_ended else new_game.other_player
 
         index = 0
         for player in new_game.players:
@@ -319,6 +441,8 @@ class Game(Bindable):
                 minion.attach(minion, player)
                 if minion.health != minion.calculate_max_health():
                     minion.enraged = True
+            for secret in player.secrets:
+                secret.activate(player)
             index += 1
         return new_game
 
@@ -424,6 +548,36 @@ class Player(Bindable):
         else:
             return base_heal * self.heal_multiplier
 
+    def playable_cards(self):
+        """
+        Finds the cards in this player's hand which can be played right now.  The cheap check against each card's
+        (cached) mana cost is done first, so that the full :meth:`can_use <hearthbreaker.cards.base.Card.can_use>`
+        check, which may have to look for targets, is only done for cards the player can afford.
+
+        :return: The playable cards, in the order they are in the player's hand
+        :rtype: list[hearthbreaker.cards.base.Card]
+        """
+        return [card for card in self.hand if card.mana_cost() <= self.mana and card.can_use(self, self.game)]
+
+    def minion_keywords(self):
+        """
+        Combines the keywords of all of this player's minions.  For example, if
+        ``player.minion_keywords() & KEYWORD.TAUNT`` is zero, then none of the player's minions have taunt.
+
+        :return: The bitwise or of :attr:`Character.keywords <hearthbreaker.game_objects.Character.keywords>` for
+                 each of this player's minions
+        :rtype: int
+        """
+        key = ("keywords", self)
+        cached = self.game.target_cache.get(key)
+        if cached is None or cached[0] != self.game.keyword_version:
+            keywords = 0
+            for minion in self.minions:
+                keywords |= minion.keywords
+            cached = (self.game.keyword_version, keywords)
+            self.game.target_cache[key] = cached
+        return cached[1]
+
     def put_back(self, card):
         card.unattach()
         self.deck.put_back(card)
@@ -453,6 +607,8 @@ class Player(Bindable):
             self.player_auras.append(aura)
         else:
             self.object_auras.append(aura)
+            if isinstance(aura.status, hearthbreaker.tags.status.ManaChange):
+                self.game.mana_changed()
         if not aura.owner:
             aura.set_owner(self.hero)
         aura.apply()
@@ -465,6 +621,8 @@ class Player(Bindable):
                 if an_aura.eq(aura):
                     self.object_auras.remove(an_aura)
                     aura = an_aura
+                    if isinstance(aura.status, hearthbreaker.tags.status.ManaChange):
+                        self.game.mana_changed()
                     break
         aura.unapply()
 
@@ -483,7 +641,7 @@ class Player(Bindable):
         return {
             'hero': self.hero,
             'deck': self.deck,
-            'graveyard': self.graveyard,
+            'graveyard': [hearthbreaker.cards.catalog.portable_id(card) for card in self.graveyard],
             'hand': self.hand,
             'secrets': [secret.name for secret in self.secrets],
             'weapon': self.weapon,
@@ -519,7 +677,9 @@ class Player(Bindable):
             card.__from_json__(card, **card_def)
             card.attach(card, player)
             player.hand.append(card)
-        player.graveyard = pd["graveyard"]
+        # Older saves list the graveyard by card name, rather than by id
+        player.graveyard = [hearthbreaker.cards.catalog.register(card) if isinstance(card, str) else card
+                            for card in pd["graveyard"]]
 
         player.secrets = []
         for secret_name in pd["secrets"]:
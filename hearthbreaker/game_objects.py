@@ -2,15 +2,39 @@ import abc
 import copy
 from functools import reduce
 import hearthbreaker.constants
+from hearthbreaker.constants import KEYWORD
 
 from hearthbreaker.tags.base import Aura, AuraUntil, Effect, Buff, BuffUntil, Deathrattle
 from hearthbreaker.tags.event import TurnEnded
 from hearthbreaker.tags.selector import CurrentPlayer
 from hearthbreaker.tags.status import Stealth, ChangeAttack, ChangeHealth, SetAttack, Charge, Taunt, DivineShield, \
-    Windfury, NoSpellTarget, SpellDamage, MinimumHealth, CanAttack
+    Windfury, NoSpellTarget, SpellDamage, MinimumHealth, CanAttack, ManaChange
 import hearthbreaker.targeting
 
 
+class _Keyword:
+    """
+    Keeps a bit of :attr:`Character.keywords` in step with a keyword attribute, such as ``taunt``, whenever the
+    attribute is set.  The descriptor has no ``__get__``, so reading the attribute reads the instance dictionary
+    directly and is as quick as reading any other attribute.
+    """
+
+    def __init__(self, name, bit):
+        self.name = name
+        self.bit = bit
+
+    def __set__(self, obj, value):
+        attributes = obj.__dict__
+        attributes[self.name] = value
+        if value:
+            attributes['keywords'] = attributes.get('keywords', 0) | self.bit
+        else:
+            attributes['keywords'] = attributes.get('keywords', 0) & ~self.bit
+        game = attributes.get('game')
+        if game is not None:
+            game.keyword_version += 1
+
+
 class GameException(Exception):
     """
     An :class:`Exception` relating to the operation of the game
@@ -79,20 +103,25 @@ class Bindable:
         """
         self.events = {}
 
-    def bind(self, event, function):
+    def bind(self, event, function, prefilter=None):
         """
         Bind a function to an event.  Each time the event is triggered, the function will be called.
 
         :param string event: The event to bind a function to
         :param function function: The function to bind.  The parameters are not checked until it is called, so
                                   ensure its signature matches the parameters called from :meth:`trigger`
+        :param tuple prefilter: An optional ``(key_function, value)`` pair.  If it is given, the function is only
+                                called when ``key_function`` applied to the first argument of the event gives
+                                ``value``.  Each key function is only called once each time the event is triggered,
+                                however many functions use it.  See
+                                :meth:`Condition.prefilter <hearthbreaker.tags.base.Condition.prefilter>`
         :see: :class:`Bindable`
         """
 
         if event not in self.events:
             self.events[event] = []
 
-        self.events[event].append((function, False))
+        self.events[event].append((function, False, prefilter))
 
     def bind_once(self, event, function):
         """
@@ -108,7 +137,7 @@ class Bindable:
         if event not in self.events:
             self.events[event] = []
 
-        self.events[event].append((function, True))
+        self.events[event].append((function, True, None))
 
     def trigger(self, event, *args):
         """
@@ -121,7 +150,16 @@ class Bindable:
         :see: :class:`Bindable`
         """
         if event in self.events:
+            keys = None
             for handler in copy.copy(self.events[event]):
+                if handler[2] is not None:
+                    key_function, value = handler[2]
+                    if keys is None:
+                        keys = {}
+                    if key_function not in keys:
+                        keys[key_function] = key_function(args[0])
+                    if keys[key_function] != value:
+                        continue
                 if handler[1]:
                     self.events[event].remove(handler)
                     # tidy up the events dict so we don't have entries for events with no handlers
@@ -193,10 +231,11 @@ class GameObject:
                                                        if isinstance(buff.status, stat_class) and
                                                        (not buff.condition or buff.condition.evaluate(self, self))],
                       starting_value)
+        # The type is checked before the aura is matched, since most auras don't change the stat being calculated
         stat = reduce(lambda a, b: b.update(self, a), [aura.status
                                                        for player in self.player.game.players
                                                        for aura in player.object_auras
-                                                       if aura.match(self) and isinstance(aura.status, stat_class)],
+                                                       if isinstance(aura.status, stat_class) and aura.match(self)],
                       stat)
 
         return max(0, stat)
@@ -330,6 +369,8 @@ class GameObject:
         self.buffs.append(buff)
         buff.set_owner(self)
         buff.apply()
+        if isinstance(buff.status, ManaChange) and self.player:
+            self.player.game.mana_changed()
 
     def remove_buff(self, buff):
         for a_buff in self.buffs:
@@ -337,6 +378,8 @@ class GameObject:
                 self.buffs.remove(a_buff)
                 break
         buff.unapply()
+        if isinstance(buff.status, ManaChange) and self.player:
+            self.player.game.mana_changed()
 
     def unattach(self):
         if self._attached:
@@ -348,6 +391,8 @@ class GameObject:
             self.auras = []
             for buff in reversed(self.buffs):
                 buff.unapply()
+                if isinstance(buff.status, ManaChange):
+                    self.player.game.mana_changed()
             self.buffs = []
             self._attached = False
 
@@ -359,6 +404,11 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
      This common superclass handles all of the status tags and calculations involved in attacking or being attacked.
     """
 
+    frozen = _Keyword('frozen', KEYWORD.FROZEN)
+    immune = _Keyword('immune', KEYWORD.IMMUNE)
+    stealth = _Keyword('stealth', KEYWORD.STEALTH)
+    divine_shield = _Keyword('divine_shield', KEYWORD.DIVINE_SHIELD)
+
     def __init__(self, attack_power, health, enrage=None, effects=None, auras=None, buffs=None):
         """
         Create a new Character with the given attack power and health
@@ -370,6 +420,8 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         """
         Bindable.__init__(self)
         GameObject.__init__(self, effects, auras, buffs)
+        #: The :class:`KEYWORD <hearthbreaker.constants.KEYWORD>` bits for the keywords this character has
+        self.keywords = 0
         # : The current health of this character
         self.health = health
         # : The maximum health of this character
@@ -432,18 +484,23 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         if not self.can_attack():
             raise GameException("That minion cannot attack")
 
-        found_taunt = False
-        targets = []
-        for enemy in self.player.game.other_player.minions:
-            if enemy.taunt and enemy.can_be_attacked():
-                found_taunt = True
-            if enemy.can_be_attacked():
-                targets.append(enemy)
-
-        if found_taunt:
-            targets = [target for target in targets if target.taunt]
+        opponent = self.player.game.other_player
+        if not opponent.minion_keywords() & (KEYWORD.TAUNT | KEYWORD.STEALTH):
+            # Nothing is hidden or taunting, so everything can be attacked
+            targets = opponent.minions + [opponent.hero]
         else:
-            targets.append(self.player.game.other_player.hero)
+            found_taunt = False
+            targets = []
+            for enemy in opponent.minions:
+                if enemy.taunt and enemy.can_be_attacked():
+                    found_taunt = True
+                if enemy.can_be_attacked():
+                    targets.append(enemy)
+
+            if found_taunt:
+                targets = [target for target in targets if target.taunt]
+            else:
+                targets.append(opponent.hero)
 
         target = self.choose_target(targets)
         self._remove_stealth()
@@ -517,10 +574,15 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
 
         :param string event: The event to set up a delayed trigger for
         :param list args: The arguments to pass to the handler when it is called.
+        :return: The delayed event, which is a dict holding the ``event`` and its ``args``
+        :rtype: dict
         :see: :class:`Bindable`
         """
-        self.delayed.append({'event': event, 'args': args})
-        self.player.game.delayed_minions.add(self)
+        if not self.delayed:
+            self.player.game.queue_delayed(self)
+        delayed = {'event': event, 'args': args}
+        self.delayed.append(delayed)
+        return delayed
 
     def activate_delayed(self):
         """
@@ -528,10 +590,13 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
 
         :see: :meth:`delayed_trigger`
         """
-        for delayed in self.delayed:
+        # Each event is removed before it is triggered, so that it can't be activated twice if its handlers check
+        # for delayed events again
+        while self.delayed:
+            delayed = self.delayed.pop(0)
             self.trigger(delayed['event'], *delayed['args'])
-
-        self.delayed = []
+            if 'deathrattle' in delayed:
+                self.player.game.resolve_death(self, delayed['args'][0], delayed['deathrattle'])
 
     def damage(self, amount, attacker):
         """
@@ -703,9 +768,14 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
 
         :param by: The object that killed this character.  Could be a :class:`Character`, a :class:`spell card <Card>`
                    or None
+        :return: The delayed ``died`` event, as returned by :meth:`delayed_trigger`
+        :rtype: dict
         """
-        self.delayed_trigger("died", by)
+        died = self.delayed_trigger("died", by)
         self.dead = True
+        if self.game:
+            self.game.board_changed()
+        return died
 
     def can_attack(self):
         """
@@ -826,6 +896,8 @@ class Weapon(Bindable, GameObject):
 
 
 class Minion(Character):
+    taunt = _Keyword('taunt', KEYWORD.TAUNT)
+
     def __init__(self, attack, health,
                  deathrattle=None, taunt=False, charge=False, spell_damage=0, divine_shield=False, stealth=False,
                  windfury=False, spell_targetable=True, effects=None, auras=None, buffs=None,
@@ -875,6 +947,7 @@ class Minion(Character):
         for minion in self.player.minions[index + 1:]:
             minion.index += 1
         self.index = index
+        self.game.board_changed()
         self.health += self.calculate_max_health() - self.base_health - self.health_delta
         self.attach(self, self.player)
         for player in self.game.players:
@@ -918,6 +991,7 @@ class Minion(Character):
                 if minion.index > self.index:
                     minion.index -= 1
             self.player.minions.remove(self)
+            self.game.board_changed()
             self.player.trigger("minion_removed", self)
             self.removed = True
             for aura in self.player.object_auras:
@@ -944,6 +1018,7 @@ class Minion(Character):
         if self.index >= len(self.player.minions):
             raise ValueError("Attempting to replace minion with invalid index")
         self.player.minions[self.index] = new_minion
+        self.game.board_changed()
         new_minion.attach(new_minion, self.player)
         for aura in self.player.object_auras:
             if aura.match(new_minion):
@@ -966,27 +1041,13 @@ class Minion(Character):
         super().heal(amount, source)
 
     def die(self, by):
-        # Since deathrattle gets removed by silence, save it
         if not self.dead and not self.removed:
-            deathrattle = self.deathrattle
-
-            def delayed_death(c):
-                self.remove_from_board()
-                self.unattach()
-                if deathrattle is not None:
-                    for rattle in deathrattle:
-                        rattle.do(self)
-
-                        if self.player.double_deathrattle:
-                            rattle.do(self)
-                self.player.trigger("minion_died", self, by)
-                # Used to activate any secrets applied during the death phase
-                self.player.trigger("after_death", self.player)
-
-                self.player.graveyard.append(self.card.name)
-            self.bind_once("died", delayed_death)
-            super().die(by)
+            died = super().die(by)
+            # The game resolves the death when the died event is activated.  Since deathrattle gets removed by
+            # silence, save it with the event
+            died['deathrattle'] = self.deathrattle
             self.player.dead_this_turn.append(self)
+            return died
 
     def silence(self):
         super().silence()
@@ -1006,6 +1067,13 @@ class Minion(Character):
     def is_minion():
         return True
 
+    @property
+    def card_id(self):
+        """
+        The integer id of the card this minion was created from.  See :mod:`hearthbreaker.cards.catalog`
+        """
+        return self.card.card_id
+
     def __str__(self):  # pragma: no cover
         return "({0}) ({1}) {2} at index {3}".format(self.calculate_attack(), self.health, self.card.name, self.index)
 
@@ -1107,7 +1175,8 @@ class Hero(Character):
         return super().calculate_stat(stat_class, starting_value)
 
     def copy(self, new_owner):
-        new_hero = Hero(self.base_health, self.character_class, self.power, new_owner)
+        # The power is copied, since creating the hero points the power at it
+        new_hero = Hero(self.base_health, self.character_class, copy.copy(self.power), new_owner)
         new_hero.health = self.health
         new_hero.armor = self.armor
         new_hero.used_windfury = False
@@ -1141,8 +1210,9 @@ class Hero(Character):
         self.armor += amount
 
     def die(self, by):
-        super().die(by)
+        died = super().die(by)
         self.player.game.game_over()
+        return died
 
     def find_power_target(self):
         targets = hearthbreaker.targeting.find_spell_target(self.player.game, lambda t: t.spell_targetable())
@@ -1165,6 +1235,7 @@ class Hero(Character):
 
         self.player.hero = new_hero
         new_hero.power.hero = new_hero
+        self.game.board_changed()
         new_hero.attach(new_hero, self.player)
         for aura in self.player.object_auras:
             if aura.match(new_hero):
@@ -2,6 +2,7 @@ import re
 import json
 
 import hearthbreaker
+from hearthbreaker.cards.catalog import portable_id
 from hearthbreaker.cards.heroes import hero_from_name
 import hearthbreaker.constants
 from hearthbreaker.engine import Game, card_lookup, Deck
@@ -210,7 +211,7 @@ class Replay:
         if was_filename:
             writer.close()
 
-    def write_json(self, file):
+    def write_json(self, file, card_ids=False):
         """
         Write a replay in the complete json format.  This format is compatible with the netplay format, and is
         also designed to be more future proof.  For more info, see the
@@ -220,6 +221,9 @@ class Replay:
                      where a replay file should be written.  If an IO object, then the IO object should be opened for
                      writing.
         :type file: :class:`str` or :class:`io.TextIOBase`
+        :param bool card_ids: If True, the cards in each deck are written as their integer ids from
+                              :mod:`hearthbreaker.cards.catalog`, rather than by name.  Cards which
+                              are not in the catalog are still written by name.
         """
         was_filename = False
         if 'write' not in dir(file):
@@ -228,8 +232,12 @@ class Replay:
         else:
             writer = file
 
-        header_cards = [{"cards": [card.name for card in self.__shorten_deck(deck.cards)],
-                         "hero": deck.hero.short_name} for deck in self.decks]
+        if card_ids:
+            header_cards = [{"cards": [portable_id(card.card_id) for card in self.__shorten_deck(deck.cards)],
+                             "hero": deck.hero.short_name} for deck in self.decks]
+        else:
+            header_cards = [{"cards": [card.name for card in self.__shorten_deck(deck.cards)],
+                             "hero": deck.hero.short_name} for deck in self.decks]
 
         header = {
             'decks': header_cards,
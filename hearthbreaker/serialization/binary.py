@@ -0,0 +1,329 @@
+import json
+import struct
+import timeit
+from hearthbreaker.cards import catalog
+from hearthbreaker.engine import Game
+from hearthbreaker.serialization.serialization import to_primitive, serialize, deserialize
+
+__doc__ = """
+A compact binary encoding for game states.
+
+The encoding stores exactly the same structure as :func:`hearthbreaker.serialization.serialization.serialize`, so
+decoding it gives a structure which can be passed to :meth:`Game.__from_json__ <hearthbreaker.engine.Game>`.  It is
+smaller and faster to produce than the indented JSON because:
+
+ * Card names are written as their integer ids from :mod:`hearthbreaker.cards.catalog`
+ * Other strings (mostly dict keys) are written once, and referenced by index afterwards
+ * Dicts which appear more than once (such as identical buffs or deck entries) are written once, and referenced by
+   index afterwards
+ * Integers are written as zigzag encoded varints, so most stats take a single byte
+
+Every encoded state starts with a header containing the format version and the size of the card catalog it was
+written with, so that a state can't be silently decoded with a different version, or with a catalog which is missing
+some of its cards.
+"""
+
+#: The version of the binary format written by :func:`serialize_binary`
+FORMAT_VERSION = 2
+
+_MAGIC = b"HBS"
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_STR_REF = 6
+_CARD = 7
+_LIST = 8
+_DICT = 9
+_TREE = 10
+_TREE_REF = 11
+
+_CONSTANTS = [None, False, True]
+
+# Used as hash keys for booleans, so that they aren't confused with 0 and 1
+_TRUE_KEY = object()
+_FALSE_KEY = object()
+
+# Only cards with permanently assigned ids are written as ids
+_card_names = [catalog.card_name(card_id) for card_id in range(catalog.CATALOG_SIZE)]
+_card_ids = {name: card_id for card_id, name in enumerate(_card_names)}
+
+
+def _write_varint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Encoder:
+    def __init__(self):
+        self.card_ids = _card_ids
+        self.strings = {}
+        # Maps the contents of a dict (as a flat tuple of keys and child node keys) to its node number
+        self.nodes = {}
+        # Maps the id of each dict in the structure to its node number
+        self.node_of = {}
+        self.counts = []
+        # Maps node numbers to their index in the decoder's tree table, once they have been written
+        self.trees = {}
+        self.out = bytearray()
+
+    def intern(self, obj):
+        """
+        Assigns a node number to each dict in the structure, so that dicts with identical contents share a number.
+        Returns a hashable key representing obj.
+        """
+        obj_type = type(obj)
+        if obj_type is dict:
+            key = tuple([(k, self.intern(v)) for k, v in obj.items()])
+            node = self.nodes.get(key)
+            if node is None:
+                node = len(self.counts)
+                self.nodes[key] = node
+                self.counts.append(1)
+            else:
+                self.counts[node] += 1
+            self.node_of[id(obj)] = node
+            return node,
+        if obj_type is list:
+            return tuple(["l"] + [self.intern(v) for v in obj])
+        if obj_type is bool:
+            return _TRUE_KEY if obj else _FALSE_KEY
+        if obj_type is float:
+            return "f", obj
+        return obj
+
+    def write_str(self, value):
+        index = self.strings.get(value)
+        if index is not None:
+            self.out.append(_STR_REF)
+            _write_varint(self.out, index)
+        else:
+            self.strings[value] = len(self.strings)
+            encoded = value.encode("utf-8")
+            self.out.append(_STR)
+            _write_varint(self.out, len(encoded))
+            self.out.extend(encoded)
+
+    def write(self, obj):
+        out = self.out
+        obj_type = type(obj)
+        if obj_type is int:
+            out.append(_INT)
+            _write_varint(out, (obj << 1) if obj >= 0 else ((-obj << 1) - 1))
+        elif obj_type is str:
+            card_id = self.card_ids.get(obj)
+            if card_id is not None:
+                out.append(_CARD)
+                _write_varint(out, card_id)
+            else:
+                self.write_str(obj)
+        elif obj_type is dict:
+            node = self.node_of[id(obj)]
+            shared = self.counts[node] > 1
+            if shared and node in self.trees:
+                out.append(_TREE_REF)
+                _write_varint(out, self.trees[node])
+                return
+            out.append(_TREE if shared else _DICT)
+            _write_varint(out, len(obj))
+            for key, value in obj.items():
+                self.write_str(key)
+                self.write(value)
+            if shared:
+                self.trees[node] = len(self.trees)
+        elif obj_type is list:
+            out.append(_LIST)
+            _write_varint(out, len(obj))
+            for value in obj:
+                self.write(value)
+        elif obj is None:
+            out.append(_NONE)
+        elif obj is True:
+            out.append(_TRUE)
+        elif obj is False:
+            out.append(_FALSE)
+        elif obj_type is float:
+            out.append(_FLOAT)
+            out.extend(struct.pack("<d", obj))
+        else:
+            raise TypeError("Cannot encode object of type {}".format(obj_type.__name__))
+
+
+def _decoder(data, pos):
+    """
+    Creates a function which reads values out of data, starting from pos.  Returns a pair of the function for reading
+    values, and the function for reading bare varints.
+    """
+    card_names = _card_names
+    strings = []
+    trees = []
+
+    def read_varint():
+        nonlocal pos
+        result = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read():
+        nonlocal pos
+        tag = data[pos]
+        if tag <= _TRUE:
+            pos += 1
+            return _CONSTANTS[tag]
+        elif tag == _FLOAT:
+            value = struct.unpack_from("<d", data, pos + 1)[0]
+            pos += 9
+            return value
+        # Every other tag is followed by a varint, which is usually a single byte
+        length = data[pos + 1]
+        if length < 0x80:
+            pos += 2
+        else:
+            pos += 1
+            length = read_varint()
+        if tag == _STR_REF:
+            return strings[length]
+        elif tag == _INT:
+            return (length >> 1) if not length & 1 else -((length + 1) >> 1)
+        elif tag == _CARD:
+            return card_names[length]
+        elif tag == _DICT or tag == _TREE:
+            result = {}
+            for i in range(length):
+                key = read()
+                result[key] = read()
+            if tag == _TREE:
+                trees.append(result)
+            return result
+        elif tag == _TREE_REF:
+            return trees[length]
+        elif tag == _LIST:
+            return [read() for i in range(length)]
+        elif tag == _STR:
+            value = data[pos:pos + length].decode("utf-8")
+            pos += length
+            strings.append(value)
+            return value
+        raise ValueError("Unknown tag {} in binary game state".format(tag))
+
+    return read, read_varint
+
+
+def encode(structure):
+    """
+    Encode a structure of dicts, lists, strings and numbers (such as the one produced by
+    :func:`hearthbreaker.serialization.serialization.to_primitive`) in the binary format.
+
+    Dicts with identical contents will be decoded as the same object, so the decoded structure should be treated as
+    read only.
+
+    :param structure: The structure to encode
+    :rtype: bytes
+    """
+    encoder = _Encoder()
+    encoder.out.extend(_MAGIC)
+    encoder.out.append(FORMAT_VERSION)
+    _write_varint(encoder.out, len(encoder.card_ids))
+    encoder.intern(structure)
+    encoder.write(structure)
+    return bytes(encoder.out)
+
+
+def decode(data):
+    """
+    Decode a structure previously encoded with :func:`encode`
+
+    :param bytes data: The encoded structure
+    :return: The decoded structure
+    :raises ValueError: if the data was not written by this version of the format, or was written with cards which
+                        are not in the catalog
+    """
+    data = bytes(data)
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("Not a binary game state")
+    version = data[len(_MAGIC)]
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported binary game state version {}".format(version))
+    read, read_varint = _decoder(data, len(_MAGIC) + 1)
+    if read_varint() > len(_card_names):
+        raise ValueError("Binary game state was written with a newer card catalog")
+    return read()
+
+
+def serialize_binary(game):
+    """
+    Encode the given game instance in the compact binary format.  The result can be used to re-construct the game
+    exactly as it is now, just as with :func:`hearthbreaker.serialization.serialization.serialize`
+
+    :param hearthbreaker.engine.Game game: The game to serialize
+    :rtype: bytes
+    """
+    return encode(to_primitive(game))
+
+
+def deserialize_binary(data, agents):
+    """
+    Decode the given game instance from the compact binary format.
+
+    :param bytes data: The encoded game, as produced by :func:`serialize_binary`
+    :param agents: The agents for the two players
+    :rtype: :class:`hearthbreaker.engine.Game`
+    """
+    return Game.__from_json__(decode(data), agents)
+
+
+def benchmark(game, number=100):
+    """
+    Compare the binary format against the JSON format for encoding and decoding the given game.
+
+    :param hearthbreaker.engine.Game game: The game to encode and decode
+    :param int number: The number of times to run each operation
+    :return: A dict containing the size in bytes of each encoding, and the average time in seconds taken to
+             encode the game, to decode its structure, and to rebuild a full game from it
+    """
+    agents = [player.agent for player in game.players]
+    json_data = serialize(game)
+    binary_data = serialize_binary(game)
+    return {
+        'json_size': len(json_data.encode("utf-8")),
+        'binary_size': len(binary_data),
+        'json_encode': timeit.timeit(lambda: serialize(game), number=number) / number,
+        'binary_encode': timeit.timeit(lambda: serialize_binary(game), number=number) / number,
+        'json_decode': timeit.timeit(lambda: json.loads(json_data), number=number) / number,
+        'binary_decode': timeit.timeit(lambda: decode(binary_data), number=number) / number,
+        'json_load': timeit.timeit(lambda: deserialize(json_data, agents), number=number) / number,
+        'binary_load': timeit.timeit(lambda: deserialize_binary(binary_data, agents), number=number) / number,
+    }
+
+
+if __name__ == "__main__":
+    import random
+    from hearthbreaker.agents.basic_agents import RandomAgent
+    from hearthbreaker.cards.heroes import hero_for_class
+    from hearthbreaker.constants import CHARACTER_CLASS
+    from hearthbreaker.engine import Deck, get_cards
+
+    random.seed(1857)
+    cards = [card for card in get_cards() if card.character_class in [CHARACTER_CLASS.ALL, CHARACTER_CLASS.MAGE]]
+    deck_cards = [type(random.choice(cards))() for i in range(30)]
+    game = Game([Deck(deck_cards, hero_for_class(CHARACTER_CLASS.MAGE)),
+                 Deck([type(card)() for card in deck_cards], hero_for_class(CHARACTER_CLASS.MAGE))],
+                [RandomAgent(), RandomAgent()])
+    game.pre_game()
+    for turn in range(12):
+        game.play_single_turn()
+        if game.game_ended:
+            break
+    for name, value in sorted(benchmark(game).items()):
+        print("{:>14}: {}".format(name, value))
@@ -13,6 +13,25 @@ def _load_object(d):
     return Game.__from_json__(d)
 
 
+def to_primitive(obj):
+    """
+    Convert the given game (or any other object with a ``__to_json__`` method) into the structure of dicts, lists,
+    strings and numbers that :func:`serialize` writes out.  The result is the same as decoding the output of
+    :func:`serialize`, but without the round trip through a string.
+
+    :param obj: The object to convert
+    :return: A structure made only of dicts, lists, strings, numbers, booleans and None
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key if isinstance(key, str) else str(key): to_primitive(value) for key, value in obj.items()}
+    if obj_type is list or obj_type is tuple:
+        return [to_primitive(value) for value in obj]
+    if obj is None or obj_type is str or obj_type is int or obj_type is bool or obj_type is float:
+        return obj
+    return to_primitive(obj.__to_json__())
+
+
 def serialize(game):
     """
     Encode the given game instance as a JSON formatted string.  This string can be used to re-construct the game exactly
@@ -36,6 +55,130 @@ def deserialize(json_string, agents):
     return Game.__from_json__(d, agents)
 
 
+def _size(delta):
+    """
+    A rough measure of how much data a delta carries, used to choose between alternative deltas
+    """
+    if type(delta) is list:
+        return 1 + sum(_size(item) for item in delta)
+    elif type(delta) is dict:
+        return 1 + sum(_size(item) for item in delta.values())
+    return 1
+
+
+def _same(old, new):
+    # Equality which also tells True from 1 and 1 from 1.0, so that a change of type is still sent
+    if type(old) is not type(new):
+        return False
+    if type(old) is dict:
+        return len(old) == len(new) and all(key in new and _same(value, new[key]) for key, value in old.items())
+    if type(old) is list:
+        return len(old) == len(new) and all(_same(old_item, new_item) for old_item, new_item in zip(old, new))
+    return old == new
+
+
+def _diff(old, new):
+    if _same(old, new):
+        return None
+    if type(old) is dict and type(new) is dict:
+        changed = {}
+        for key, value in new.items():
+            if key in old:
+                delta = _diff(old[key], value)
+                if delta is not None:
+                    changed[key] = delta
+            else:
+                changed[key] = ["=", value]
+        return ["d", changed, [key for key in old if key not in new]]
+    if type(old) is list and type(new) is list:
+        return _diff_list(old, new)
+    return ["=", new]
+
+
+def _diff_list(old, new):
+    shortest = min(len(old), len(new))
+    prefix = 0
+    while prefix < shortest and _same(old[prefix], new[prefix]):
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and _same(old[-1 - suffix], new[-1 - suffix]):
+        suffix += 1
+    shift = len(old) - len(new)
+    items = []
+    for index in range(prefix, len(new) - suffix):
+        # Compare each new item with the old item in the same place, and with the one in the place it would have
+        # been in if a block of items had been added or removed, so that a minion dying doesn't resend the board
+        best = ["=", new[index]]
+        best_size = _size(best)
+        for old_index in [index, index + shift]:
+            if prefix <= old_index < len(old) - suffix:
+                delta = _diff(old[old_index], new[index])
+                delta_size = _size(delta) if delta is not None else 0
+                if delta_size < best_size:
+                    best = ["t", old_index, delta]
+                    best_size = delta_size
+        items.append(best)
+    return ["l", prefix, suffix, items]
+
+
+def diff(old_state, new_state):
+    """
+    Calculate the difference between two game states.  The result can be sent to anyone holding ``old_state``, who
+    can then use :func:`apply_diff` to produce ``new_state``.  Between consecutive moves in a game, the difference
+    is much smaller than the state itself.
+
+    The difference is made only of dicts, lists, strings and numbers, so it can be sent as JSON, or using
+    :func:`hearthbreaker.serialization.binary.encode`.
+
+    :param old_state: The state to calculate the difference from.  Either a :class:`hearthbreaker.engine.Game` or its
+                      structure as returned by :func:`to_primitive`
+    :param new_state: The state to calculate the difference to, in the same form as ``old_state``
+    :return: The difference between the two states, or None if they are the same
+    """
+    return _diff(to_primitive(old_state), to_primitive(new_state))
+
+
+def apply_diff(state, delta):
+    """
+    Apply a difference calculated by :func:`diff` to a state.  The state is not modified.  Instead, a new state is
+    returned, which shares any parts of the structure that did not change.
+
+    :param state: The structure of the old state, as returned by :func:`to_primitive`
+    :param delta: The difference calculated by :func:`diff`
+    :return: The structure of the new state, which can be passed to :meth:`hearthbreaker.engine.Game.__from_json__`
+    """
+    if delta is None:
+        return state
+    op = delta[0]
+    if op == "=":
+        return delta[1]
+    elif op == "d":
+        new_state = {}
+        removed = delta[2]
+        changed = delta[1]
+        for key, value in state.items():
+            if key in changed:
+                new_state[key] = apply_diff(value, changed[key])
+            elif key not in removed:
+                new_state[key] = value
+        for key, value in changed.items():
+            if key not in state:
+                new_state[key] = apply_diff(None, value)
+        return new_state
+    elif op == "l":
+        prefix, suffix, items = delta[1:]
+        new_state = state[:prefix]
+        for item in items:
+            if item[0] == "t":
+                new_state.append(apply_diff(state[item[1]], item[2]))
+            else:
+                new_state.append(item[1])
+        if suffix:
+            new_state.extend(state[-suffix:])
+        return new_state
+    raise ValueError("Unknown difference operation {}".format(op))
+
+
 if __name__ == "__main__":
     game = generate_game_for([LightsJustice, EyeForAnEye], FlameImp, CardTestingAgent, CardTestingAgent)
     for turn in range(0, 5):
@@ -1,9 +1,45 @@
 import abc
 import copy
+import importlib
 import json
+import re
 import string
 
 
+class _Registry:
+    """
+    Maps the names used for tags in JSON (such as ``"change_attack"``) to the classes which implement them.
+
+    The table is filled in from the classes defined in ``module`` the first time it is used, so that decoding a tag is
+    a single dict lookup, rather than converting its name and searching the module for every node.
+    """
+
+    def __init__(self, module, suffix=""):
+        self.module = module
+        self.suffix = suffix
+        self.classes = {}
+
+    def lookup(self, name):
+        cls = self.classes.get(name)
+        if cls is None:
+            cls = self._find(name)
+        return cls
+
+    def _find(self, name):
+        module = importlib.import_module(self.module)
+        if not self.classes:
+            for cls in vars(module).values():
+                if isinstance(cls, type) and cls.__module__ == self.module and cls.__name__.endswith(self.suffix):
+                    cls_name = cls.__name__[:len(cls.__name__) - len(self.suffix)]
+                    self.classes[re.sub("(?<!^)(?=[A-Z])", "_", cls_name).lower()] = cls
+            if name in self.classes:
+                return self.classes[name]
+        # Fall back to searching the module, which also finds classes it imports from elsewhere
+        cls = getattr(module, string.capwords(name, '_').replace("_", "") + self.suffix)
+        self.classes[name] = cls
+        return cls
+
+
 class JSONObject(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
@@ -35,7 +71,10 @@ class Tag(JSONObject):
         new = cls.__new__(cls)
         memo[id(self)] = new
         for attribute, value in self.__dict__.items():
-            if attribute != "owner":
+            if attribute == "_compiled":
+                # Compiled tags refer to their own nodes, so the copy will be compiled again if it is used
+                continue
+            elif attribute != "owner":
                 setattr(new, attribute, copy.deepcopy(value, memo))
             else:
                 setattr(new, attribute, None)
@@ -195,6 +234,8 @@ class AuraUntil(Aura):
 
 
 class Player(metaclass=abc.ABCMeta):
+    _classes = {}
+
     @abc.abstractmethod
     def get_players(self, target):
         pass
@@ -205,25 +246,25 @@ class Player(metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name):
-        from hearthbreaker.tags.selector import FriendlyPlayer, EnemyPlayer, BothPlayer, PlayerOne, \
-            PlayerTwo, CurrentPlayer, OtherPlayer
-        if name == "friendly":
-            return FriendlyPlayer()
-        elif name == "enemy":
-            return EnemyPlayer()
-        elif name == "both":
-            return BothPlayer()
-        elif name == "player_one":
-            return PlayerOne()
-        elif name == "player_two":
-            return PlayerTwo()
-        elif name == "current_player":
-            return CurrentPlayer()
-        elif name == "other_player":
-            return OtherPlayer()
+        if not Player._classes:
+            from hearthbreaker.tags.selector import FriendlyPlayer, EnemyPlayer, BothPlayer, PlayerOne, \
+                PlayerTwo, CurrentPlayer, OtherPlayer
+            Player._classes.update({
+                "friendly": FriendlyPlayer,
+                "enemy": EnemyPlayer,
+                "both": BothPlayer,
+                "player_one": PlayerOne,
+                "player_two": PlayerTwo,
+                "current_player": CurrentPlayer,
+                "other_player": OtherPlayer,
+            })
+        cls = Player._classes.get(name)
+        if cls:
+            return cls()
 
 
 class Picker(JSONObject, metaclass=abc.ABCMeta):
+    _classes = {}
 
     @abc.abstractmethod
     def pick(self, source, targets):
@@ -231,18 +272,24 @@ class Picker(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, count=0):
-        from hearthbreaker.tags.selector import UserPicker, AllPicker, RandomPicker
-        if name == "user":
-            return UserPicker()
-        elif name == "all":
-            return AllPicker()
-        elif name == "random":
-            return RandomPicker(count)
-        else:
+        if not Picker._classes:
+            from hearthbreaker.tags.selector import UserPicker, AllPicker, RandomPicker
+            Picker._classes.update({
+                "user": UserPicker,
+                "all": AllPicker,
+                "random": RandomPicker,
+            })
+        cls = Picker._classes.get(name)
+        if cls is None:
             raise TypeError("What are you even doing?")
+        if name == "random":
+            return cls(count)
+        return cls()
 
 
 class Selector(JSONObject, metaclass=abc.ABCMeta):
+    _registry = _Registry("hearthbreaker.tags.selector", "Selector")
+
     @abc.abstractmethod
     def get_targets(self, source, target=None):
         pass
@@ -256,15 +303,13 @@ class Selector(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.selector as selector_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "") + "Selector"
-        cls = getattr(selector_mod, cls_name)
+        cls = Selector._registry.lookup(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
 class Action(JSONObject, metaclass=abc.ABCMeta):
+    _registry = _Registry("hearthbreaker.tags.action")
 
     @abc.abstractmethod
     def act(self, actor, target, other=None):
@@ -272,15 +317,14 @@ class Action(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.action as action_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(action_mod, cls_name)
+        cls = Action._registry.lookup(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
 class Status(JSONObject, metaclass=abc.ABCMeta):
+    _registry = _Registry("hearthbreaker.tags.status")
+
     @abc.abstractmethod
     def act(self, actor, target):
         pass
@@ -291,10 +335,7 @@ class Status(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.status as status_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(status_mod, cls_name)
+        cls = Status._registry.lookup(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -351,6 +392,8 @@ class Amount(abc.ABCMeta):
 
 
 class Event(JSONObject, metaclass=abc.ABCMeta):
+    _registry = _Registry("hearthbreaker.tags.event")
+
     def __init__(self, event_name, condition=None):
         self.event_name = event_name
         self.condition = condition
@@ -371,10 +414,7 @@ class Event(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(event_name, **kwargs):
-        import hearthbreaker.tags.event as event_mod
-
-        cls_name = string.capwords(event_name, '_').replace("_", "")
-        cls = getattr(event_mod, cls_name)
+        cls = Event._registry.lookup(event_name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -413,7 +453,7 @@ class MinionEvent(Event):
         if self.condition:
             self.__target__ = target
             self.__func__ = func
-            target.bind(self.event_name, self.__action__)
+            target.bind(self.event_name, self.__action__, self.condition.prefilter())
         else:
             target.bind(self.event_name, func)
 
@@ -434,7 +474,7 @@ class PlayerEvent(Event):
             if self.condition:
                 self.__target__ = target
                 self.__func__ = func
-                player.bind(self.event_name, self.__action__)
+                player.bind(self.event_name, self.__action__, self.condition.prefilter())
             else:
                 player.bind(self.event_name, func)
 
@@ -503,16 +543,39 @@ class Effect(Tag):
 
 
 class Condition(JSONObject, metaclass=abc.ABCMeta):
+    _registry = _Registry("hearthbreaker.tags.condition")
+
     @abc.abstractmethod
     def evaluate(self, target, *args):
         pass
 
+    def is_stable(self):
+        """
+        Checks if the result of this condition for a given source and object can only change when the board changes,
+        (see :meth:`Game.board_changed <hearthbreaker.engine.Game.board_changed>`).  Selectors whose conditions
+        are stable can reuse the targets they found until the board changes.
+
+        :return: True if the condition depends only on which characters are on the board, False otherwise
+        :rtype: bool
+        """
+        return False
+
+    def prefilter(self):
+        """
+        Describes a cheap test which an object must pass for this condition to be true, so that events can skip their
+        handlers without evaluating the condition (see :meth:`Bindable.bind
+        <hearthbreaker.game_objects.Bindable.bind>`).  The test may let through objects for which the condition is
+        false, but it must never reject an object for which the condition is true.
+
+        :return: A ``(key_function, value)`` pair, where ``key_function`` takes the object being checked and has no
+                 side effects, or None if there is no such test
+        :rtype: tuple
+        """
+        return None
+
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.condition as action_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(action_mod, cls_name)
+        cls = Condition._registry.lookup(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -577,6 +640,8 @@ class Spell(ActionTag):
 
 
 class CardQuery(JSONObject, metaclass=abc.ABCMeta):
+    _classes = {}
+
     def __init__(self):
         pass
 
@@ -590,26 +655,26 @@ class CardQuery(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(query):
-        from hearthbreaker.tags.card_source import SpecificCard, CardList, HandSource, \
-            DeckSource, CollectionSource, ObjectSource, LastCard, Same
+        from hearthbreaker.tags.card_source import SpecificCard, CardList
         if isinstance(query, str):
             return SpecificCard.__from_json__(query)
         elif isinstance(query, list):
             return CardList.__from_json__(query)
-        elif query['name'] == 'object':
-            return ObjectSource.__from_json__(**query)
-        elif query['name'] == 'hand':
-            return HandSource.__from_json__(**query)
-        elif query['name'] == 'deck':
-            return DeckSource.__from_json__(**query)
-        elif query['name'] == 'collection':
-            return CollectionSource.__from_json__(**query)
-        elif query['name'] == 'last_card':
-            return LastCard()
-        elif query['name'] == 'same':
-            return Same()
-        else:
+        if not CardQuery._classes:
+            from hearthbreaker.tags.card_source import HandSource, DeckSource, CollectionSource, ObjectSource, \
+                LastCard, Same
+            CardQuery._classes.update({
+                "object": ObjectSource,
+                "hand": HandSource,
+                "deck": DeckSource,
+                "collection": CollectionSource,
+                "last_card": LastCard,
+                "same": Same,
+            })
+        cls = CardQuery._classes.get(query['name'])
+        if cls is None:
             raise Exception(query['name'])
+        return cls.__from_json__(**query)
 
 
 class Battlecry(ActionTag):
@@ -639,16 +704,14 @@ class Choice(ActionTag):
 
 
 class Function(JSONObject, metaclass=abc.ABCMeta):
+    _registry = _Registry("hearthbreaker.tags.selector")
 
     def do(self, target, *args):
         pass
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.selector as selector_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(selector_mod, cls_name)
+        cls = Function._registry.lookup(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -12,14 +12,11 @@ class CardSource(CardQuery, metaclass=abc.ABCMeta):
 
     def get_card(self, target, player, owner):
         card_list = self.get_list(target, player, owner)
-
-        def check_condition(condition):
-            return lambda c: condition.evaluate(target, c)
-
-        for condition in self.conditions:
-            card_list = filter(check_condition(condition), card_list)
-
-        card_list = [card for card in card_list]
+        if self.conditions:
+            card_list = [card for card in card_list
+                         if all(condition.evaluate(target, card) for condition in self.conditions)]
+        else:
+            card_list = list(card_list)
         card_len = len(card_list)
         if card_len == 1:
             return card_list[0]
@@ -0,0 +1,270 @@
+from hearthbreaker.tags.base import ActionTag
+from hearthbreaker.tags.action import Damage, Heal, Draw, IncreaseArmor, Kill, Give
+from hearthbreaker.tags.condition import MinionIsNotTarget, IsMinion, Not, And
+from hearthbreaker.tags.selector import FriendlyPlayer, EnemyPlayer, BothPlayer, AllPicker, PlayerSelector, \
+    SelfSelector, TargetSelector, MinionSelector, CharacterSelector, HeroSelector
+
+__doc__ = """
+An optional compiler for :class:`ActionTag <hearthbreaker.tags.base.ActionTag>` trees.
+
+Normally each tag is interpreted every time it is run.  :meth:`ActionTag.do <hearthbreaker.tags.base.ActionTag.do>`
+evaluates its condition, asks its selector for targets (which asks its players, then checks every minion with
+``match``, then asks its picker) and then calls ``act`` on each action, which looks up its amount.  The compiler
+generates a single Python function for each tag which does all of this inline, for the most common kinds of
+selectors, conditions, players, pickers and actions.  Anything it doesn't know how to compile is called through its
+normal methods from inside the generated function, so every tag can be compiled.
+
+The generated code only depends on the types of the nodes in the tree (and on a few of their settings, such as
+integer amounts), so it is compiled once for each shape of tree and shared between every tag with that shape, such as
+the battlecries of every copy of a card.  Each tag is then given its own closure over its own nodes.
+
+Compilation is opt-in.  Call :func:`enable` to compile tags the first time they are run, and :func:`disable` to go
+back to interpreting them.  Neither can be called while ``ActionTag.do`` is wrapped by something else, such as an
+enabled :class:`Instrumentation <hearthbreaker.tools.instrument.Instrumentation>`, since replacing it would throw the
+wrapper away.
+"""
+
+# Maps the source of each generated factory to the factory
+_factories = {}
+
+_interpreted_do = ActionTag.do
+
+
+class _Builder:
+    """
+    Collects the lines of a generated function, and the objects it refers to.  The objects are passed as arguments to
+    a factory function, so that the same generated code can be used with different objects.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.constants = []
+        self.names = 0
+
+    def constant(self, obj):
+        self.constants.append(obj)
+        return "c{}".format(len(self.constants) - 1)
+
+    def name(self, prefix):
+        self.names += 1
+        return "{}{}".format(prefix, self.names)
+
+    def emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+
+def _condition(builder, condition, source, obj):
+    """
+    Returns an expression equivalent to ``condition.evaluate(source, obj)``
+    """
+    condition_type = type(condition)
+    if condition_type is MinionIsNotTarget:
+        return "({} is not {})".format(obj, source)
+    elif condition_type is IsMinion:
+        return "{}.is_minion()".format(obj)
+    elif condition_type is Not:
+        return "(not {})".format(_condition(builder, condition.condition, source, obj))
+    elif condition_type is And and condition.conditions:
+        return "({})".format(" and ".join([_condition(builder, c, source, obj) for c in condition.conditions]))
+    return "{}({}, {})".format(builder.constant(condition.evaluate), source, obj)
+
+
+def _get_players(builder, players, source_player):
+    """
+    Returns an expression equivalent to ``players.get_players(source_player)``
+    """
+    players_type = type(players)
+    if players_type is FriendlyPlayer:
+        return "[{}]".format(source_player)
+    elif players_type is EnemyPlayer:
+        return "[{}.opponent]".format(source_player)
+    elif players_type is BothPlayer:
+        return "[{0}.opponent, {0}]".format(source_player)
+    return "{}({})".format(builder.constant(players.get_players), source_player)
+
+
+def _match_player(builder, players, source, obj):
+    """
+    Returns an expression equivalent to ``players.match(source, obj)``
+    """
+    players_type = type(players)
+    if players_type is FriendlyPlayer:
+        return "{}.player is {}.player".format(obj, source)
+    elif players_type is EnemyPlayer:
+        return "{}.player is {}.player.opponent".format(obj, source)
+    elif players_type is BothPlayer:
+        return "True"
+    return "{}({}, {})".format(builder.constant(players.match), source, obj)
+
+
+def _pick(builder, indent, picker, targets):
+    """
+    Emits the statements which replace ``targets`` with ``picker.pick(owner, targets)``
+    """
+    if type(picker) is not AllPicker:
+        builder.emit(indent, "{0} = {1}(owner, {0})".format(targets, builder.constant(picker.pick)))
+
+
+def _filter(builder, indent, selector, items, targets, check_dead=True):
+    """
+    Emits the statements which add every item from ``items`` matching the selector's players and condition to
+    ``targets``
+    """
+    item = builder.name("m")
+    checks = []
+    if check_dead:
+        checks.append("not {}.dead".format(item))
+    checks.append(_match_player(builder, selector.players, "owner", item))
+    if selector.condition:
+        checks.append(_condition(builder, selector.condition, "owner", item))
+    checks = [check for check in checks if check != "True"]
+    builder.emit(indent, "for {} in {}:".format(item, items))
+    if checks:
+        builder.emit(indent + 1, "if {}:".format(" and ".join(checks)))
+        builder.emit(indent + 2, "{}.append({})".format(targets, item))
+    else:
+        builder.emit(indent + 1, "{}.append({})".format(targets, item))
+
+
+def _select(builder, indent, selector):
+    """
+    Emits the statements which set ``targets`` to ``selector.choose_targets(owner, target)``
+    """
+    selector_type = type(selector)
+    if selector_type is SelfSelector:
+        builder.emit(indent, "targets = [owner]")
+    elif selector_type is PlayerSelector:
+        builder.emit(indent, "targets = {}".format(_get_players(builder, selector.players, "owner.player")))
+    elif selector_type is TargetSelector:
+        if selector.condition:
+            builder.emit(indent, "targets = [target] if {} else []".format(
+                _condition(builder, selector.condition, "owner", "target")))
+        else:
+            builder.emit(indent, "targets = [target]")
+    elif selector_type is HeroSelector:
+        builder.emit(indent, "players = {}".format(
+            _get_players(builder, selector.players, "(owner if owner.is_player() else owner.player)")))
+        builder.emit(indent, "targets = [p.hero for p in players]")
+        _pick(builder, indent, selector.picker, "targets")
+    elif selector_type is MinionSelector or selector_type is CharacterSelector:
+        # Every object in a player's minions is a Minion, so the is_card and is_minion checks in match can be skipped
+        builder.emit(indent, "targets = []")
+        builder.emit(indent, "players = {}".format(_get_players(builder, selector.players, "owner.player")))
+        builder.emit(indent, "for p in players:")
+        _filter(builder, indent + 1, selector, "p.minions", "targets")
+        if selector_type is CharacterSelector:
+            hero = builder.name("m")
+            builder.emit(indent, "for p in players:")
+            builder.emit(indent + 1, "{} = p.hero".format(hero))
+            _filter(builder, indent + 1, selector, "[{}]".format(hero), "targets")
+        _pick(builder, indent, selector.picker, "targets")
+    else:
+        builder.emit(indent, "targets = {}(owner, target)".format(builder.constant(selector.choose_targets)))
+
+
+def _act(builder, indent, action):
+    """
+    Emits the statements equivalent to ``action.act(owner, t, other)``
+    """
+    action_type = type(action)
+    amount = getattr(action, "amount", None)
+    if action_type is Damage and type(amount) is int:
+        builder.emit(indent, "t.damage({}, owner)".format(amount))
+    elif action_type is Heal and type(amount) is int:
+        builder.emit(indent, "t.heal(owner.player.effective_heal_power({}), owner)".format(amount))
+    elif action_type is Draw and type(amount) is int:
+        builder.emit(indent, "for i in range(0, {}):".format(amount))
+        builder.emit(indent + 1, "t.draw()")
+    elif action_type is IncreaseArmor and type(amount) is int:
+        builder.emit(indent, "t.armor += {}".format(amount))
+    elif action_type is Kill:
+        builder.emit(indent, "t.die(None)")
+    elif action_type is Give and type(action.picker) is AllPicker:
+        builder.emit(indent, "for buff in {}:".format(builder.constant(action.buffs)))
+        builder.emit(indent + 1, "t.add_buff(buff.to_instance(t))")
+    else:
+        builder.emit(indent, "{}(owner, t, other)".format(builder.constant(action.act)))
+
+
+def _generate(tag):
+    builder = _Builder()
+    builder.emit(1, "def do(owner, target=None, other=None):")
+    if tag.condition:
+        builder.emit(2, "if not {}:".format(_condition(builder, tag.condition, "owner", "target")))
+        builder.emit(3, "return")
+    _select(builder, 2, tag.selector)
+    builder.emit(2, "found_target = False")
+    builder.emit(2, "for t in targets:")
+    builder.emit(3, "found_target = True")
+    builder.emit(3, "if t is owner or t.is_valid():")
+    for action in tag.actions:
+        _act(builder, 4, action)
+    builder.emit(2, "return found_target")
+    builder.emit(1, "return do")
+    arguments = ", ".join(["c{}".format(index) for index in range(len(builder.constants))])
+    return "def make({}):\n{}\n".format(arguments, "\n".join(builder.lines)), builder.constants
+
+
+def compile_tag(tag):
+    """
+    Compile an :class:`ActionTag <hearthbreaker.tags.base.ActionTag>` into a function which behaves the same way as
+    its :meth:`do <hearthbreaker.tags.base.ActionTag.do>` method.
+
+    :param hearthbreaker.tags.base.ActionTag tag: The tag to compile
+    :return: A function taking the same arguments as ``tag.do``
+    """
+    source, constants = _generate(tag)
+    factory = _factories.get(source)
+    if factory is None:
+        namespace = {}
+        exec(compile(source, "<compiled {}>".format(type(tag).__name__), "exec"), namespace)
+        factory = namespace["make"]
+        _factories[source] = factory
+    return factory(*constants)
+
+
+def _compiled_do(self, owner, target=None, other=None):
+    # The compiled function is thrown away if the tag's nodes are replaced, so that it never runs stale nodes
+    compiled = self.__dict__.get("_compiled")
+    if compiled is None or compiled[0] is not self.selector or compiled[1] is not self.condition or \
+            compiled[2] is not self.actions:
+        compiled = (self.selector, self.condition, self.actions, compile_tag(self))
+        self._compiled = compiled
+    return compiled[3](owner, target, other)
+
+
+def _switch(do):
+    if ActionTag.do is not _compiled_do and ActionTag.do is not _interpreted_do:
+        raise RuntimeError("Tag compilation can't be switched while ActionTag.do is wrapped")
+    ActionTag.do = do
+
+
+def enable():
+    """
+    Compile each :class:`ActionTag <hearthbreaker.tags.base.ActionTag>` the first time it is run, and run the compiled
+    version from then on.
+
+    :raises RuntimeError: If ``ActionTag.do`` is wrapped by something else
+    """
+    _switch(_compiled_do)
+
+
+def disable():
+    """
+    Go back to interpreting every :class:`ActionTag <hearthbreaker.tags.base.ActionTag>`
+
+    :raises RuntimeError: If ``ActionTag.do`` is wrapped by something else
+    """
+    _switch(_interpreted_do)
+
+
+def is_enabled():
+    """
+    :return: True if tags are being compiled, whether or not ``ActionTag.do`` is wrapped by something else
+    :rtype: bool
+    """
+    do = ActionTag.do
+    # Follow the wrappers by hand, since inspect.unwrap needs Python 3.4
+    while hasattr(do, "__wrapped__"):
+        do = do.__wrapped__
+    return do is _compiled_do
@@ -1,8 +1,40 @@
 import hearthbreaker
-from hearthbreaker.constants import MINION_TYPE
+from hearthbreaker.constants import MINION_TYPE, KEYWORD
 from hearthbreaker.tags.base import Condition, Amount
 
 
+# Key functions for Condition.prefilter.  Each one is shared by every condition which uses it, so that it is only
+# called once each time an event is triggered.
+def _is_minion(obj):
+    return obj.is_minion()
+
+
+def _is_spell(obj):
+    return obj.is_spell()
+
+
+def _is_secret(obj):
+    return obj.is_secret()
+
+
+def _is_weapon(obj):
+    return obj.is_weapon()
+
+
+def _is_hero(obj):
+    return obj.is_hero()
+
+
+def _minion_type(obj):
+    if not obj.is_minion():
+        return None
+    if obj.is_card():
+        return obj.minion_type
+    if obj.card:
+        return obj.card.minion_type
+    return None
+
+
 class HasSecret(Condition):
     def evaluate(self, target, *args):
         return len(target.player.secrets) > 0
@@ -17,6 +49,12 @@ class IsSecret(Condition):
     def evaluate(self, target, obj, *args):
         return obj.is_secret()
 
+    def is_stable(self):
+        return True
+
+    def prefilter(self):
+        return _is_secret, True
+
     def __to_json__(self):
         return {
             'name': 'is_secret'
@@ -27,6 +65,12 @@ class IsSpell(Condition):
     def evaluate(self, target, obj, *args):
         return obj.is_spell()
 
+    def is_stable(self):
+        return True
+
+    def prefilter(self):
+        return _is_spell, True
+
     def __to_json__(self):
         return {
             'name': 'is_spell'
@@ -84,6 +128,12 @@ class IsMinion(Condition):
     def evaluate(self, target, minion, *args):
         return minion.is_minion()
 
+    def is_stable(self):
+        return True
+
+    def prefilter(self):
+        return _is_minion, True
+
     def __to_json__(self):
         return {
             "name": 'is_minion'
@@ -104,6 +154,12 @@ class IsWeapon(Condition):
     def evaluate(self, target, weapon, *args):
         return weapon.is_weapon()
 
+    def is_stable(self):
+        return True
+
+    def prefilter(self):
+        return _is_weapon, True
+
     def __to_json__(self):
         return {
             "name": 'is_weapon'
@@ -124,6 +180,9 @@ class MinionIsTarget(Condition):
     def evaluate(self, target, minion, *args):
         return minion is target
 
+    def is_stable(self):
+        return True
+
     def __to_json__(self):
         return {
             'name': 'minion_is_target'
@@ -134,6 +193,9 @@ class MinionIsNotTarget(Condition):
     def evaluate(self, target, minion, *args):
         return minion is not target
 
+    def is_stable(self):
+        return True
+
     def __to_json__(self):
         return {
             'name': 'minion_is_not_target'
@@ -158,6 +220,9 @@ class Not(Condition):
     def evaluate(self, target, *args):
         return not self.condition.evaluate(target, *args)
 
+    def is_stable(self):
+        return self.condition.is_stable()
+
     def __to_json__(self):
         return {
             'name': 'not',
@@ -180,6 +245,19 @@ class And(Condition):
                 return False
         return True
 
+    def is_stable(self):
+        for condition in self.conditions:
+            if not condition.is_stable():
+                return False
+        return True
+
+    def prefilter(self):
+        for condition in self.conditions:
+            prefilter = condition.prefilter()
+            if prefilter:
+                return prefilter
+        return None
+
     def __to_json__(self):
         return {
             'name': 'and',
@@ -209,6 +287,12 @@ class IsType(Condition):
                 return minion.minion_type == self.minion_type
         return False
 
+    def is_stable(self):
+        return True
+
+    def prefilter(self):
+        return _minion_type, self.minion_type
+
     def __to_json__(self):
         return {
             'name': 'is_type',
@@ -267,6 +351,10 @@ class HasBattlecry(Condition):
 class HasStatus(Condition):
     def __init__(self, status):
         self.status = status
+        try:
+            self._keyword = KEYWORD.from_str(status)
+        except KeyError:
+            self._keyword = 0
 
     def __to_json__(self):
         return {
@@ -275,6 +363,8 @@ class HasStatus(Condition):
         }
 
     def evaluate(self, target, minion, *args):
+        if self._keyword:
+            return minion.keywords & self._keyword != 0
         return getattr(minion, self.status)
 
 
@@ -294,6 +384,9 @@ class IsRarity(Condition):
         else:
             return minion.card.rarity == self.rarity
 
+    def is_stable(self):
+        return True
+
 
 class MinionCountIs(Condition):
     def __init__(self, count):
@@ -350,6 +443,9 @@ class Adjacent(Condition):
         return minion.player is target.player and \
             (minion.index == target.index - 1) or (minion.index == target.index + 1)
 
+    def is_stable(self):
+        return True
+
 
 class TargetAdjacent(Condition):
     def __to_json__(self):
@@ -436,7 +532,13 @@ class InGraveyard(Condition):
             self.card = card.ref_name
 
     def evaluate(self, target, *args):
-        return self.card in target.player.graveyard or self.card in target.player.opponent.graveyard
+        from hearthbreaker.cards.catalog import card_id
+        try:
+            graveyard_id = card_id(self.card)
+        except KeyError:
+            # A card which has never been registered can't have been put in a graveyard
+            return False
+        return graveyard_id in target.player.graveyard or graveyard_id in target.player.opponent.graveyard
 
     def __to_json__(self):
         return {
@@ -499,6 +601,9 @@ class IsHero(Condition):
     def evaluate(self, target, character, *args):
         return character.is_hero()
 
+    def prefilter(self):
+        return _is_hero, True
+
     def __to_json__(self):
         return {
             'name': 'is_hero'
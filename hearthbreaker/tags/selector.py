@@ -3,6 +3,22 @@ from hearthbreaker.tags.base import Selector, Player, Picker, Function, Amount,
 import hearthbreaker.tags.condition
 
 
+def _cached_targets(selector, source, find_targets):
+    """
+    Returns the targets ``find_targets`` finds for ``source``, reusing the ones found last time if the board hasn't
+    changed since.  Only selectors whose conditions are stable (see
+    :meth:`Condition.is_stable <hearthbreaker.tags.base.Condition.is_stable>`) can use this.
+    """
+    cache = source.player.game.target_cache
+    # The cached entry keeps the selector and source alive, so their ids can't be reused while it exists
+    key = (id(selector), id(source))
+    cached = cache.get(key)
+    if cached is None:
+        cached = (selector, source, find_targets(source))
+        cache[key] = cached
+    return list(cached[2])
+
+
 class FriendlyPlayer(Player):
     def match(self, source, obj):
         return obj.player is source.player
@@ -106,15 +122,24 @@ class UserPicker(Picker):
         }
 
 
+def _is_alive(target):
+    return not (target.is_minion() and target.dead)
+
+
 class RandomPicker(Picker):
     def __init__(self, count=1):
         self.count = count
 
     def pick(self, source, targets):
-        for i in range(self.count):
-            if len(targets) > 0:
-                yield source.player.game.random_choice(targets)
-            targets = [target for target in filter(lambda t: not (t.is_minion() and t.dead), targets)]
+        # Minions which die are left out of later picks.  Death is permanent, so rather than filtering the list after
+        # each pick, the dead minions are skipped as each target is drawn
+        if self.count > 0 and len(targets) > 0:
+            yield source.player.game.random_choice(targets)
+        for i in range(1, self.count):
+            target = source.player.game.random_draw(targets, _is_alive)
+            if target is None:
+                return
+            yield target
 
     def __to_json__(self):
         return {
@@ -247,6 +272,11 @@ class MinionSelector(Selector):
         self.picker = picker
 
     def get_targets(self, source, obj=None):
+        if not self.condition or self.condition.is_stable():
+            return _cached_targets(self, source, self._find_targets)
+        return self._find_targets(source)
+
+    def _find_targets(self, source):
         players = self.players.get_players(source.player)
         targets = []
         for p in players:
@@ -342,6 +372,11 @@ class CharacterSelector(Selector):
         self.picker = picker
 
     def get_targets(self, source, obj=None):
+        if not self.condition or self.condition.is_stable():
+            return _cached_targets(self, source, self._find_targets)
+        return self._find_targets(source)
+
+    def _find_targets(self, source):
         players = self.players.get_players(source.player)
         targets = []
         for p in players:
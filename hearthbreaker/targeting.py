@@ -1,67 +1,150 @@
-import copy
+__doc__ = """
+Functions for finding the possible targets of spells, hero powers and battlecries.
 
+Each ``find_*`` function takes the game and a filter function, and returns the characters the filter accepts, in a
+fixed order:  the other player's minions, the current player's minions, the other player's hero and then the current
+player's hero, leaving out the ones that don't apply.  The candidates for each kind of target are only collected once
+for each version of the board (see :meth:`Game.board_changed <hearthbreaker.engine.Game.board_changed>`), but the
+filter is always run, since it usually checks things like stealth which can change without the board changing.
 
-def find_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.extend(game.current_player.minions)
-    targets.append(game.other_player.hero)
-    targets.append(game.current_player.hero)
+:func:`has_target` and :func:`count_targets` answer the same questions without building a list.
+"""
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
 
+def _spell_candidates(game):
+    candidates = game.target_cache.get("spell")
+    if candidates is None:
+        candidates = tuple(game.other_player.minions) + tuple(game.current_player.minions) + \
+            (game.other_player.hero, game.current_player.hero)
+        game.target_cache["spell"] = candidates
+    return candidates
 
-def find_enemy_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.append(game.other_player.hero)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+def _enemy_candidates(game):
+    candidates = game.target_cache.get("enemy")
+    if candidates is None:
+        candidates = tuple(game.other_player.minions) + (game.other_player.hero,)
+        game.target_cache["enemy"] = candidates
+    return candidates
 
 
-def find_friendly_spell_target(game, filter_function):
-    targets = copy.copy(game.current_player.minions)
-    targets.append(game.current_player.hero)
+def _friendly_candidates(game):
+    candidates = game.target_cache.get("friendly")
+    if candidates is None:
+        candidates = tuple(game.current_player.minions) + (game.current_player.hero,)
+        game.target_cache["friendly"] = candidates
+    return candidates
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
 
+def _minion_candidates(game):
+    candidates = game.target_cache.get("minion")
+    if candidates is None:
+        candidates = tuple(game.other_player.minions) + tuple(game.current_player.minions)
+        game.target_cache["minion"] = candidates
+    return candidates
 
-def find_minion_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.extend(game.current_player.minions)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+def _enemy_minion_candidates(game):
+    return game.other_player.minions
 
 
-def find_enemy_minion_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
+def _friendly_minion_candidates(game):
+    return game.current_player.minions
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
 
+def find_spell_target(game, filter_function):
+    return [target for target in _spell_candidates(game) if filter_function(target)]
 
-def find_friendly_minion_spell_target(game, filter_function):
-    targets = copy.copy(game.current_player.minions)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+def find_enemy_spell_target(game, filter_function):
+    return [target for target in _enemy_candidates(game) if filter_function(target)]
 
 
-def find_enemy_minion_battlecry_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
+def find_friendly_spell_target(game, filter_function):
+    return [target for target in _friendly_candidates(game) if filter_function(target)]
+
+
+def find_minion_spell_target(game, filter_function):
+    return [target for target in _minion_candidates(game) if filter_function(target)]
+
+
+def find_enemy_minion_spell_target(game, filter_function):
+    return [target for target in game.other_player.minions if filter_function(target)]
+
 
-    targets = [target for target in targets if filter_function(target)]
-    if len(targets) is 0:
+def find_friendly_minion_spell_target(game, filter_function):
+    return [target for target in game.current_player.minions if filter_function(target)]
+
+
+def find_enemy_minion_battlecry_target(game, filter_function):
+    targets = [target for target in game.other_player.minions if filter_function(target)]
+    if len(targets) == 0:
         return None
     return targets
 
 
 def find_friendly_minion_battlecry_target(game, filter_function):
-    targets = copy.copy(game.current_player.minions)
-
-    targets = [target for target in targets if filter_function(target)]
-    if len(targets) is 0:
+    targets = [target for target in game.current_player.minions if filter_function(target)]
+    if len(targets) == 0:
         return None
     return targets
+
+
+_candidates = {
+    find_spell_target: _spell_candidates,
+    find_enemy_spell_target: _enemy_candidates,
+    find_friendly_spell_target: _friendly_candidates,
+    find_minion_spell_target: _minion_candidates,
+    find_enemy_minion_spell_target: _enemy_minion_candidates,
+    find_friendly_minion_spell_target: _friendly_minion_candidates,
+}
+
+
+def has_target(game, target_function, filter_function):
+    """
+    Checks if a card with the given target function could be played, without building the list of targets.
+
+    :param hearthbreaker.engine.Game game: The game to look for targets in
+    :param function target_function: One of the ``find_*`` functions in this module, or any other function which
+                                     takes a game and a filter function
+    :param function filter_function: The filter to pass to ``target_function``
+    :return: False if ``target_function`` would return an empty list, True otherwise.  The battlecry functions
+             return None when there are no targets, which doesn't stop a card from being played, so they always give
+             True
+    :rtype: bool
+    """
+    candidates = _candidates.get(target_function)
+    if candidates is None:
+        if target_function is find_enemy_minion_battlecry_target or \
+                target_function is find_friendly_minion_battlecry_target:
+            return True
+        targets = target_function(game, filter_function)
+        return targets is None or len(targets) > 0
+    for target in candidates(game):
+        if filter_function(target):
+            return True
+    return False
+
+
+def count_targets(game, target_function, filter_function):
+    """
+    Counts the targets ``target_function`` would find, without building the list of targets.
+
+    :param hearthbreaker.engine.Game game: The game to look for targets in
+    :param function target_function: One of the ``find_*`` functions in this module, or any other function which
+                                     takes a game and a filter function
+    :param function filter_function: The filter to pass to ``target_function``
+    :return: The number of targets found, which is 0 if ``target_function`` returns None
+    :rtype: int
+    """
+    candidates = _candidates.get(target_function)
+    if candidates is None:
+        targets = target_function(game, filter_function)
+        if targets is None:
+            return 0
+        return len(targets)
+    count = 0
+    for target in candidates(game):
+        if filter_function(target):
+            count += 1
+    return count
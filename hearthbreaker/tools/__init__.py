@@ -0,0 +1,12 @@
+import sys
+
+__doc__ = """
+Tools for running large numbers of simulated games, and for making sense of their results.
+
+Unlike the rest of Hearthbreaker, the tools need Python 3.8 or later, since they use :mod:`asyncio`,
+:mod:`multiprocessing.shared_memory` and :func:`gc.freeze`.  :data:`SUPPORTED` says whether they can be used with the
+running version of Python.
+"""
+
+#: True if the running version of Python is new enough for the tools
+SUPPORTED = sys.version_info >= (3, 8)
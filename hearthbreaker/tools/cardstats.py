@@ -0,0 +1,254 @@
+import argparse
+import csv
+import multiprocessing
+import os
+import tempfile
+from multiprocessing import shared_memory, resource_tracker
+from hearthbreaker.cards.catalog import CATALOG_SIZE, card_id, card_name
+from hearthbreaker.tools.simulation import play_game
+
+__doc__ = """
+Per-card statistics gathered from many games, in memory shared between the worker processes playing them.
+
+For every card in the :mod:`card catalog <hearthbreaker.cards.catalog>`, the table counts how many times it was drawn
+and played, how many times it was drawn and played by the player who went on to win, and which turn it was played on.
+The table is a single block of :mod:`shared memory <multiprocessing.shared_memory>` holding a 64 bit counter for each
+card id and each of :data:`COLUMNS`, so nothing is sent back from the workers for each game.
+
+Each worker counts the cards in its games with a :class:`CardCounter`, which only touches memory private to the
+worker, and adds its counts to the shared table under a lock once at the end of each batch with
+:meth:`CardCounter.flush`.  The table can be read at any time, including while the games are being played, either a
+card at a time or all at once as a NumPy array.  NumPy is only needed for :meth:`CardStatistics.to_numpy`.
+
+A :class:`JobRunner <hearthbreaker.tools.jobs.JobRunner>` fills a table given to :meth:`run
+<hearthbreaker.tools.jobs.JobRunner.run>`.  The table only counts the games played while it was being filled, so a
+resumed job only counts the games played after it was resumed.
+
+The counts for the games in a job manifest can also be found from the command line::
+
+    python -m hearthbreaker.tools.cardstats overnight.json cards.csv
+"""
+
+DRAWN = 0
+PLAYED = 1
+DRAWN_BY_WINNER = 2
+PLAYED_BY_WINNER = 3
+#: The column counting the cards played on the first turn.  The columns after it count the later turns, and the last
+#: one counts every turn from :data:`TURNS` onwards.
+FIRST_TURN = 4
+#: The number of turns given their own column
+TURNS = 20
+
+#: The names of the counters kept for each card
+COLUMNS = ["drawn", "played", "drawn_by_winner", "played_by_winner"] + \
+    ["turn_{}".format(turn) for turn in range(1, TURNS)] + ["turn_{}+".format(TURNS)]
+
+_WIDTH = len(COLUMNS)
+# The number of games is kept in an extra counter after the table
+_GAMES = CATALOG_SIZE * _WIDTH
+
+
+class CardStatistics:
+    """
+    A table of counters for every card, in shared memory
+    """
+
+    def __init__(self, name=None, tracked=False):
+        """
+        Create a new table with every counter at zero, or attach to an existing one
+
+        :param str name: The name of the shared memory holding a table created in another process, or None to create
+                         a new table
+        :param bool tracked: True if the process which created the table shares this process's resource tracker, as
+                             the processes started by :mod:`multiprocessing` do.  Otherwise this process has its own
+                             tracker, which would remove the table when this process exits, so the table is taken off
+                             it.  Only the process which created the table should remove it.
+        """
+        if name is None:
+            self._memory = shared_memory.SharedMemory(create=True, size=(_GAMES + 1) * 8)
+            self._owner = True
+            self._tracked = True
+        else:
+            self._memory = shared_memory.SharedMemory(name)
+            if not tracked:
+                resource_tracker.unregister(self._memory._name, "shared_memory")
+            self._owner = False
+            self._tracked = tracked
+        self.counts = self._memory.buf.cast("q")
+        self.lock = multiprocessing.Lock()
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory, which can be used to attach to the table from another process
+        """
+        return self._memory.name
+
+    @property
+    def games(self):
+        """
+        The number of games counted so far
+        """
+        return self.counts[_GAMES]
+
+    def count(self, ref_name, column):
+        """
+        :param str ref_name: The reference name of a card
+        :param int column: The index of the counter, such as :data:`PLAYED`
+        :return: The value of one of the card's counters
+        :rtype: int
+        :raises KeyError: if the card isn't in the :mod:`card catalog <hearthbreaker.cards.catalog>`, since only the
+                          cards in the catalog are counted
+        """
+        index = card_id(ref_name)
+        if index >= CATALOG_SIZE:
+            raise KeyError("{} isn't in the card catalog, so it isn't counted".format(ref_name))
+        return self.counts[index * _WIDTH + column]
+
+    def rows(self):
+        """
+        :return: The reference name and counters of every card which has been drawn or played, in the order of their
+                 ids
+        :rtype: list[(str, list[int])]
+        """
+        with self.lock:
+            values = self.counts.tolist()
+        rows = []
+        for index in range(CATALOG_SIZE):
+            row = values[index * _WIDTH:(index + 1) * _WIDTH]
+            if row[DRAWN] or row[PLAYED]:
+                rows.append((card_name(index), row))
+        return rows
+
+    def to_numpy(self):
+        """
+        Copy the table into a NumPy array
+
+        :return: An array with a row for every card id, and a column for each of :data:`COLUMNS`
+        :rtype: numpy.ndarray
+        """
+        import numpy
+        with self.lock:
+            return numpy.frombuffer(self._memory.buf, dtype=numpy.int64, count=_GAMES).reshape(
+                (CATALOG_SIZE, _WIDTH)).copy()
+
+    def write_csv(self, filename):
+        """
+        Write the counters of every card which has been drawn or played to a CSV file
+
+        :param str filename: The file to write to
+        """
+        with open(filename, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["card"] + COLUMNS)
+            for ref_name, row in self.rows():
+                writer.writerow([ref_name] + row)
+
+    def close(self):
+        """
+        Stop using the table in this process.  The process which created the table also removes it.
+        """
+        self.counts.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        # Only called when the table is sent to a new process as it starts, which is the only time the lock can be sent.
+        # That process is started by multiprocessing, so it shares this process's resource tracker, which is only the
+        # creator's tracker if this process's is.
+        return self.name, self.lock, self._tracked
+
+    def __setstate__(self, state):
+        name, lock, tracked = state
+        self.__init__(name, tracked)
+        self.lock = lock
+
+
+class CardCounter:
+    """
+    Counts the cards in games played by one process, until they are added to a :class:`CardStatistics` table
+    """
+
+    def __init__(self):
+        #: The counts since the last flush, by their position in the table
+        self.counts = {}
+        self.games = 0
+        self._drawn = None
+        self._played = None
+
+    def _add(self, card, column):
+        index = card.card_id
+        if index < CATALOG_SIZE:
+            position = index * _WIDTH + column
+            self.counts[position] = self.counts.get(position, 0) + 1
+
+    def _watch(self, game):
+        # The opening hands have been drawn, but the first turn hasn't started
+        self._drawn = [[card for card in player.hand if card.ref_name != "The Coin"] for player in game.players]
+        self._played = [[], []]
+        for drawn, played, player in zip(self._drawn, self._played, game.players):
+            player.bind("card_drawn", drawn.append)
+            player.bind("card_played", lambda card, index, played=played: played.append((card, game._turns_passed)))
+
+    def play(self, decks, agents, seed):
+        """
+        Play a game with :func:`play_game <hearthbreaker.tools.simulation.play_game>`, and count its cards
+
+        :return: The result of the game
+        :rtype: hearthbreaker.tools.simulation.GameResult
+        """
+        result = play_game(decks, agents, seed, observer=self._watch)
+        # The first player in the game is the one given the deck which went first
+        winner = None if result.winner is None else (0 if result.winner == result.first else 1)
+        for player in range(2):
+            for card in self._drawn[player]:
+                self._add(card, DRAWN)
+                if player == winner:
+                    self._add(card, DRAWN_BY_WINNER)
+            for card, turn in self._played[player]:
+                self._add(card, PLAYED)
+                if player == winner:
+                    self._add(card, PLAYED_BY_WINNER)
+                self._add(card, FIRST_TURN + min(turn, TURNS) - 1)
+        self._drawn = None
+        self._played = None
+        self.games += 1
+        return result
+
+    def flush(self, table):
+        """
+        Add the counts to a table, and start counting again from zero
+
+        :param CardStatistics table: The table to add the counts to
+        """
+        with table.lock:
+            counts = table.counts
+            for position, count in self.counts.items():
+                counts[position] += count
+            counts[_GAMES] += self.games
+        self.counts = {}
+        self.games = 0
+
+
+if __name__ == "__main__":
+    from hearthbreaker.tools.jobs import JobRunner, read_manifest
+
+    parser = argparse.ArgumentParser(description="Count how often each card is drawn and played in a job manifest")
+    parser.add_argument("manifest", help="The JSON file listing the games to play")
+    parser.add_argument("output", help="The CSV file to write the counts for each card to")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    args = parser.parse_args()
+
+    # The games are played from scratch every time, so that all of them are counted
+    with CardStatistics() as statistics, tempfile.TemporaryDirectory() as directory:
+        runner = JobRunner(read_manifest(args.manifest), os.path.join(directory, "games.csv"))
+        runner.run(args.processes, card_stats=statistics)
+        statistics.write_csv(args.output)
+        print("Counted the cards in {} games".format(statistics.games))
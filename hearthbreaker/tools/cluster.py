@@ -0,0 +1,448 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hearthbreaker.tools.jobs import Job, decode_deck, encode_deck, play_job_batch, read_manifest
+from hearthbreaker.tools.matchup import MatchupResult
+
+__doc__ = """
+Simulation jobs shared between worker processes on several machines.
+
+A :class:`Coordinator` splits a list of :class:`Job <hearthbreaker.tools.jobs.Job>` into batches of seeds, and listens
+for :class:`Worker` connections over TCP.  The two sides exchange JSON messages, one per line:
+
+ * A worker starts with ``hello``, and is sent ``jobs`` once.  It lists every deck once, and the agents and seeds
+   for every job, with the job's decks given by their position in the list
+ * A worker sends ``request`` for each batch it has room for, and the coordinator answers with a ``batch``, giving the
+   job and the range of seeds, as soon as one is available
+ * A worker sends back a ``result`` for each batch, holding the seed, winner, first player, turns and duration of each
+   game, followed by another ``request``.  If a batch can't be played, or a message from the coordinator can't be
+   read, the worker sends ``error`` instead, and the coordinator stops
+ * A worker sends ``heartbeat`` every few seconds, even while it is busy playing games
+ * Once every batch is finished, the coordinator sends ``done`` to every worker
+
+Batches are only ever sent in answer to a request, so a worker never has more batches than it has processes to play
+them, and the batches not yet handed out are never sent anywhere.  If a worker disconnects, or hasn't sent anything for
+longer than the timeout, the batches it was playing go back to the front of the queue for another worker.  A result
+for a batch which was already finished, such as from a worker which was only slow, is ignored.  A message longer
+than :data:`MESSAGE_LIMIT` can't be read, and stops the coordinator as an error rather than being retried.
+
+A coordinator can start its own workers on the same machine, so the whole thing can be tried out, or tested, without a
+second machine::
+
+    python -m hearthbreaker.tools.cluster coordinator overnight.json --port 7777 --local 4
+
+and more workers can join from other machines::
+
+    python -m hearthbreaker.tools.cluster worker coordinator-host:7777 --processes 8
+"""
+
+
+#: The longest message, in bytes, that either side can read
+MESSAGE_LIMIT = 64 * 1024 * 1024
+
+
+def _encode(message):
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+async def _read(reader):
+    # The next line, or an empty one once the connection is closed
+    try:
+        return await reader.readline()
+    except ValueError:
+        # Raised by readline for a line longer than the limit, which can't be skipped over
+        raise RuntimeError("A message was longer than the limit of {} bytes".format(MESSAGE_LIMIT))
+
+
+def _encode_jobs(jobs):
+    # Every deck is sent once, however many jobs it is in
+    decks = {}
+    entries = []
+    for job in jobs:
+        entries.append({"decks": [decks.setdefault(deck, len(decks)) for deck in job.decks],
+                        "agents": list(job.agents), "seeds": [job.seeds.start, job.seeds.stop]})
+    return {"type": "jobs", "decks": [encode_deck(deck) for deck in decks], "jobs": entries}
+
+
+def _decode_jobs(message):
+    decks = [decode_deck(entry) for entry in message["decks"]]
+    return [Job(tuple(decks[index] for index in entry["decks"]), tuple(entry["agents"]), range(*entry["seeds"]))
+            for entry in message["jobs"]]
+
+
+class _Connection:
+    def __init__(self, writer):
+        self.writer = writer
+        self.name = None
+        #: The number of batches the worker has asked for and not been sent
+        self.wanted = 0
+        #: The ids of the batches the worker is playing
+        self.batches = set()
+        self.last_seen = time.monotonic()
+
+    def send(self, message):
+        self.writer.write(_encode(message))
+
+
+class Coordinator:
+    """
+    Hands out batches of games to workers, and collects their results
+    """
+
+    def __init__(self, jobs, batch_size=100, timeout=30.0):
+        """
+        Create a new coordinator
+
+        :param list[hearthbreaker.tools.jobs.Job] jobs: The games to play
+        :param int batch_size: The number of games in each batch
+        :param float timeout: The number of seconds a worker can go without sending anything before its batches are
+                              given to another worker
+        """
+        self.jobs = list(jobs)
+        self.batch_size = batch_size
+        self.timeout = timeout
+        #: The wins, losses and draws for each job, in the same order as :attr:`jobs`
+        self.results = [MatchupResult(job.decks, job.agents) for job in self.jobs]
+        #: The number of times a batch has been taken back from a worker which was lost
+        self.retried = 0
+        #: The port the coordinator is listening on, once it has started
+        self.port = None
+        self._batches = []
+        for index, job in enumerate(self.jobs):
+            for start in range(job.seeds.start, job.seeds.stop, batch_size):
+                self._batches.append((index, start, min(start + batch_size, job.seeds.stop)))
+        self._pending = deque(range(len(self._batches)))
+        self._done = set()
+        self._connections = set()
+        self._closing = []
+        self._server = None
+        self._watcher = None
+        self._finished = None
+        self._error = None
+        self._jobs_message = None
+
+    async def start(self, host="127.0.0.1", port=0):
+        """
+        Start listening for workers
+
+        :param str host: The address to listen on
+        :param int port: The port to listen on, or 0 to pick a free one
+        """
+        self._finished = asyncio.Event()
+        if not self._batches:
+            self._finished.set()
+        self._jobs_message = _encode_jobs(self.jobs)
+        self._server = await asyncio.start_server(self._handle, host, port, limit=MESSAGE_LIMIT)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._watcher = asyncio.ensure_future(self._watch())
+
+    async def wait(self):
+        """
+        Wait until every batch is finished, then tell the workers to stop, and stop listening
+
+        :return: The results of each job
+        :rtype: list[hearthbreaker.tools.matchup.MatchupResult]
+        :raises RuntimeError: If a worker couldn't play one of the batches, or sent a message which couldn't be read
+        """
+        await self._finished.wait()
+        self._watcher.cancel()
+        self._server.close()
+        for connection in list(self._connections):
+            connection.send({"type": "done"})
+            self._drop(connection)
+        await self._server.wait_closed()
+        # Make sure every worker has been disconnected before this returns, even if the caller then blocks
+        await asyncio.gather(*[writer.wait_closed() for writer in self._closing], return_exceptions=True)
+        if self._error is not None:
+            raise RuntimeError(self._error)
+        for result in self.results:
+            result.finished = True
+        return self.results
+
+    def run(self, host="127.0.0.1", port=0, local_workers=0, processes=1):
+        """
+        Play every game, and wait for them to finish
+
+        :param str host: The address to listen on
+        :param int port: The port to listen on, or 0 to pick a free one
+        :param int local_workers: The number of workers to start on this machine
+        :param int processes: The number of processes for each local worker
+        :return: The results of each job
+        :rtype: list[hearthbreaker.tools.matchup.MatchupResult]
+        """
+        async def serve():
+            await self.start(host, port)
+            workers = start_local_workers("127.0.0.1" if host in ("", "0.0.0.0") else host, self.port,
+                                          local_workers, processes)
+            try:
+                return await self.wait()
+            finally:
+                for worker in workers:
+                    worker.join(self.timeout)
+                    if worker.is_alive():
+                        worker.terminate()
+        return asyncio.run(serve())
+
+    @property
+    def finished_batches(self):
+        return len(self._done)
+
+    async def _handle(self, reader, writer):
+        connection = _Connection(writer)
+        self._connections.add(connection)
+        try:
+            while not self._finished.is_set():
+                try:
+                    line = await _read(reader)
+                except RuntimeError as error:
+                    self._error = "Couldn't read a message from {}: {}".format(connection.name, error)
+                    self._finished.set()
+                    break
+                if not line:
+                    break
+                connection.last_seen = time.monotonic()
+                message = json.loads(line.decode("utf-8"))
+                kind = message["type"]
+                if kind == "hello":
+                    connection.name = message.get("name")
+                    connection.send(self._jobs_message)
+                elif kind == "request":
+                    connection.wanted += 1
+                elif kind == "result":
+                    self._finish(connection, message["batch"], message["games"])
+                elif kind == "error":
+                    if message.get("batch") is None:
+                        self._error = "{} stopped: {}".format(connection.name, message["message"])
+                    else:
+                        self._error = "Batch {} failed on {}: {}".format(message["batch"], connection.name,
+                                                                         message["message"])
+                    self._finished.set()
+                self._dispatch()
+                await writer.drain()
+        except (ConnectionError, ValueError, KeyError):
+            pass
+        finally:
+            self._drop(connection)
+
+    def _dispatch(self):
+        for connection in list(self._connections):
+            while connection.wanted > 0 and self._pending:
+                batch = self._pending.popleft()
+                if batch in self._done:
+                    continue
+                job, start, stop = self._batches[batch]
+                connection.wanted -= 1
+                connection.batches.add(batch)
+                connection.send({"type": "batch", "batch": batch, "job": job, "seeds": [start, stop]})
+
+    def _finish(self, connection, batch, games):
+        connection.batches.discard(batch)
+        if batch in self._done:
+            return
+        self._done.add(batch)
+        result = self.results[self._batches[batch][0]]
+        for seed, winner, first, turns, duration in games:
+            if winner is None:
+                result.draws += 1
+            elif winner == 0:
+                result.wins += 1
+            else:
+                result.losses += 1
+        if len(self._done) == len(self._batches):
+            self._finished.set()
+
+    def _drop(self, connection):
+        if connection not in self._connections:
+            return
+        self._connections.discard(connection)
+        # The lost batches are played next, so that the results don't wait on them for long.  Once the coordinator is
+        # stopping, because of an error, there is no one left to play them.
+        if not self._finished.is_set():
+            for batch in sorted(connection.batches, reverse=True):
+                if batch not in self._done:
+                    self._pending.appendleft(batch)
+                    self.retried += 1
+        connection.batches.clear()
+        connection.writer.close()
+        self._closing.append(connection.writer)
+        self._dispatch()
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.timeout / 4)
+            now = time.monotonic()
+            for connection in list(self._connections):
+                if now - connection.last_seen > self.timeout:
+                    self._drop(connection)
+
+
+class Worker:
+    """
+    Connects to a :class:`Coordinator`, and plays the batches it is sent until there are none left
+    """
+
+    def __init__(self, host, port, processes=1, heartbeat=5.0, name=None):
+        """
+        Create a new worker
+
+        :param str host: The address of the coordinator
+        :param int port: The port the coordinator is listening on
+        :param int processes: The number of batches to play at once, each in its own process
+        :param float heartbeat: The number of seconds between heartbeats
+        :param str name: The name the worker gives the coordinator.  Defaults to the host name
+        """
+        self.host = host
+        self.port = port
+        self.processes = processes
+        self.heartbeat = heartbeat
+        self.name = name if name is not None else socket.gethostname()
+        #: The number of batches played
+        self.played = 0
+        # Held while writing a message and waiting for it to drain, see _send
+        self._sending = None
+
+    async def run(self):
+        """
+        Play batches until the coordinator says they are all finished, or the connection is lost
+
+        :return: The number of batches played
+        :rtype: int
+        :raises RuntimeError: If the coordinator sent a message which couldn't be read
+        """
+        # Created here, since before Python 3.10 a lock belongs to the event loop running when it is created
+        self._sending = asyncio.Lock()
+        reader, writer = await asyncio.open_connection(self.host, self.port, limit=MESSAGE_LIMIT)
+        await self._send(writer, {"type": "hello", "name": self.name})
+        try:
+            jobs = _decode_jobs(json.loads((await _read(reader)).decode("utf-8")))
+        except RuntimeError as error:
+            await self._stop(writer, error)
+            writer.close()
+            raise
+        # A single batch is played in a thread, so that the heartbeats are still sent while it plays
+        if self.processes > 1:
+            executor = ProcessPoolExecutor(self.processes)
+        else:
+            executor = ThreadPoolExecutor(1)
+        heartbeat = asyncio.ensure_future(self._beat(writer))
+        playing = set()
+        try:
+            await self._send(writer, *[{"type": "request"}] * self.processes)
+            while True:
+                try:
+                    line = await _read(reader)
+                except RuntimeError as error:
+                    await self._stop(writer, error)
+                    raise
+                if not line:
+                    break
+                message = json.loads(line.decode("utf-8"))
+                if message["type"] == "done":
+                    break
+                if message["type"] == "batch":
+                    task = asyncio.ensure_future(self._play(executor, writer, jobs, message))
+                    playing.add(task)
+                    task.add_done_callback(playing.discard)
+        except ConnectionError:
+            pass
+        finally:
+            heartbeat.cancel()
+            for task in list(playing):
+                task.cancel()
+            executor.shutdown(wait=False)
+            writer.close()
+        return self.played
+
+    async def _stop(self, writer, error):
+        # Tell the coordinator why this worker is stopping, so that it stops too rather than waiting for the worker
+        try:
+            await self._send(writer, {"type": "error", "batch": None, "message": str(error)})
+        except ConnectionError:
+            pass
+
+    async def _play(self, executor, writer, jobs, message):
+        job = jobs[message["job"]]
+        start, stop = message["seeds"]
+        try:
+            index, games = await asyncio.get_running_loop().run_in_executor(
+                executor, play_job_batch, (message["job"], job.decks, job.agents, list(range(start, stop))))
+        except Exception as error:
+            await self._send(writer, {"type": "error", "batch": message["batch"], "message": repr(error)})
+            return
+        self.played += 1
+        await self._send(writer, {"type": "result", "batch": message["batch"], "games": games}, {"type": "request"})
+
+    async def _beat(self, writer):
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            await self._send(writer, {"type": "heartbeat"})
+
+    async def _send(self, writer, *messages):
+        # The batches and the heartbeat all send messages from their own tasks.  Before Python 3.10, a second task
+        # waiting for the writer to drain while the first still is fails, so they take turns.
+        async with self._sending:
+            for message in messages:
+                writer.write(_encode(message))
+            await writer.drain()
+
+
+def _run_worker(host, port, processes, heartbeat):
+    asyncio.run(Worker(host, port, processes, heartbeat).run())
+
+
+def start_local_workers(host, port, count, processes=1, heartbeat=5.0):
+    """
+    Start workers in new processes on this machine
+
+    :param str host: The address of the coordinator
+    :param int port: The port the coordinator is listening on
+    :param int count: The number of workers to start
+    :param int processes: The number of processes for each worker
+    :param float heartbeat: The number of seconds between heartbeats
+    :return: The processes running the workers
+    :rtype: list[multiprocessing.Process]
+    """
+    workers = []
+    for i in range(count):
+        worker = multiprocessing.Process(target=_run_worker, args=(host, port, processes, heartbeat), daemon=False)
+        worker.start()
+        workers.append(worker)
+    return workers
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Share simulation jobs between machines")
+    commands = parser.add_subparsers(dest="command", required=True)
+    coordinator_parser = commands.add_parser("coordinator", help="Hand out the jobs in a manifest to workers")
+    coordinator_parser.add_argument("manifest", help="The JSON file listing the jobs")
+    coordinator_parser.add_argument("--host", default="0.0.0.0", help="The address to listen on")
+    coordinator_parser.add_argument("--port", type=int, default=7777, help="The port to listen on")
+    coordinator_parser.add_argument("--batch-size", type=int, default=100, help="The number of games in each batch")
+    coordinator_parser.add_argument("--timeout", type=float, default=30.0,
+                                    help="The seconds without a heartbeat before a worker's batches are retried")
+    coordinator_parser.add_argument("--local", type=int, default=0, help="The number of workers to start here")
+    coordinator_parser.add_argument("--processes", type=int, default=1, help="The processes for each local worker")
+    worker_parser = commands.add_parser("worker", help="Play games for a coordinator")
+    worker_parser.add_argument("address", help="The coordinator's host and port, as host:port")
+    worker_parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(),
+                               help="The number of batches to play at once")
+    worker_parser.add_argument("--heartbeat", type=float, default=5.0, help="The seconds between heartbeats")
+    args = parser.parse_args()
+
+    if args.command == "worker":
+        coordinator_host, coordinator_port = args.address.rsplit(":", 1)
+        batches_played = asyncio.run(Worker(coordinator_host, int(coordinator_port), args.processes,
+                                            args.heartbeat).run())
+        print("Played {} batches".format(batches_played))
+    else:
+        coordinator = Coordinator(read_manifest(args.manifest), args.batch_size, args.timeout)
+        job_results = coordinator.run(args.host, args.port, args.local, args.processes)
+        for job_result in job_results:
+            print("{:>20} vs {:<20} {:>8} games  {:6.1%}".format(
+                job_result.decks[0].name, job_result.decks[1].name, job_result.games, job_result.win_rate() or 0))
+        print("{} batches retried".format(coordinator.retried))
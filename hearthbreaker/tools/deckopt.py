@@ -0,0 +1,284 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+from collections import Counter
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY
+from hearthbreaker.engine import get_cards
+from hearthbreaker.game_objects import GameException
+from hearthbreaker.tools.simulation import DeckList, play_game, read_deck, write_deck
+
+__doc__ = """
+A genetic search for strong decks.
+
+Each candidate deck is scored by the fraction of its games it wins (counting draws as half) against a gauntlet of
+decks, using the same seeds for every candidate.  Each generation keeps its best decks, and fills the rest of the
+population with children made by mixing the cards of two decks picked by tournament selection, then swapping a few
+cards for random ones.  Every deck is kept legal: 30 cards, all either neutral or from the deck's class, with at most
+two copies of a card and one of a legendary.
+
+A deck's score only depends on its cards, the gauntlet, the agents and the seeds, so scores are remembered by a hash of
+those.  Decks which survive into the next generation, or which are bred more than once, are never played again, and
+the scores can be saved and reused by later searches.  The decks which do need to be played in each generation are
+shared out between worker processes.
+
+A search can also be run from the command line::
+
+    python -m hearthbreaker.tools.deckopt --class warlock --generations 20 --output best.hsdeck zoo.hsdeck patron.hsdeck
+"""
+
+
+def deck_hash(cards):
+    """
+    :param list[str] cards: The names of the cards in a deck
+    :return: A hash of the cards in a deck, which doesn't depend on their order
+    :rtype: str
+    """
+    return hashlib.sha1("\n".join(sorted(cards)).encode("utf-8")).hexdigest()
+
+
+class CardPool:
+    """
+    The cards which can be put in a deck for a particular class, and how many copies of each are allowed
+    """
+
+    def __init__(self, character_class, cards=None):
+        """
+        Create a new card pool
+
+        :param int character_class: The class of the deck, from :class:`hearthbreaker.constants.CHARACTER_CLASS`
+        :param list[hearthbreaker.cards.base.Card] cards: The cards to choose from.  Defaults to every collectible
+                                                          card
+        """
+        if cards is None:
+            cards = get_cards()
+        self.character_class = character_class
+        self.limits = {}
+        for card in cards:
+            if card.character_class == CHARACTER_CLASS.ALL or card.character_class == character_class:
+                self.limits[card.ref_name] = 1 if card.rarity == CARD_RARITY.LEGENDARY else 2
+        self.names = sorted(self.limits.keys())
+
+    def is_legal(self, cards):
+        """
+        :param list[str] cards: The names of the cards in a deck
+        :return: True if the deck has 30 cards, and every card is in this pool without too many copies
+        :rtype: bool
+        """
+        if len(cards) != 30:
+            return False
+        for card, count in Counter(cards).items():
+            if count > self.limits.get(card, 0):
+                return False
+        return True
+
+    def fill(self, cards, rng):
+        """
+        Make a legal deck from a list of cards, by taking cards in order and skipping any which aren't allowed, until
+        there are 30 cards.  If there aren't enough, random cards are added.
+
+        :param list[str] cards: The cards to take from
+        :param random.Random rng: The random number generator used to pick extra cards
+        :return: The sorted names of the cards in the new deck
+        :rtype: tuple[str]
+        """
+        counts = Counter()
+        deck = []
+        for card in cards:
+            if len(deck) == 30:
+                break
+            if counts[card] < self.limits.get(card, 0):
+                counts[card] += 1
+                deck.append(card)
+        while len(deck) < 30:
+            card = rng.choice(self.names)
+            if counts[card] < self.limits[card]:
+                counts[card] += 1
+                deck.append(card)
+        return tuple(sorted(deck))
+
+    def random_deck(self, rng):
+        """
+        :param random.Random rng: The random number generator to pick cards with
+        :return: The sorted names of the cards in a random legal deck
+        :rtype: tuple[str]
+        """
+        return self.fill([], rng)
+
+
+def _score_deck(job):
+    cards, character_class, gauntlet, agents, seeds = job
+    deck = DeckList("candidate", cards, character_class)
+    score = 0.0
+    games = 0
+    for opponent in gauntlet:
+        for seed in seeds:
+            try:
+                winner = play_game((deck, opponent), agents, seed).winner
+            except GameException:
+                # A few rare combinations of cards can break the engine.  The game just doesn't count.
+                continue
+            games += 1
+            if winner is None:
+                score += 0.5
+            elif winner == 0:
+                score += 1
+    if games == 0:
+        return 0.0
+    return score / games
+
+
+class DeckOptimizer:
+    """
+    Searches for a deck which does well against a gauntlet of other decks
+    """
+
+    def __init__(self, character_class, gauntlet, agents=("Random", "Random"), games=20, population=20, elite=4,
+                 mutations=2, seed=0, pool=None, memo=None):
+        """
+        Create a new optimizer
+
+        :param int character_class: The class to build a deck for
+        :param list[DeckList] gauntlet: The decks each candidate plays against
+        :param agents: The names of the agents playing the candidate, and the gauntlet deck
+        :type agents: (str, str)
+        :param int games: The number of games each candidate plays against each gauntlet deck
+        :param int population: The number of decks in each generation
+        :param int elite: The number of the best decks copied unchanged into the next generation
+        :param int mutations: The number of cards swapped for random ones in each child
+        :param int seed: The seed for the search, and for the first game against each gauntlet deck
+        :param CardPool pool: The cards to build decks from.  Defaults to every collectible card for the class
+        :param dict memo: Scores from an earlier search, as found in :attr:`memo`, to avoid playing the same decks
+                          again
+        """
+        self.character_class = character_class
+        self.gauntlet = list(gauntlet)
+        self.agents = tuple(agents)
+        self.seeds = range(seed, seed + games)
+        self.population = population
+        self.elite = elite
+        self.mutations = mutations
+        self.random = random.Random(seed)
+        self.pool = pool if pool is not None else CardPool(character_class)
+        #: The score of every deck played so far, by :func:`deck_hash` and the settings it was played with
+        self.memo = memo if memo is not None else {}
+        #: The number of decks which actually had to be played
+        self.evaluated = 0
+        #: The best score in each generation
+        self.history = []
+        settings = repr((self.character_class, self.agents, [(deck.name, deck.cards) for deck in self.gauntlet],
+                         self.seeds.start, self.seeds.stop))
+        self._settings = hashlib.sha1(settings.encode("utf-8")).hexdigest()
+
+    def _key(self, cards):
+        return "{}:{}".format(deck_hash(cards), self._settings)
+
+    def score(self, decks, workers=None):
+        """
+        Find the score of each deck, playing only the decks which haven't been played before
+
+        :param list[tuple[str]] decks: The cards in each deck
+        :param multiprocessing.pool.Pool workers: The processes to play the games in, or None to play them in this
+                                                  process
+        :return: The score of each deck, in the same order as ``decks``
+        :rtype: list[float]
+        """
+        unplayed = []
+        for cards in decks:
+            key = self._key(cards)
+            if key not in self.memo and cards not in unplayed:
+                unplayed.append(cards)
+        jobs = [(cards, self.character_class, self.gauntlet, self.agents, self.seeds) for cards in unplayed]
+        if workers is None:
+            scores = list(map(_score_deck, jobs))
+        else:
+            scores = workers.map(_score_deck, jobs, chunksize=1)
+        for cards, score in zip(unplayed, scores):
+            self.memo[self._key(cards)] = score
+        self.evaluated += len(unplayed)
+        return [self.memo[self._key(cards)] for cards in decks]
+
+    def _pick(self, decks, scores):
+        # Tournament selection between three random decks
+        contenders = [self.random.randrange(len(decks)) for i in range(3)]
+        return decks[max(contenders, key=lambda index: scores[index])]
+
+    def _breed(self, first, second):
+        cards = list(first) + list(second)
+        self.random.shuffle(cards)
+        child = list(self.pool.fill(cards, self.random))
+        for i in range(self.mutations):
+            child.pop(self.random.randrange(len(child)))
+        return self.pool.fill(child, self.random)
+
+    def run(self, generations, processes=None, initial=None):
+        """
+        Run the search
+
+        :param int generations: The number of generations to breed
+        :param int processes: The number of worker processes to use.  Defaults to the number of CPUs, and with 1 the
+                              games are played in this process
+        :param list[DeckList] initial: Decks to include in the first generation.  The rest are random
+        :return: The best deck found and its score
+        :rtype: (DeckList, float)
+        """
+        decks = [self.pool.fill(deck.cards, self.random) for deck in (initial or [])][:self.population]
+        while len(decks) < self.population:
+            decks.append(self.pool.random_deck(self.random))
+
+        workers = None if processes == 1 else multiprocessing.Pool(processes)
+        try:
+            scores = self.score(decks, workers)
+            self.history.append(max(scores))
+            for generation in range(generations):
+                ranked = sorted(range(len(decks)), key=lambda index: -scores[index])
+                children = [decks[index] for index in ranked[:self.elite]]
+                while len(children) < self.population:
+                    children.append(self._breed(self._pick(decks, scores), self._pick(decks, scores)))
+                decks = children
+                scores = self.score(decks, workers)
+                self.history.append(max(scores))
+        finally:
+            if workers is not None:
+                workers.terminate()
+
+        best = max(range(len(decks)), key=lambda index: scores[index])
+        return DeckList("best", decks[best], self.character_class), scores[best]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search for a deck which does well against a gauntlet of decks")
+    parser.add_argument("gauntlet", nargs="+", help="The .hsdeck files to play against")
+    parser.add_argument("--class", dest="character_class", required=True, help="The class to build a deck for")
+    parser.add_argument("--agents", nargs=2, default=["Random", "Random"], help="The agents for the deck and gauntlet")
+    parser.add_argument("--games", type=int, default=20, help="The number of games against each gauntlet deck")
+    parser.add_argument("--generations", type=int, default=20, help="The number of generations to breed")
+    parser.add_argument("--population", type=int, default=20, help="The number of decks in each generation")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the search")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    parser.add_argument("--start", nargs="*", default=[], help="The .hsdeck files to start the search from")
+    parser.add_argument("--memo", default=None, help="A file to load scores from and save them to")
+    parser.add_argument("--output", default=None, help="The .hsdeck file to write the best deck to")
+    args = parser.parse_args()
+
+    saved_scores = {}
+    if args.memo and os.path.exists(args.memo):
+        with open(args.memo, "r") as memo_file:
+            saved_scores = json.load(memo_file)
+    optimizer = DeckOptimizer(CHARACTER_CLASS.from_str(args.character_class),
+                              [read_deck(filename) for filename in args.gauntlet], tuple(args.agents), args.games,
+                              args.population, seed=args.seed, memo=saved_scores)
+    best_deck, best_score = optimizer.run(args.generations, args.processes,
+                                          [read_deck(filename) for filename in args.start])
+    for generation, generation_score in enumerate(optimizer.history):
+        print("Generation {:>3}: {:.1%}".format(generation, generation_score))
+    print("Played {} decks".format(optimizer.evaluated))
+    for card_name, card_count in sorted(Counter(best_deck.cards).items()):
+        print("{} {}".format(card_count, card_name))
+    if args.memo:
+        with open(args.memo, "w") as memo_file:
+            json.dump(optimizer.memo, memo_file)
+    if args.output:
+        write_deck(best_deck, args.output)
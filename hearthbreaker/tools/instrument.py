@@ -0,0 +1,298 @@
+import argparse
+import csv
+import json
+import time
+from hearthbreaker.agents.basic_agents import Agent
+from hearthbreaker.cards.base import Card
+from hearthbreaker.engine import Game
+from hearthbreaker.game_objects import Bindable, Character
+from hearthbreaker.tags.base import ActionTag
+from hearthbreaker.tools.pool import WarmPool, shared
+from hearthbreaker.tools.simulation import play_game, read_deck
+
+__doc__ = """
+Counters and timers for the parts of the engine which games spend their time in.
+
+While an :class:`Instrumentation` is enabled, it counts the calls to, and adds up the time spent in:
+
+ * ``trigger``: :meth:`Bindable.trigger <hearthbreaker.game_objects.Bindable.trigger>`, by event name, along with the
+   number of handlers bound to the event when it was triggered
+ * ``action``: :meth:`ActionTag.do <hearthbreaker.tags.base.ActionTag.do>`, by the names of its actions
+ * ``use``: :meth:`Card.use <hearthbreaker.cards.base.Card.use>`
+ * ``play_card``: :meth:`Game.play_card <hearthbreaker.engine.Game.play_card>`
+ * ``attack``: :meth:`Character.attack <hearthbreaker.game_objects.Character.attack>`
+ * ``check_delayed``: :meth:`Game.check_delayed <hearthbreaker.engine.Game.check_delayed>`, along with the number of
+   characters with delayed events
+ * ``agent``: the ``do_turn``, ``choose_target``, ``choose_index``, ``choose_option`` and ``do_card_check`` methods of
+   every :class:`Agent <hearthbreaker.agents.basic_agents.Agent>`, by the agent class and method
+
+Every call is also recorded against the reference name of the card it belongs to, such as the minion a trigger or
+attack is for, or the card being played.  The times include any calls nested inside, so a card's ``play_card`` time
+includes the time spent in its ``use`` and in everything its battlecry triggers.  Where a method is overridden, and the
+override calls the original with ``super()``, only the outermost call is counted.
+
+Nothing is instrumented until :meth:`Instrumentation.enable` is called, which swaps the instrumented methods for timed
+versions until :meth:`Instrumentation.disable`, so there is no cost at all while it is disabled.  Agent classes
+defined after it is enabled aren't instrumented.  Each timed version keeps the method it replaced as its
+``__wrapped__``.  Tags are timed whether or not they are being :mod:`compiled <hearthbreaker.tags.compiler>`, but the
+compiler can't be switched on or off while the instrumentation is enabled.
+
+The results are a plain dictionary, so the results from several worker processes can be sent back and combined with
+:meth:`Instrumentation.merge`.  They can be written out as CSV or JSON.  Games can also be played and instrumented
+from the command line::
+
+    python -m hearthbreaker.tools.instrument --games 200 --csv engine.csv zoo.hsdeck example.hsdeck
+"""
+
+#: The columns of :meth:`Instrumentation.rows`, and the CSV file
+COLUMNS = ["category", "name", "card", "calls", "seconds", "fanout"]
+
+_AGENT_METHODS = ["do_turn", "choose_target", "choose_index", "choose_option", "do_card_check"]
+
+# The instrumentation which is currently enabled, if any
+_enabled = None
+
+
+def _subclasses(cls):
+    found = [cls]
+    for subclass in cls.__subclasses__():
+        found.extend(_subclasses(subclass))
+    return found
+
+
+def _card_name(obj):
+    # The reference name of a card, or of the card a minion, weapon or hero was played from
+    if isinstance(obj, Card):
+        return obj.ref_name
+    card = getattr(obj, "card", None)
+    if card is not None:
+        return card.ref_name
+    return ""
+
+
+class Instrumentation:
+    """
+    Call counts, times and fan-out for the events and cards in the games played while it is enabled
+    """
+
+    def __init__(self):
+        #: ``[calls, seconds, fanout]`` by ``(category, name, card)``, where ``fanout`` is the total number of
+        #: handlers or characters reached
+        self.stats = {}
+        self._originals = []
+
+    def _record(self, category, name, card, seconds, fanout):
+        key = (category, name, card)
+        entry = self.stats.get(key)
+        if entry is None:
+            self.stats[key] = [1, seconds, fanout]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += fanout
+
+    def _patch(self, cls, method, replacement):
+        original = cls.__dict__[method]
+        replacement.__wrapped__ = original
+        self._originals.append((cls, method, original, replacement))
+        setattr(cls, method, replacement)
+
+    def _timed(self, original, category, name, card, fanout=None, active=None):
+        # ``active`` holds the objects already inside a call in this category, so that calls to super() aren't
+        # counted again
+        record = self._record
+        perf_counter = time.perf_counter
+
+        def timed(target, *args, **kwargs):
+            if active is not None:
+                if id(target) in active:
+                    return original(target, *args, **kwargs)
+                active.add(id(target))
+            reached = fanout(target) if fanout is not None else 0
+            start = perf_counter()
+            try:
+                return original(target, *args, **kwargs)
+            finally:
+                if active is not None:
+                    active.discard(id(target))
+                record(category, name(target, args), card(target, args), perf_counter() - start, reached)
+        timed.__name__ = original.__name__
+        timed.__doc__ = original.__doc__
+        return timed
+
+    def enable(self):
+        """
+        Start counting.  Only one instrumentation can be enabled at a time.
+
+        :raises RuntimeError: If another instrumentation is already enabled
+        """
+        global _enabled
+        if _enabled is self:
+            return
+        if _enabled is not None:
+            raise RuntimeError("Another instrumentation is already enabled")
+        _enabled = self
+
+        record = self._record
+        perf_counter = time.perf_counter
+        original_trigger = Bindable.trigger
+
+        # Triggering events is by far the most common call, so it gets its own version
+        def trigger(target, event, *args):
+            handlers = target.events.get(event)
+            start = perf_counter()
+            try:
+                original_trigger(target, event, *args)
+            finally:
+                record("trigger", event, _card_name(target), perf_counter() - start,
+                       len(handlers) if handlers else 0)
+        trigger.__doc__ = original_trigger.__doc__
+        self._patch(Bindable, "trigger", trigger)
+
+        self._patch(ActionTag, "do", self._timed(
+            ActionTag.do, "action", lambda tag, args: "+".join(type(action).__name__ for action in tag.actions),
+            lambda tag, args: _card_name(args[0])))
+        self._patch(Game, "play_card", self._timed(
+            Game.play_card, "play_card", lambda game, args: "play_card", lambda game, args: args[0].ref_name))
+        self._patch(Game, "check_delayed", self._timed(
+            Game.check_delayed, "check_delayed", lambda game, args: "check_delayed", lambda game, args: "",
+            lambda game: len(game.delayed_queue)))
+
+        using = set()
+        for cls in _subclasses(Card):
+            if "use" in cls.__dict__:
+                self._patch(cls, "use", self._timed(
+                    cls.__dict__["use"], "use", lambda card, args: "use", lambda card, args: card.ref_name,
+                    active=using))
+        attacking = set()
+        for cls in _subclasses(Character):
+            if "attack" in cls.__dict__:
+                self._patch(cls, "attack", self._timed(
+                    cls.__dict__["attack"], "attack", lambda character, args: "attack",
+                    lambda character, args: _card_name(character), active=attacking))
+        for method in _AGENT_METHODS:
+            deciding = set()
+            for cls in _subclasses(Agent):
+                if method in cls.__dict__:
+                    self._patch(cls, method, self._timed(
+                        cls.__dict__[method], "agent",
+                        lambda agent, args, method=method: "{}.{}".format(type(agent).__name__, method),
+                        lambda agent, args: "", active=deciding))
+
+    def disable(self):
+        """
+        Stop counting, and put the original methods back
+        """
+        global _enabled
+        if _enabled is not self:
+            return
+        for cls, method, original, replacement in reversed(self._originals):
+            # Anything which has since replaced one of the timed versions is left in place
+            if cls.__dict__.get(method) is replacement:
+                setattr(cls, method, original)
+        self._originals = []
+        _enabled = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def merge(self, other):
+        """
+        Add the counts from another instrumentation, such as one from another process, to this one
+
+        :param Instrumentation other: The instrumentation to add
+        """
+        for key, (calls, seconds, fanout) in other.stats.items():
+            entry = self.stats.get(key)
+            if entry is None:
+                self.stats[key] = [calls, seconds, fanout]
+            else:
+                entry[0] += calls
+                entry[1] += seconds
+                entry[2] += fanout
+
+    def rows(self):
+        """
+        :return: A row for each combination of category, name and card, with the most time consuming first
+        :rtype: list[(str, str, str, int, float, int)]
+        """
+        return sorted((key + tuple(value) for key, value in self.stats.items()), key=lambda row: (-row[4], row[:3]))
+
+    def totals(self, by_card=False):
+        """
+        Add up the counts for each category and name, or for each category and card
+
+        :param bool by_card: If True, add up the counts for each card rather than each name
+        :return: ``[calls, seconds, fanout]`` by ``(category, name)`` or ``(category, card)``
+        :rtype: dict
+        """
+        totals = {}
+        for (category, name, card), (calls, seconds, fanout) in self.stats.items():
+            key = (category, card if by_card else name)
+            entry = totals.setdefault(key, [0, 0.0, 0])
+            entry[0] += calls
+            entry[1] += seconds
+            entry[2] += fanout
+        return totals
+
+    def write_csv(self, filename):
+        """
+        Write :meth:`rows` to a CSV file
+
+        :param str filename: The file to write to
+        """
+        with open(filename, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(COLUMNS)
+            writer.writerows(self.rows())
+
+    def __to_json__(self):
+        return [dict(zip(COLUMNS, row)) for row in self.rows()]
+
+    @staticmethod
+    def __from_json__(rows):
+        instrumentation = Instrumentation()
+        for row in rows:
+            instrumentation.stats[(row["category"], row["name"], row["card"])] = \
+                [row["calls"], row["seconds"], row["fanout"]]
+        return instrumentation
+
+
+def _play_instrumented(seeds):
+    decks, agents = shared()
+    with Instrumentation() as instrumentation:
+        for seed in seeds:
+            play_game(decks, agents, seed)
+    return instrumentation.stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find where the engine spends its time while playing games")
+    parser.add_argument("decks", nargs=2, help="The .hsdeck files to play")
+    parser.add_argument("--agents", nargs=2, default=["Random", "Random"], help="The agents to play the decks")
+    parser.add_argument("--games", type=int, default=100, help="The number of games to play")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the first game")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    parser.add_argument("--csv", default=None, help="A CSV file to write every count to")
+    parser.add_argument("--json", default=None, help="A JSON file to write every count to")
+    args = parser.parse_args()
+
+    total = Instrumentation()
+    batches = [range(start, min(start + 10, args.seed + args.games)) for start in
+               range(args.seed, args.seed + args.games, 10)]
+    with WarmPool(args.processes, ((read_deck(args.decks[0]), read_deck(args.decks[1])), tuple(args.agents))) as pool:
+        for batch_stats in pool.imap_unordered(_play_instrumented, batches):
+            batch_instrumentation = Instrumentation()
+            batch_instrumentation.stats = batch_stats
+            total.merge(batch_instrumentation)
+    for (category, name), (calls, seconds, fanout) in sorted(total.totals().items(), key=lambda item: -item[1][1])[:20]:
+        print("{:<14} {:<40} {:>9} calls {:>9.3f} s {:>9} reached".format(category, name, calls, seconds, fanout))
+    if args.csv:
+        total.write_csv(args.csv)
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(total.__to_json__(), json_file, indent=1)
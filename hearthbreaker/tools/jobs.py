@@ -0,0 +1,365 @@
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import time
+from collections import namedtuple
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.tools.cardstats import CardCounter
+from hearthbreaker.tools.matchup import MatchupResult
+from hearthbreaker.tools.pool import WarmPool, shared
+from hearthbreaker.tools.simulation import DeckList, play_game, read_deck
+
+__doc__ = """
+Long simulation jobs which can be stopped and resumed.
+
+A job manifest is a JSON file listing the games to play, as a pair of decks, a pair of agents and a range of seeds for
+each job::
+
+    {"jobs": [
+        {"decks": ["zoo.hsdeck", "example.hsdeck"], "agents": ["Random", "Random"], "seeds": [0, 1000000]},
+        {"decks": [{"name": "zoo", "cards": ["Flame Imp", ...], "class": "warlock"}, "patron.hsdeck"],
+         "seeds": [0, 1000000]}
+    ]}
+
+Decks are either the name of an ``.hsdeck`` file, relative to the manifest, or the deck list itself.  The agents
+default to ``Random``.
+
+The result of every game is appended to a CSV file as soon as its batch finishes.  Next to it, a checkpoint file
+records which seeds of each job have finished as a bitmap, one bit per seed, along with the length of the results file
+when the checkpoint was saved.  The checkpoint is saved every few seconds, and whenever the runner stops.  Running the
+same job again cuts the results file back to the length in the checkpoint, throwing away any games written after it
+was saved, and then only plays the seeds which aren't marked as finished, so every game is in the results exactly once
+however many times the job was interrupted.
+
+A job can also be run, or resumed, from the command line::
+
+    python -m hearthbreaker.tools.jobs --processes 8 overnight.json overnight.csv
+"""
+
+#: Games to play between two decks: the :class:`DeckList` and agent name for each side, and a range of seeds
+Job = namedtuple("Job", ["decks", "agents", "seeds"])
+
+_COLUMNS = ["job", "seed", "winner", "first", "turns", "duration"]
+
+
+def encode_deck(deck):
+    """
+    :param hearthbreaker.tools.simulation.DeckList deck: A deck list
+    :return: The deck list written out in full, as it is in a manifest
+    :rtype: dict
+    """
+    return {"name": deck.name, "cards": deck.cards, "class": CHARACTER_CLASS.to_str(deck.character_class)}
+
+
+def decode_deck(entry, directory=""):
+    """
+    :param entry: A deck as it is written in a manifest, either in full or as the name of a ``.hsdeck`` file
+    :type entry: dict or str
+    :param str directory: The directory which the names of ``.hsdeck`` files are relative to
+    :rtype: hearthbreaker.tools.simulation.DeckList
+    """
+    if isinstance(entry, str):
+        return read_deck(os.path.join(directory, entry))
+    character_class = CHARACTER_CLASS.from_str(entry["class"]) if "class" in entry else None
+    return DeckList(entry["name"], entry["cards"], character_class)
+
+
+def encode_job(job):
+    """
+    :param Job job: A job
+    :return: The job as it is written in a manifest, with the deck lists written out in full
+    :rtype: dict
+    """
+    return {
+        "decks": [encode_deck(deck) for deck in job.decks],
+        "agents": list(job.agents),
+        "seeds": [job.seeds.start, job.seeds.stop],
+    }
+
+
+def decode_job(entry, directory=""):
+    """
+    :param dict entry: A job as it is written in a manifest
+    :param str directory: The directory which the names of ``.hsdeck`` files are relative to
+    :rtype: Job
+    """
+    decks = tuple(decode_deck(deck, directory) for deck in entry["decks"])
+    start, stop = entry["seeds"]
+    return Job(decks, tuple(entry.get("agents", ["Random", "Random"])), range(start, stop))
+
+
+def read_manifest(filename):
+    """
+    Read the jobs from a manifest file
+
+    :param str filename: The manifest file
+    :rtype: list[Job]
+    """
+    with open(filename, "r") as manifest_file:
+        manifest = json.load(manifest_file)
+    return [decode_job(entry, os.path.dirname(filename)) for entry in manifest["jobs"]]
+
+
+def write_manifest(jobs, filename):
+    """
+    Write jobs to a manifest file, with the deck lists written out in full
+
+    :param list[Job] jobs: The jobs to write
+    :param str filename: The manifest file
+    """
+    with open(filename, "w") as manifest_file:
+        json.dump({"jobs": [encode_job(job) for job in jobs]}, manifest_file, indent=1)
+
+
+class Checkpoint:
+    """
+    Which seeds of each job have been played, and how much of the results file they account for
+    """
+
+    def __init__(self, jobs):
+        """
+        Create a checkpoint with no games played
+
+        :param list[Job] jobs: The jobs being run
+        """
+        self.jobs = list(jobs)
+        #: One bit for each seed of each job, set once its game is in the results file
+        self.bitmaps = [bytearray((len(job.seeds) + 7) // 8) for job in self.jobs]
+        #: The length of the results file, in bytes, when the checkpoint was saved
+        self.log_size = 0
+        settings = repr([([(deck.name, deck.cards) for deck in job.decks], job.agents, job.seeds.start, job.seeds.stop)
+                         for job in self.jobs])
+        self.key = hashlib.sha1(settings.encode("utf-8")).hexdigest()
+
+    def is_finished(self, job, seed):
+        """
+        :param int job: The index of the job
+        :param int seed: The seed of one of the job's games
+        :return: True if the game has been played
+        :rtype: bool
+        """
+        offset = seed - self.jobs[job].seeds.start
+        return bool(self.bitmaps[job][offset >> 3] & (1 << (offset & 7)))
+
+    def finish(self, job, seed):
+        """
+        Mark a game as played
+
+        :param int job: The index of the job
+        :param int seed: The seed of one of the job's games
+        """
+        offset = seed - self.jobs[job].seeds.start
+        self.bitmaps[job][offset >> 3] |= 1 << (offset & 7)
+
+    def count(self, job):
+        """
+        :param int job: The index of the job
+        :return: The number of the job's games which have been played
+        :rtype: int
+        """
+        return bin(int.from_bytes(self.bitmaps[job], "little")).count("1")
+
+    def save(self, filename):
+        """
+        Save the checkpoint, as a line of JSON followed by the bitmaps
+
+        :param str filename: The file to save to
+        """
+        # Written to another file first, so that the checkpoint is never left half written
+        temporary = filename + ".tmp"
+        with open(temporary, "wb") as checkpoint_file:
+            header = {"key": self.key, "log_size": self.log_size, "sizes": [len(bitmap) for bitmap in self.bitmaps]}
+            checkpoint_file.write(json.dumps(header).encode("utf-8") + b"\n")
+            for bitmap in self.bitmaps:
+                checkpoint_file.write(bitmap)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temporary, filename)
+
+    @staticmethod
+    def load(filename, jobs):
+        """
+        Load a checkpoint saved by :meth:`save`
+
+        :param str filename: The file to load from
+        :param list[Job] jobs: The jobs being run
+        :raises ValueError: If the checkpoint was saved for different jobs
+        :rtype: Checkpoint
+        """
+        checkpoint = Checkpoint(jobs)
+        with open(filename, "rb") as checkpoint_file:
+            header = json.loads(checkpoint_file.readline().decode("utf-8"))
+            if header["key"] != checkpoint.key:
+                raise ValueError("The checkpoint {} was written for different jobs".format(filename))
+            checkpoint.log_size = header["log_size"]
+            checkpoint.bitmaps = [bytearray(checkpoint_file.read(size)) for size in header["sizes"]]
+        return checkpoint
+
+
+def play_job_batch(batch, counter=None):
+    """
+    Play a batch of games from a job
+
+    :param batch: The index of the job, its decks and agents, and the seeds of the games to play
+    :type batch: (int, (DeckList, DeckList), (str, str), list[int])
+    :param hearthbreaker.tools.cardstats.CardCounter counter: If given, the cards in each game are counted with this
+    :return: The index of the job, and the seed, winner, first player, turns and duration of each game
+    :rtype: (int, list[tuple])
+    """
+    index, decks, agents, seeds = batch
+    play = play_game if counter is None else counter.play
+    games = [play(decks, agents, seed) for seed in seeds]
+    return index, [(game.seed, game.winner, game.first, game.turns, game.duration) for game in games]
+
+
+def _play_batch(batch):
+    index, seeds = batch
+    jobs, card_stats = shared()
+    job = jobs[index]
+    if card_stats is None:
+        return play_job_batch((index, job.decks, job.agents, seeds))
+    counter = CardCounter()
+    outcome = play_job_batch((index, job.decks, job.agents, seeds), counter)
+    counter.flush(card_stats)
+    return outcome
+
+
+class JobRunner:
+    """
+    Plays a list of jobs, recording every game, and resuming from where it stopped if it is run again
+    """
+
+    def __init__(self, jobs, output, batch_size=100, interval=10.0):
+        """
+        Create a new runner
+
+        :param list[Job] jobs: The games to play
+        :param str output: The CSV file to write the results to.  The checkpoint is saved alongside it, with
+                           ``.checkpoint`` added to the name
+        :param int batch_size: The number of games given to a worker at a time
+        :param float interval: The number of seconds between saving checkpoints
+        """
+        self.jobs = list(jobs)
+        self.output = output
+        self.checkpoint_file = output + ".checkpoint"
+        self.batch_size = batch_size
+        self.interval = interval
+
+    def load_checkpoint(self):
+        """
+        :return: The saved checkpoint, or an empty one if the jobs haven't been started
+        :rtype: Checkpoint
+        """
+        if os.path.exists(self.checkpoint_file):
+            return Checkpoint.load(self.checkpoint_file, self.jobs)
+        return Checkpoint(self.jobs)
+
+    def _batches(self, checkpoint):
+        for index, job in enumerate(self.jobs):
+            seeds = []
+            for seed in job.seeds:
+                if not checkpoint.is_finished(index, seed):
+                    seeds.append(seed)
+                    if len(seeds) == self.batch_size:
+                        yield index, seeds
+                        seeds = []
+            if seeds:
+                yield index, seeds
+
+    def _save(self, log, checkpoint):
+        # The games must be safely in the results file before the checkpoint says they have been played
+        log.flush()
+        os.fsync(log.fileno())
+        checkpoint.log_size = os.fstat(log.fileno()).st_size
+        checkpoint.save(self.checkpoint_file)
+
+    def run(self, processes=None, limit=None, card_stats=None):
+        """
+        Play every game which isn't already in the results file
+
+        :param int processes: The number of worker processes to use.  Defaults to the number of CPUs, and with 1 the
+                              games are played in this process
+        :param int limit: Stop once at least this many games have been played in this run, or None to play them all
+        :param hearthbreaker.tools.cardstats.CardStatistics card_stats: A table to count the cards in each game played
+                                                                        in this run in
+        :return: The number of games played in this run
+        :rtype: int
+        """
+        checkpoint = self.load_checkpoint()
+        # Anything written after the checkpoint was saved will be played again
+        with open(self.output, "ab") as log:
+            log.truncate(checkpoint.log_size)
+
+        played = 0
+        # The workers are handed the jobs when they start, so the batches only need the job's index and the seeds
+        pool = WarmPool(processes, (self.jobs, card_stats))
+        outcomes = pool.imap_unordered(_play_batch, self._batches(checkpoint))
+        with open(self.output, "a", newline="") as log:
+            writer = csv.writer(log)
+            if checkpoint.log_size == 0:
+                writer.writerow(_COLUMNS)
+            saved = time.monotonic()
+            try:
+                for index, games in outcomes:
+                    for seed, winner, first, turns, duration in games:
+                        writer.writerow([index, seed, "" if winner is None else winner, first, turns,
+                                         "{:.6f}".format(duration)])
+                        checkpoint.finish(index, seed)
+                    played += len(games)
+                    if limit is not None and played >= limit:
+                        break
+                    if time.monotonic() - saved >= self.interval:
+                        self._save(log, checkpoint)
+                        saved = time.monotonic()
+            finally:
+                pool.terminate()
+                self._save(log, checkpoint)
+        return played
+
+    def results(self):
+        """
+        Count the results of the games in the results file
+
+        :return: The wins, losses and draws for each job, in the same order as :attr:`jobs`.  A result is finished
+                 once all of the job's games have been played
+        :rtype: list[hearthbreaker.tools.matchup.MatchupResult]
+        """
+        checkpoint = self.load_checkpoint()
+        results = [MatchupResult(job.decks, job.agents) for job in self.jobs]
+        if os.path.exists(self.output):
+            # Only the part of the file covered by the checkpoint counts
+            with open(self.output, "rb") as log:
+                reader = csv.reader(io.StringIO(log.read(checkpoint.log_size).decode("utf-8"), newline=""))
+                next(reader, None)
+                for row in reader:
+                    result = results[int(row[0])]
+                    if row[2] == "":
+                        result.draws += 1
+                    elif row[2] == "0":
+                        result.wins += 1
+                    else:
+                        result.losses += 1
+        for index, (job, result) in enumerate(zip(self.jobs, results)):
+            result.finished = checkpoint.count(index) == len(job.seeds)
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run, or resume, the jobs in a manifest")
+    parser.add_argument("manifest", help="The JSON file listing the jobs")
+    parser.add_argument("output", help="The CSV file to write the result of every game to")
+    parser.add_argument("--batch-size", type=int, default=100, help="The number of games in each batch")
+    parser.add_argument("--interval", type=float, default=10.0, help="The number of seconds between checkpoints")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    args = parser.parse_args()
+
+    runner = JobRunner(read_manifest(args.manifest), args.output, args.batch_size, args.interval)
+    games_played = runner.run(args.processes)
+    for job_result in runner.results():
+        print("{:>20} vs {:<20} {:>8} games  {:6.1%}{}".format(
+            job_result.decks[0].name, job_result.decks[1].name, job_result.games, job_result.win_rate() or 0,
+            "" if job_result.finished else "  (unfinished)"))
+    print("{} games played in this run".format(games_played))
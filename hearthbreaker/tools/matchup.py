@@ -0,0 +1,255 @@
+import argparse
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from hearthbreaker.tools.simulation import play_games, read_deck, wilson_interval
+
+__doc__ = """
+Matchups which only play as many games as they need.
+
+Rather than playing a fixed number of games for every matchup, each matchup is played in batches, and stops as soon as
+one of these is true:
+
+ * A :class:`SequentialTest` has decided which deck is favoured
+ * The confidence interval for the win rate is narrower than a target width
+ * The maximum number of games has been played
+
+Lopsided matchups are usually decided after a few batches, so the workers spend most of their time on the close
+matchups which need more games.  Batches are always handed to the undecided matchup with the fewest games, so workers
+move over to the remaining matchups as the others finish.
+
+Batches may finish in any order, but their results are applied to each matchup in the order of their seeds, and
+anything played after a matchup stopped is thrown away.  Each matchup stops after exactly the same games no matter how
+many processes are used.
+
+A gauntlet, in which every deck plays every other deck, can also be run from the command line::
+
+    python -m hearthbreaker.tools.matchup --margin 0.05 --max-games 10000 example.hsdeck zoo.hsdeck patron.hsdeck
+"""
+
+
+class SequentialTest:
+    """
+    Wald's sequential probability ratio test between the hypotheses that the first deck in a matchup wins
+    ``0.5 + margin`` of its games, and that it wins ``0.5 - margin`` of them.  Draws count as half a win.
+    """
+
+    def __init__(self, margin=0.05, alpha=0.05, beta=0.05):
+        """
+        Create a new test
+
+        :param float margin: How far from even a matchup has to be to be worth telling apart from an even one
+        :param float alpha: The chance of deciding the first deck is favoured when it isn't
+        :param float beta: The chance of deciding the second deck is favoured when it isn't
+        """
+        self.margin = margin
+        self.alpha = alpha
+        self.beta = beta
+        favoured = 0.5 + margin
+        unfavoured = 0.5 - margin
+        self._win = math.log(favoured / unfavoured)
+        self._loss = math.log((1 - favoured) / (1 - unfavoured))
+        self._upper = math.log((1 - beta) / alpha)
+        self._lower = math.log(beta / (1 - alpha))
+
+    def decide(self, score, games):
+        """
+        Check whether enough games have been played to make a decision
+
+        :param float score: The number of games the first deck won, counting draws as half a win
+        :param int games: The number of games played
+        :return: 1 if the first deck is favoured, -1 if the second deck is favoured, or 0 if more games are needed
+        :rtype: int
+        """
+        ratio = score * self._win + (games - score) * self._loss
+        if ratio >= self._upper:
+            return 1
+        if ratio <= self._lower:
+            return -1
+        return 0
+
+
+class MatchupResult:
+    """
+    The games played so far in a matchup between two decks
+    """
+
+    def __init__(self, decks, agents):
+        """
+        :param decks: The two deck lists
+        :type decks: (hearthbreaker.tools.simulation.DeckList, hearthbreaker.tools.simulation.DeckList)
+        :param agents: The names of the agents playing each deck
+        :type agents: (str, str)
+        """
+        self.decks = decks
+        self.agents = agents
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        #: The decision made by the sequential test, as returned by :meth:`SequentialTest.decide`
+        self.decision = 0
+        #: True once the matchup has stopped
+        self.finished = False
+
+    @property
+    def games(self):
+        return self.wins + self.losses + self.draws
+
+    @property
+    def score(self):
+        return self.wins + self.draws / 2
+
+    def win_rate(self):
+        """
+        :return: The fraction of games won by the first deck, counting draws as half a win, or None if no games have
+                 been played
+        :rtype: float
+        """
+        if self.games == 0:
+            return None
+        return self.score / self.games
+
+    def confidence_interval(self, z=1.96):
+        """
+        :return: The Wilson score interval for :meth:`win_rate`
+        :rtype: (float, float)
+        """
+        return wilson_interval(self.score, self.games, z)
+
+
+class MatchupRunner:
+    """
+    Plays a set of matchups, stopping each one as soon as it has been decided
+    """
+
+    def __init__(self, matchups, test=None, width=None, batch_size=20, max_games=10000, seed=0):
+        """
+        Create a new runner
+
+        :param matchups: The decks and agents for each matchup
+        :type matchups: list of ((DeckList, DeckList), (str, str))
+        :param SequentialTest test: The test used to decide each matchup, or None to only stop on ``width`` or
+                                    ``max_games``
+        :param float width: Stop a matchup once its 95% confidence interval is narrower than this, or None to not
+                            stop on the width of the interval
+        :param int batch_size: The number of games given to a worker at a time.  Matchups are only checked between
+                               batches
+        :param int max_games: The most games to play in any matchup
+        :param int seed: The seed for the first game.  Every game has its own seed, counting up from this one
+        """
+        self.matchups = list(matchups)
+        self.test = test
+        self.width = width
+        self.batch_size = batch_size
+        self.max_games = max_games
+        self.seed = seed
+
+    def _should_stop(self, result):
+        if self.test is not None:
+            result.decision = self.test.decide(result.score, result.games)
+            if result.decision != 0:
+                return True
+        if self.width is not None:
+            lower, upper = result.confidence_interval()
+            if upper - lower <= self.width:
+                return True
+        return result.games >= self.max_games
+
+    def run(self, processes=None):
+        """
+        Play the matchups
+
+        :param int processes: The number of worker processes to use.  Defaults to the number of CPUs, and with 1 the
+                              games are played in this process
+        :return: The result of each matchup, in the same order as :attr:`matchups`
+        :rtype: list[MatchupResult]
+        """
+        results = [MatchupResult(decks, agents) for decks, agents in self.matchups]
+        next_start = [0] * len(results)
+        applied = [0] * len(results)
+        waiting = [{} for result in results]
+        running = {}
+
+        if processes == 1:
+            executor = None
+            slots = 1
+        else:
+            executor = ProcessPoolExecutor(processes)
+            # Two batches for each worker, so that none of them wait while the results of a batch are applied
+            slots = 2 * (processes or os.cpu_count() or 1)
+
+        def submit():
+            candidates = [index for index, result in enumerate(results)
+                          if not result.finished and next_start[index] < self.max_games]
+            if not candidates:
+                return False
+            index = min(candidates, key=lambda i: next_start[i])
+            start = next_start[index]
+            end = min(start + self.batch_size, self.max_games)
+            next_start[index] = end
+            first_seed = self.seed + index * self.max_games
+            args = (self.matchups[index][0], self.matchups[index][1], range(first_seed + start, first_seed + end))
+            if executor is None:
+                future = Future()
+                future.set_result(play_games(*args))
+            else:
+                future = executor.submit(play_games, *args)
+            running[future] = (index, start, end)
+            return True
+
+        try:
+            while True:
+                while len(running) < slots and submit():
+                    pass
+                if not running:
+                    break
+                done, not_done = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, start, end = running.pop(future)
+                    result = results[index]
+                    if result.finished:
+                        continue
+                    waiting[index][start] = (end, future.result())
+                    while applied[index] in waiting[index]:
+                        end, (wins, losses, draws) = waiting[index].pop(applied[index])
+                        applied[index] = end
+                        result.wins += wins
+                        result.losses += losses
+                        result.draws += draws
+                        if self._should_stop(result):
+                            result.finished = True
+                            break
+        finally:
+            if executor is not None:
+                # Batches which haven't started yet are no longer needed
+                for future in running:
+                    future.cancel()
+                executor.shutdown()
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play every deck against every other deck, stopping each matchup "
+                                                 "once it has been decided")
+    parser.add_argument("decks", nargs="+", help="The .hsdeck files to play")
+    parser.add_argument("--agents", nargs=2, default=["Random", "Random"], help="The agents to play the decks")
+    parser.add_argument("--margin", type=float, default=0.05, help="The margin for the sequential test")
+    parser.add_argument("--width", type=float, default=None, help="Stop once the confidence interval is this narrow")
+    parser.add_argument("--max-games", type=int, default=10000, help="The most games to play in each matchup")
+    parser.add_argument("--batch-size", type=int, default=20, help="The number of games in each batch")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the first game")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    args = parser.parse_args()
+
+    deck_lists = [read_deck(filename) for filename in args.decks]
+    runner = MatchupRunner([(pair, tuple(args.agents)) for pair in itertools.combinations(deck_lists, 2)],
+                           SequentialTest(args.margin), args.width, args.batch_size, args.max_games, args.seed)
+    matchup_results = runner.run(args.processes)
+    for matchup in matchup_results:
+        lower, upper = matchup.confidence_interval()
+        print("{:>20} vs {:<20} {:>6} games  {:6.1%}  ({:.1%} - {:.1%})  {}".format(
+            matchup.decks[0].name, matchup.decks[1].name, matchup.games, matchup.win_rate(), lower, upper,
+            {1: "first favoured", -1: "second favoured", 0: "undecided"}[matchup.decision]))
+    total = sum(matchup.games for matchup in matchup_results)
+    print("{} games played, out of at most {}".format(total, args.max_games * len(matchup_results)))
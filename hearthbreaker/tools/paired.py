@@ -0,0 +1,243 @@
+import argparse
+import math
+import multiprocessing
+from collections import Counter
+from hearthbreaker.tools.simulation import DeckList, play_game, read_deck
+
+__doc__ = """
+Paired comparisons between two versions of a deck, using common random numbers.
+
+Comparing a deck against a version with one card changed by playing each of them separately needs a huge number of
+games, because the difference between them is much smaller than the noise from which cards each game happened to
+draw.  A paired comparison plays both versions against the same opponent with the same seed for every game:
+
+ * The same player goes first in both games
+ * Each deck draws its cards with its own random number generator (see
+   :meth:`DeckList.to_deck <hearthbreaker.tools.simulation.DeckList.to_deck>`), so both versions draw the cards in the
+   same positions in the same order, including after a mulligan
+ * The variant's cards are put in the same positions as the base deck's (see :func:`align`), so the only cards which
+   can be drawn differently are the ones which were changed
+
+Until a changed card is drawn, both games are usually identical, so most of the noise cancels out of the difference.
+The results are reported as the mean of the difference in score between the two versions for each seed, along with its
+variance, and the variance the same number of unpaired games would have had.
+
+A comparison can also be run from the command line::
+
+    python -m hearthbreaker.tools.paired --games 1000 zoo.hsdeck zoo2.hsdeck example.hsdeck patron.hsdeck
+"""
+
+
+def align(base, variant):
+    """
+    Reorder the cards in a variant of a deck, so that every card it shares with the base deck is at the same position
+    as in the base deck.  The cards only in the variant fill the positions of the cards only in the base deck.
+
+    :param DeckList base: The deck to line the variant up with
+    :param DeckList variant: The changed version of the deck
+    :return: A deck list with the same name and cards as ``variant``, in the new order
+    :rtype: DeckList
+    """
+    remaining = Counter(variant.cards)
+    shared = []
+    for card in base.cards:
+        if remaining[card] > 0:
+            remaining[card] -= 1
+            shared.append(card)
+        else:
+            shared.append(None)
+    extra = []
+    for card in variant.cards:
+        if remaining[card] > 0:
+            remaining[card] -= 1
+            extra.append(card)
+    extra = iter(extra)
+    cards = [card if card is not None else next(extra) for card in shared]
+    cards.extend(extra)
+    return DeckList(variant.name, cards)
+
+
+class PairedResult:
+    """
+    Running totals of the scores of the base deck and its variant over a set of paired games, where each score is 1
+    for a win, 0.5 for a draw and 0 for a loss.  Results from different processes can be combined with :meth:`merge`.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.base_total = 0.0
+        self.variant_total = 0.0
+        self.base_squares = 0.0
+        self.variant_squares = 0.0
+        self.products = 0.0
+        #: The number of pairs in which the base and the variant got the same score
+        self.ties = 0
+
+    def add(self, base_score, variant_score):
+        """
+        Add the scores from one pair of games
+
+        :param float base_score: The score of the base deck
+        :param float variant_score: The score of the variant with the same seed
+        """
+        self.games += 1
+        self.base_total += base_score
+        self.variant_total += variant_score
+        self.base_squares += base_score * base_score
+        self.variant_squares += variant_score * variant_score
+        self.products += base_score * variant_score
+        if base_score == variant_score:
+            self.ties += 1
+
+    def merge(self, other):
+        """
+        Add the totals from another result to this one
+
+        :param PairedResult other: The result to add
+        """
+        self.games += other.games
+        self.base_total += other.base_total
+        self.variant_total += other.variant_total
+        self.base_squares += other.base_squares
+        self.variant_squares += other.variant_squares
+        self.products += other.products
+        self.ties += other.ties
+
+    def _variance(self, total, squares):
+        if self.games < 2:
+            return 0.0
+        return max(0.0, (squares - total * total / self.games) / (self.games - 1))
+
+    @property
+    def base_win_rate(self):
+        return self.base_total / self.games if self.games else None
+
+    @property
+    def variant_win_rate(self):
+        return self.variant_total / self.games if self.games else None
+
+    @property
+    def difference(self):
+        """
+        The mean amount by which the variant's score was higher than the base deck's
+        """
+        return (self.variant_total - self.base_total) / self.games if self.games else None
+
+    @property
+    def variance(self):
+        """
+        The sample variance of the difference in score for each seed
+        """
+        total = self.variant_total - self.base_total
+        squares = self.variant_squares + self.base_squares - 2 * self.products
+        return self._variance(total, squares)
+
+    @property
+    def unpaired_variance(self):
+        """
+        The variance the difference would have had if the two decks had been played with unrelated seeds
+        """
+        return self._variance(self.base_total, self.base_squares) + \
+            self._variance(self.variant_total, self.variant_squares)
+
+    def standard_error(self):
+        """
+        :return: The standard error of :attr:`difference`
+        :rtype: float
+        """
+        if self.games == 0:
+            return float("inf")
+        return math.sqrt(self.variance / self.games)
+
+    def confidence_interval(self, z=1.96):
+        """
+        :return: The normal confidence interval for :attr:`difference`
+        :rtype: (float, float)
+        """
+        error = z * self.standard_error()
+        return self.difference - error, self.difference + error
+
+
+def _score(result):
+    if result.winner is None:
+        return 0.5
+    return 1.0 if result.winner == 0 else 0.0
+
+
+def _play_pairs(batch):
+    index, base, variant, opponent, agents, seeds = batch
+    result = PairedResult()
+    for seed in seeds:
+        base_result = play_game((base, opponent), agents, seed, separate_draws=True)
+        variant_result = play_game((variant, opponent), agents, seed, separate_draws=True)
+        result.add(_score(base_result), _score(variant_result))
+    return index, result
+
+
+def compare(base, variant, opponents, agents=("Random", "Random"), games=1000, batch_size=50, seed=0,
+            processes=None):
+    """
+    Play the base deck and its variant against each opponent, using the same seeds for both
+
+    :param DeckList base: The deck to compare against
+    :param DeckList variant: The changed version of the deck.  Its cards are put in line with the base deck's with
+                             :func:`align` before playing
+    :param list[DeckList] opponents: The decks to play against
+    :param agents: The names of the agents playing the deck being tested, and its opponent
+    :type agents: (str, str)
+    :param int games: The number of pairs of games to play against each opponent
+    :param int batch_size: The number of pairs of games given to a worker at a time
+    :param int seed: The seed for the first pair of games.  Each pair has its own seed, counting up from this one
+    :param int processes: The number of worker processes to use.  Defaults to the number of CPUs, and with 1 the
+                          games are played in this process
+    :return: The results against each opponent, in the same order as ``opponents``
+    :rtype: list[PairedResult]
+    """
+    variant = align(base, variant)
+    batches = []
+    for index, opponent in enumerate(opponents):
+        first_seed = seed + index * games
+        for start in range(0, games, batch_size):
+            batches.append((index, base, variant, opponent, tuple(agents),
+                            range(first_seed + start, first_seed + min(start + batch_size, games))))
+
+    results = [PairedResult() for opponent in opponents]
+    if processes == 1:
+        outcomes = map(_play_pairs, batches)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes)
+        outcomes = pool.imap_unordered(_play_pairs, batches)
+    try:
+        for index, result in outcomes:
+            results[index].merge(result)
+    finally:
+        if pool is not None:
+            pool.terminate()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two versions of a deck using paired games")
+    parser.add_argument("base", help="The .hsdeck file for the original deck")
+    parser.add_argument("variant", help="The .hsdeck file for the changed deck")
+    parser.add_argument("opponents", nargs="+", help="The .hsdeck files to play against")
+    parser.add_argument("--agents", nargs=2, default=["Random", "Random"], help="The agents for the deck and opponent")
+    parser.add_argument("--games", type=int, default=1000, help="The number of pairs of games against each opponent")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the first game")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    args = parser.parse_args()
+
+    opponent_decks = [read_deck(filename) for filename in args.opponents]
+    paired_results = compare(read_deck(args.base), read_deck(args.variant), opponent_decks, tuple(args.agents),
+                             args.games, seed=args.seed, processes=args.processes)
+    overall = PairedResult()
+    for opponent_deck, paired_result in zip(opponent_decks, paired_results):
+        overall.merge(paired_result)
+        lower, upper = paired_result.confidence_interval()
+        print("vs {:<20} {:6.1%} -> {:6.1%}  difference {:+.3f} ({:+.3f} to {:+.3f})".format(
+            opponent_deck.name, paired_result.base_win_rate, paired_result.variant_win_rate,
+            paired_result.difference, lower, upper))
+    lower, upper = overall.confidence_interval()
+    print("Overall difference {:+.3f} ({:+.3f} to {:+.3f}), variance {:.4f} paired, {:.4f} unpaired".format(
+        overall.difference, lower, upper, overall.variance, overall.unpaired_variance))
@@ -0,0 +1,122 @@
+import gc
+import itertools
+import multiprocessing
+
+__doc__ = """
+A pool of worker processes forked from a parent which has already done the work they all need.
+
+By the time a pool is created, the parent has imported the engine, built the card table and read the decks.  Where the
+platform starts processes by forking them, as Linux does by default, the workers begin with all of that already in
+memory, shared with the parent until either of them writes to it.  Elsewhere the workers are started in the platform's
+own way, since forking isn't safe everywhere, unless the caller asks for ``start_method="fork"``.  Forking only copies
+the thread doing it, so a pool should be created before the parent starts any threads of its own, such as the writer
+of a :class:`ResultStore <hearthbreaker.tools.results.ResultStore>`.
+
+Anything the workers need for every task, such as the decks and agents being played, is given to the pool as its
+shared state, which the workers read with :func:`shared`.  The tasks themselves then only need to carry indexes and
+seeds, rather than having the decks pickled and sent with every batch.  Workers which aren't forked are sent the state
+once, as they start.
+
+While forked workers are started, every object in the parent is frozen with :func:`gc.freeze`.  The garbage collector
+in the workers then never looks at the objects they inherited, so collecting doesn't write to, and copy, the pages they
+share with the parent.
+"""
+
+# The shared state for each pool in this process, by the pool's key
+_states = {}
+_keys = itertools.count()
+# The shared state of the pool this process is working for
+_current = None
+
+
+def shared():
+    """
+    :return: The shared state of the :class:`WarmPool` running the current task
+    """
+    return _current
+
+
+def _start_worker(key, state):
+    global _current
+    # Forked workers inherit the state, and only started workers need it sent to them
+    _current = _states[key] if state is None else state
+
+
+class WarmPool:
+    """
+    A pool of worker processes which all start with the same shared state
+    """
+
+    def __init__(self, processes=None, state=None, start_method=None):
+        """
+        Start the workers
+
+        :param int processes: The number of worker processes.  Defaults to the number of CPUs, and with 1 the tasks are
+                              run in this process
+        :param state: The state shared by every task, returned by :func:`shared`
+        :param str start_method: How to start the workers, as for :func:`multiprocessing.get_context`.  Defaults to
+                                 the platform's own way
+        """
+        global _current
+        self.key = next(_keys)
+        self._pool = None
+        self._previous = None
+        self._in_process = processes == 1
+        if self._in_process:
+            self._previous = _current
+            _current = state
+            return
+        context = multiprocessing.get_context(start_method)
+        fork = context.get_start_method() == "fork"
+        _states[self.key] = state
+        if not fork:
+            self._pool = context.Pool(processes, _start_worker, (self.key, state))
+            return
+        gc.collect()
+        gc.freeze()
+        try:
+            self._pool = context.Pool(processes, _start_worker, (self.key, None))
+        finally:
+            gc.unfreeze()
+
+    def imap_unordered(self, function, tasks, chunksize=1):
+        """
+        Run a function on each task, in whichever worker is free first
+
+        :param function: The function to run, which must be defined at the top level of a module
+        :param tasks: The arguments for each call
+        :return: The results, in the order they finish
+        """
+        if self._pool is None:
+            return map(function, tasks)
+        return self._pool.imap_unordered(function, tasks, chunksize)
+
+    def map(self, function, tasks, chunksize=1):
+        """
+        Run a function on each task, and wait for all of them to finish
+
+        :return: The results, in the same order as ``tasks``
+        :rtype: list
+        """
+        if self._pool is None:
+            return list(map(function, tasks))
+        return self._pool.map(function, tasks, chunksize)
+
+    def terminate(self):
+        """
+        Stop the workers, without waiting for any tasks they are running
+        """
+        global _current
+        if self._in_process:
+            _current = self._previous
+            self._in_process = False
+        elif self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+            _states.pop(self.key, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.terminate()
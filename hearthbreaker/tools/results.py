@@ -0,0 +1,225 @@
+import argparse
+import json
+import queue
+import sqlite3
+import threading
+from hearthbreaker.tools.deckopt import deck_hash
+
+__doc__ = """
+A local SQLite database of the results of simulated games.
+
+Each game is stored as a row recording its seed, the two decks and agents, the winner, the number of turns, how long
+it took, the cards played and which deck went first.  Rows are added with :meth:`ResultStore.add`, which only puts
+them on a queue.  A writer thread owns the database connection, and writes whatever is on the queue in a single
+transaction, so the code playing games never waits for the disk, and the database sees a few large transactions rather
+than one for every game.  The writer is only started by the first result added, so a pool of worker processes can be
+forked after the store is opened, but before its results arrive, without forking the writer along with it.
+
+A game is identified by its decks, agents and seed.  Each deck is identified by both its name and a hash of its cards,
+from :func:`hearthbreaker.tools.deckopt.deck_hash`, so a deck which is edited but keeps its name has its new games
+stored alongside the old ones.  Storing a game which is already in the database does nothing, so running the same
+games again never counts them twice.  The summaries look decks up by name, so they count the games of every version
+of a deck.
+
+The stored results can be summarised from the command line::
+
+    python -m hearthbreaker.tools.results games.db
+"""
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS games (
+        deck TEXT NOT NULL,
+        opponent TEXT NOT NULL,
+        deck_hash TEXT NOT NULL,
+        opponent_hash TEXT NOT NULL,
+        agent TEXT NOT NULL,
+        opponent_agent TEXT NOT NULL,
+        seed INTEGER NOT NULL,
+        winner INTEGER,
+        went_first INTEGER NOT NULL,
+        turns INTEGER NOT NULL,
+        duration REAL NOT NULL,
+        cards_played TEXT NOT NULL,
+        PRIMARY KEY (deck, opponent, deck_hash, opponent_hash, agent, opponent_agent, seed)
+    )""",
+    "CREATE INDEX IF NOT EXISTS games_by_deck ON games (deck)",
+    "CREATE INDEX IF NOT EXISTS games_by_opponent ON games (opponent)",
+    "CREATE INDEX IF NOT EXISTS games_by_agent ON games (agent)",
+    "CREATE INDEX IF NOT EXISTS games_by_opponent_agent ON games (opponent_agent)",
+]
+
+_INSERT = "INSERT OR IGNORE INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Put on the queue to stop the writer thread
+_STOP = object()
+
+
+class ResultStore:
+    """
+    A database of game results, written to by a background thread
+    """
+
+    def __init__(self, filename, batch_size=1000):
+        """
+        Open a database, creating it if it doesn't exist
+
+        :param str filename: The database file
+        :param int batch_size: The most rows to write in a single transaction
+        :raises ValueError: If the database was created by an older version, which didn't store the decks' hashes
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        connection = sqlite3.connect(filename)
+        # Lets the results be read while they are being written
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        if "deck_hash" not in [column[1] for column in connection.execute("PRAGMA table_info(games)")]:
+            connection.close()
+            raise ValueError("{} doesn't store the hashes of its decks, so it can't be added to".format(filename))
+        self._connection = connection
+        self._queue = queue.Queue()
+        self._error = None
+        self._writer = threading.Thread(target=self._write, name="ResultStore writer", daemon=True)
+
+    def _write(self):
+        connection = sqlite3.connect(self.filename)
+        try:
+            stopping = False
+            while not stopping:
+                rows = [self._queue.get()]
+                while len(rows) < self.batch_size:
+                    try:
+                        rows.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if rows[-1] is _STOP:
+                    stopping = True
+                    rows.pop()
+                try:
+                    if self._error is None:
+                        with connection:
+                            connection.executemany(_INSERT, rows)
+                except sqlite3.Error as error:
+                    self._error = error
+                for i in range(len(rows) + (1 if stopping else 0)):
+                    self._queue.task_done()
+        finally:
+            connection.close()
+
+    def add(self, decks, agents, result):
+        """
+        Queue the result of a game to be written.  This never waits for the database.
+
+        :param decks: The two decks, as passed to :func:`hearthbreaker.tools.simulation.play_game`
+        :type decks: (DeckList, DeckList)
+        :param agents: The names of the two agents
+        :type agents: (str, str)
+        :param hearthbreaker.tools.simulation.GameResult result: The result of the game
+        """
+        if self._writer.ident is None:
+            self._writer.start()
+        self._queue.put((decks[0].name, decks[1].name, deck_hash(decks[0].cards), deck_hash(decks[1].cards),
+                         agents[0], agents[1], result.seed, result.winner, 1 if result.first == 0 else 0, result.turns,
+                         result.duration, json.dumps(result.cards_played)))
+
+    def flush(self):
+        """
+        Wait until every queued result has been written
+
+        :raises sqlite3.Error: If any of the results couldn't be written
+        """
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        """
+        Write any queued results, and close the database
+        """
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._connection.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def count(self):
+        """
+        :return: The number of games written so far
+        :rtype: int
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def record(self, deck, opponent=None, agent=None):
+        """
+        Count the games a deck has won, lost and drawn, whichever side of the game it was on
+
+        :param str deck: The name of the deck
+        :param str opponent: Only count games against the deck with this name
+        :param str agent: Only count games where ``deck`` was played by the agent with this name
+        :return: The number of wins, losses and draws
+        :rtype: (int, int, int)
+        """
+        totals = [0, 0, 0]
+        for side, other_side, agent_column in [("deck", "opponent", "agent"),
+                                               ("opponent", "deck", "opponent_agent")]:
+            query = "SELECT winner, COUNT(*) FROM games WHERE {} = ?".format(side)
+            parameters = [deck]
+            if opponent is not None:
+                query += " AND {} = ?".format(other_side)
+                parameters.append(opponent)
+            if agent is not None:
+                query += " AND {} = ?".format(agent_column)
+                parameters.append(agent)
+            winning = 0 if side == "deck" else 1
+            for winner, count in self._connection.execute(query + " GROUP BY winner", parameters):
+                if winner is None:
+                    totals[2] += count
+                elif winner == winning:
+                    totals[0] += count
+                else:
+                    totals[1] += count
+        return tuple(totals)
+
+    def win_rate(self, deck, opponent=None, agent=None):
+        """
+        :return: The fraction of the games counted by :meth:`record` which the deck won, counting draws as half a
+                 win, or None if there are no games
+        :rtype: float
+        """
+        wins, losses, draws = self.record(deck, opponent, agent)
+        games = wins + losses + draws
+        if games == 0:
+            return None
+        return (wins + draws / 2) / games
+
+    def matchups(self):
+        """
+        :return: The number of wins, losses and draws for each combination of decks and agents, as tuples of
+                 ``(deck, opponent, agent, opponent_agent, wins, losses, draws)``
+        :rtype: list[tuple]
+        """
+        return list(self._connection.execute(
+            "SELECT deck, opponent, agent, opponent_agent, SUM(winner = 0), SUM(winner = 1), SUM(winner IS NULL) "
+            "FROM games GROUP BY deck, opponent, agent, opponent_agent ORDER BY deck, opponent, agent, opponent_agent"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise the games stored in a results database")
+    parser.add_argument("database", help="The database file")
+    args = parser.parse_args()
+
+    with ResultStore(args.database) as store:
+        for row in store.matchups():
+            games = sum(row[4:])
+            print("{}/{} vs {}/{}: {} games, {} won, {} lost, {} drawn ({:.1%})".format(
+                row[2], row[0], row[3], row[1], games, row[4], row[5], row[6], (row[4] + row[6] / 2) / games))
+        print("{} games".format(store.count()))
@@ -0,0 +1,219 @@
+import math
+import os
+import random
+import time
+from collections import namedtuple
+from hearthbreaker.agents import registry
+from hearthbreaker.cards.heroes import hero_for_class
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.engine import Game, Deck, card_lookup
+
+__doc__ = """
+The pieces shared by the simulation tools: deck lists which can be turned into fresh decks for each game, a function
+for playing a single seeded game between two decks, and some statistics for summarising the results.
+
+Every game is played by seeding the :mod:`random` module, which the engine and the agents both use, with the game's
+seed.  A game played with the same decks, agents and seed always has the same result, no matter which process it is
+played in, so the results of games played in parallel can be checked and combined.
+"""
+
+#: The result of a single game, as returned by :func:`play_game`.  ``winner`` and ``first`` are the index (0 or 1)
+#: of the deck which won and of the deck which went first, and ``winner`` is None for a draw.  ``turns`` is the number
+#: of turns played by each player, ``duration`` the time taken to play the game in seconds and ``cards_played`` the
+#: names of the cards played by both players, in order.
+GameResult = namedtuple("GameResult", ["seed", "winner", "first", "turns", "duration", "cards_played"])
+
+
+class DeckList:
+    """
+    The names of the cards in a deck.  Unlike a :class:`Deck <hearthbreaker.engine.Deck>`, which is used up as a game
+    is played, a deck list can make a fresh deck for every game, and is small enough to be sent to other processes.
+    """
+
+    def __init__(self, name, cards, character_class=None):
+        """
+        Create a new deck list
+
+        :param str name: The name used for this deck in reports
+        :param list[str] cards: The names of the 30 cards in the deck
+        :param int character_class: The class of the deck's hero, from :class:`hearthbreaker.constants.CHARACTER_CLASS`.
+                                    If not given, it is the class of the deck's class cards, or Mage if they are all
+                                    neutral
+        """
+        self.name = name
+        self.cards = list(cards)
+        if character_class is None:
+            character_class = CHARACTER_CLASS.MAGE
+            for card_name in self.cards:
+                card = card_lookup(card_name)
+                if card.character_class != CHARACTER_CLASS.ALL:
+                    character_class = card.character_class
+        self.character_class = character_class
+
+    def to_deck(self, seed=None):
+        """
+        Make a new deck containing new copies of the cards in this list
+
+        :param seed: If given, the deck draws its cards using its own random number generator, seeded with this,
+                     instead of the game's.  It then always draws the cards at the same positions in the list in the
+                     same order, no matter what else happens in the game.
+        :type seed: int or str
+        :rtype: hearthbreaker.engine.Deck
+        """
+        cards = [card_lookup(card_name) for card_name in self.cards]
+        if seed is None:
+            return Deck(cards, hero_for_class(self.character_class))
+        return _SeededDeck(cards, hero_for_class(self.character_class), seed)
+
+    def __eq__(self, other):
+        return isinstance(other, DeckList) and self.name == other.name and self.cards == other.cards
+
+    def __hash__(self):
+        return hash((self.name, tuple(self.cards)))
+
+    def __repr__(self):
+        return "DeckList({!r})".format(self.name)
+
+
+class _SeededDeck(Deck):
+    def __init__(self, cards, hero, seed):
+        super().__init__(cards, hero)
+        self.random = random.Random(seed)
+
+    def draw(self, game):
+        # The game's generator is swapped for the deck's own while it draws, in the same way that replays record it
+        previous = game.__dict__.get("_generate_random_between")
+        game._generate_random_between = self.random.randint
+        try:
+            return super().draw(game)
+        finally:
+            if previous is None:
+                del game._generate_random_between
+            else:
+                game._generate_random_between = previous
+
+
+def read_deck(filename):
+    """
+    Read a deck list from an ``.hsdeck`` file, which has one line for each different card, made up of the number of
+    copies followed by the card's name, such as ``2 Flame Imp``
+
+    :param str filename: The file to read
+    :return: A deck list named after the file, without its extension
+    :rtype: DeckList
+    """
+    cards = []
+    with open(filename, "r") as deck_file:
+        for line in deck_file.read().splitlines():
+            if not line.strip():
+                continue
+            count, card_name = line.split(" ", 1)
+            cards.extend([card_name.strip()] * int(count))
+    return DeckList(os.path.splitext(os.path.basename(filename))[0], cards)
+
+
+def write_deck(deck, filename):
+    """
+    Write a deck list to an ``.hsdeck`` file, which can be read back with :func:`read_deck`
+
+    :param DeckList deck: The deck to write
+    :param str filename: The file to write to
+    """
+    counts = {}
+    for card_name in deck.cards:
+        counts[card_name] = counts.get(card_name, 0) + 1
+    with open(filename, "w") as deck_file:
+        for card_name, count in counts.items():
+            deck_file.write("{} {}\n".format(count, card_name))
+
+
+def play_game(decks, agents, seed, separate_draws=False, observer=None):
+    """
+    Play a complete game
+
+    :param decks: The two deck lists to play with
+    :type decks: (DeckList, DeckList)
+    :param agents: The names of the agents from :data:`hearthbreaker.agents.registry` to play each deck with
+    :type agents: (str, str)
+    :param int seed: The seed for the random number generator
+    :param bool separate_draws: If True, each deck draws its cards with its own random number generator, seeded from
+                                ``seed`` and the deck's position (see :meth:`DeckList.to_deck`).  Two games with the
+                                same seed then draw the same cards, even if one of the decks is slightly different.
+    :param observer: If given, called with the game once the opening hands have been drawn, before the first turn
+    :type observer: function(hearthbreaker.engine.Game)
+    :rtype: GameResult
+    """
+    random.seed(seed)
+    start = time.perf_counter()
+    if separate_draws:
+        game_decks = [decks[0].to_deck("{}/0".format(seed)), decks[1].to_deck("{}/1".format(seed))]
+    else:
+        game_decks = [decks[0].to_deck(), decks[1].to_deck()]
+    game = Game(game_decks, [registry.create_agent(agents[0]), registry.create_agent(agents[1])])
+    if observer is not None:
+        game.pre_game()
+        observer(game)
+    game.start()
+    duration = time.perf_counter() - start
+
+    # The first player is always players[0], whichever deck they were given
+    first = game.first_player
+    if first == 0:
+        by_deck = game.players
+    else:
+        by_deck = [game.players[1], game.players[0]]
+    if by_deck[0].hero.dead == by_deck[1].hero.dead:
+        winner = None
+    elif by_deck[1].hero.dead:
+        winner = 0
+    else:
+        winner = 1
+    return GameResult(seed, winner, first, game._turns_passed, duration,
+                      tuple(card.name for card in game._all_cards_played))
+
+
+def play_games(decks, agents, seeds, results=None):
+    """
+    Play a game for each of the given seeds, and count the results
+
+    :param decks: The two deck lists to play with
+    :type decks: (DeckList, DeckList)
+    :param agents: The names of the agents to play each deck with
+    :type agents: (str, str)
+    :param seeds: The seed for each game
+    :type seeds: iterable of int
+    :param list results: If given, the :class:`GameResult` of each game is appended to this list
+    :return: The number of games won by the first deck, the number won by the second and the number drawn
+    :rtype: (int, int, int)
+    """
+    wins = [0, 0]
+    draws = 0
+    for seed in seeds:
+        result = play_game(decks, agents, seed)
+        if results is not None:
+            results.append(result)
+        winner = result.winner
+        if winner is None:
+            draws += 1
+        else:
+            wins[winner] += 1
+    return wins[0], wins[1], draws
+
+
+def wilson_interval(score, games, z=1.96):
+    """
+    Find the Wilson score interval for a win rate
+
+    :param float score: The number of games won, counting draws as half a win
+    :param int games: The number of games played
+    :param float z: The number of standard deviations to include.  The default gives a 95% interval
+    :return: The lower and upper bounds of the interval.  With no games played, the interval is (0, 1)
+    :rtype: (float, float)
+    """
+    if games == 0:
+        return 0.0, 1.0
+    rate = score / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    spread = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
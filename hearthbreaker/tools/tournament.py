@@ -0,0 +1,306 @@
+import argparse
+import itertools
+import json
+import math
+import os
+from collections import namedtuple
+from hearthbreaker.agents import registry
+from hearthbreaker.tools.pool import WarmPool, shared
+from hearthbreaker.tools.results import ResultStore
+from hearthbreaker.tools.simulation import play_games, read_deck, wilson_interval
+
+__doc__ = """
+Round robin tournaments between agents playing decks.
+
+Each entrant in a tournament is an agent from :data:`hearthbreaker.agents.registry` playing a particular deck, and
+every entrant plays the same number of games against every other entrant.  The results are reported as a matrix of win
+rates with their confidence intervals, and as Elo ratings fitted to all of the games at once.
+
+The games for each pairing are split into small batches, and the batches for all of the pairings are handed out to
+the worker processes from a single queue as each worker becomes free.  A worker which finishes a batch of quick games
+just takes another batch, rather than waiting for the workers stuck in long matchups, so every worker stays busy until
+the queue is empty.
+
+If a checkpoint file is given, the results are saved to it after every batch.  A tournament run again with the same
+entrants, settings and checkpoint file only plays the batches which weren't finished.  Every game can also be recorded
+in a :class:`ResultStore <hearthbreaker.tools.results.ResultStore>`.
+
+A tournament can also be run from the command line::
+
+    python -m hearthbreaker.tools.tournament --agents Random Trade --games 100 example.hsdeck zoo.hsdeck
+"""
+
+#: An agent, by its name in :data:`hearthbreaker.agents.registry`, playing a :class:`DeckList`
+Entrant = namedtuple("Entrant", ["agent", "deck"])
+
+
+def _entrant_name(entrant):
+    return "{}/{}".format(entrant.agent, entrant.deck.name)
+
+
+def _play_batch(batch):
+    pairing, start, seeds, keep_games = batch
+    decks, agents = shared()[pairing]
+    games = [] if keep_games else None
+    return (pairing, start) + play_games(decks, agents, seeds, games) + (games,)
+
+
+class TournamentResults:
+    """
+    The number of games each entrant in a tournament has won, lost and drawn against each other entrant
+    """
+
+    def __init__(self, entrants):
+        """
+        Create an empty set of results
+
+        :param list[Entrant] entrants: The entrants in the tournament
+        """
+        self.entrants = list(entrants)
+        count = len(self.entrants)
+        #: ``wins[i][j]`` is the number of games entrant ``i`` won against entrant ``j``
+        self.wins = [[0] * count for i in range(count)]
+        #: ``draws[i][j]`` is the number of games drawn between entrants ``i`` and ``j``
+        self.draws = [[0] * count for i in range(count)]
+
+    def add(self, first, second, first_wins, second_wins, draws):
+        """
+        Record the results of some games between two entrants
+
+        :param int first: The index of one of the entrants
+        :param int second: The index of the other entrant
+        :param int first_wins: The number of games the first entrant won
+        :param int second_wins: The number of games the second entrant won
+        :param int draws: The number of games drawn
+        """
+        self.wins[first][second] += first_wins
+        self.wins[second][first] += second_wins
+        self.draws[first][second] += draws
+        self.draws[second][first] += draws
+
+    def games(self, first, second):
+        """
+        :return: The number of games played between two entrants
+        :rtype: int
+        """
+        return self.wins[first][second] + self.wins[second][first] + self.draws[first][second]
+
+    def win_rate(self, first, second):
+        """
+        :return: The fraction of the games against ``second`` which ``first`` won, counting draws as half a win, or
+                 None if they haven't played each other
+        :rtype: float
+        """
+        games = self.games(first, second)
+        if games == 0:
+            return None
+        return (self.wins[first][second] + self.draws[first][second] / 2) / games
+
+    def confidence_interval(self, first, second, z=1.96):
+        """
+        :return: The Wilson score interval for :meth:`win_rate`
+        :rtype: (float, float)
+        """
+        return wilson_interval(self.wins[first][second] + self.draws[first][second] / 2,
+                               self.games(first, second), z)
+
+    def ratings(self, prior=1.0, iterations=1000):
+        """
+        Fit Elo ratings to the results.  The ratings are the maximum likelihood estimate of a Bradley-Terry model,
+        scaled so that a difference of 400 points means the stronger entrant is expected to win 10 games for each one
+        it loses, and centred on 1500.
+
+        :param float prior: The number of imaginary drawn games added between every pair of entrants, so that an
+                            entrant which won or lost every game still gets a finite rating
+        :param int iterations: The maximum number of iterations to use when fitting the ratings
+        :return: The rating of each entrant, in the same order as :attr:`entrants`
+        :rtype: list[float]
+        """
+        count = len(self.entrants)
+        if count < 2:
+            return [1500.0] * count
+        scores = [sum(self.wins[i][j] + (self.draws[i][j] + prior) / 2 for j in range(count) if j != i)
+                  for i in range(count)]
+        games = [[self.games(i, j) + prior for j in range(count)] for i in range(count)]
+        strengths = [1.0] * count
+        for iteration in range(iterations):
+            updated = [scores[i] / sum(games[i][j] / (strengths[i] + strengths[j]) for j in range(count) if j != i)
+                       for i in range(count)]
+            scale = math.exp(sum(math.log(strength) for strength in updated) / count)
+            updated = [strength / scale for strength in updated]
+            converged = max(abs(new - old) for new, old in zip(updated, strengths)) < 1e-9
+            strengths = updated
+            if converged:
+                break
+        return [1500 + 400 * math.log10(strength) for strength in strengths]
+
+    def __to_json__(self):
+        count = len(self.entrants)
+        ratings = self.ratings()
+        return {
+            'entrants': [_entrant_name(entrant) for entrant in self.entrants],
+            'ratings': ratings,
+            'wins': self.wins,
+            'draws': self.draws,
+            'win_rates': [[self.win_rate(i, j) for j in range(count)] for i in range(count)],
+            'intervals': [[list(self.confidence_interval(i, j)) if i != j else None for j in range(count)]
+                          for i in range(count)],
+        }
+
+    def format_table(self):
+        """
+        :return: A plain text report of the ratings and win rates, with the entrants ordered by rating
+        :rtype: str
+        """
+        ratings = self.ratings()
+        order = sorted(range(len(self.entrants)), key=lambda i: -ratings[i])
+        names = [_entrant_name(self.entrants[i]) for i in order]
+        width = max(len(name) for name in names)
+        lines = ["{:<{}}  {:>6}".format("Entrant", width, "Elo")]
+        for i, name in zip(order, names):
+            lines.append("{:<{}}  {:>6.0f}".format(name, width, ratings[i]))
+        lines.append("")
+        columns = "  ".join("{:>6}".format(index + 1) for index in range(len(order)))
+        lines.append("{:<{}}  {}".format("Win rate", width + 4, columns))
+        for row, (i, name) in enumerate(zip(order, names)):
+            cells = []
+            for j in order:
+                rate = self.win_rate(i, j)
+                cells.append("{:>6}".format("-" if rate is None else "{:.1%}".format(rate)))
+            lines.append("{:<{}}  {}".format("{}. {}".format(row + 1, name), width + 4, "  ".join(cells)))
+        return "\n".join(lines)
+
+
+class Tournament:
+    """
+    A round robin tournament, in which every entrant plays the same number of games against every other entrant
+    """
+
+    def __init__(self, entrants, games, batch_size=10, seed=0):
+        """
+        Create a new tournament
+
+        :param list[Entrant] entrants: The agents and decks taking part
+        :param int games: The number of games to play between each pair of entrants
+        :param int batch_size: The number of games given to a worker at a time
+        :param int seed: The seed for the first game.  Every game in the tournament has its own seed, counting up
+                         from this one
+        """
+        self.entrants = list(entrants)
+        self.games = games
+        self.batch_size = batch_size
+        self.seed = seed
+        self.pairings = list(itertools.combinations(range(len(self.entrants)), 2))
+
+    @staticmethod
+    def round_robin(agents, decks, games, batch_size=10, seed=0):
+        """
+        Create a tournament with an entrant for every combination of agent and deck
+
+        :param list[str] agents: The names of the agents in :data:`hearthbreaker.agents.registry`
+        :param list[DeckList] decks: The decks for the agents to play
+        :rtype: Tournament
+        """
+        return Tournament([Entrant(agent, deck) for agent in agents for deck in decks], games, batch_size, seed)
+
+    def _batches(self, finished, keep_games=False):
+        # Batches from every pairing are interleaved, so that slow matchups are spread through the whole queue
+        for start in range(0, self.games, self.batch_size):
+            for index, (first, second) in enumerate(self.pairings):
+                if "{}:{}".format(index, start) in finished:
+                    continue
+                first_seed = self.seed + index * self.games
+                yield (index, start, range(first_seed + start, first_seed + min(start + self.batch_size, self.games)),
+                       keep_games)
+
+    def _settings(self):
+        return {
+            'entrants': [[entrant.agent, entrant.deck.name, entrant.deck.cards] for entrant in self.entrants],
+            'games': self.games,
+            'batch_size': self.batch_size,
+            'seed': self.seed,
+        }
+
+    def _load_checkpoint(self, checkpoint):
+        if checkpoint is None or not os.path.exists(checkpoint):
+            return {}
+        with open(checkpoint, "r") as checkpoint_file:
+            saved = json.load(checkpoint_file)
+        if saved['settings'] != self._settings():
+            raise ValueError("The checkpoint {} was written by a different tournament".format(checkpoint))
+        return saved['finished']
+
+    def _save_checkpoint(self, checkpoint, finished):
+        # Written to another file first, so that the checkpoint is never left half written
+        temporary = checkpoint + ".tmp"
+        with open(temporary, "w") as checkpoint_file:
+            json.dump({'settings': self._settings(), 'finished': finished}, checkpoint_file)
+        os.replace(temporary, checkpoint)
+
+    def run(self, processes=None, checkpoint=None, store=None):
+        """
+        Play all of the games in the tournament which haven't already been played
+
+        :param int processes: The number of worker processes to use.  Defaults to the number of CPUs, and with 1 the
+                              games are played in this process
+        :param str checkpoint: The name of a file to save the results to after every batch, and to resume from
+        :param hearthbreaker.tools.results.ResultStore store: A database to record every game played in
+        :rtype: TournamentResults
+        """
+        results = TournamentResults(self.entrants)
+        finished = self._load_checkpoint(checkpoint)
+        for key, (first_wins, second_wins, draws) in finished.items():
+            first, second = self.pairings[int(key.split(":")[0])]
+            results.add(first, second, first_wins, second_wins, draws)
+
+        batches = list(self._batches(finished, store is not None))
+        # The workers are handed the decks and agents for every pairing when they start, so that the batches only
+        # need to say which pairing they are for
+        matchups = [((self.entrants[first].deck, self.entrants[second].deck),
+                     (self.entrants[first].agent, self.entrants[second].agent)) for first, second in self.pairings]
+        # The pool is created before the first game is added to the store, which is what starts the store's writer
+        # thread, so the workers aren't forked from a process with other threads running
+        with WarmPool(processes, matchups) as pool:
+            outcomes = pool.imap_unordered(_play_batch, batches)
+            for index, start, first_wins, second_wins, draws, games in outcomes:
+                first, second = self.pairings[index]
+                results.add(first, second, first_wins, second_wins, draws)
+                if store is not None:
+                    decks = (self.entrants[first].deck, self.entrants[second].deck)
+                    agents = (self.entrants[first].agent, self.entrants[second].agent)
+                    for game in games:
+                        store.add(decks, agents, game)
+                finished["{}:{}".format(index, start)] = [first_wins, second_wins, draws]
+                if checkpoint is not None:
+                    if store is not None:
+                        # The batch can only be marked as finished once its games are in the database, or a resumed
+                        # tournament would skip games that were never written
+                        store.flush()
+                    self._save_checkpoint(checkpoint, finished)
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play a round robin tournament between agents and decks")
+    parser.add_argument("decks", nargs="+", help="The .hsdeck files to play")
+    parser.add_argument("--agents", nargs="+", default=registry.get_names(), help="The agents to play the decks")
+    parser.add_argument("--games", type=int, default=100, help="The number of games for each pair of entrants")
+    parser.add_argument("--batch-size", type=int, default=10, help="The number of games in each batch")
+    parser.add_argument("--seed", type=int, default=0, help="The seed for the first game")
+    parser.add_argument("--processes", type=int, default=None, help="The number of worker processes")
+    parser.add_argument("--checkpoint", default=None, help="A file to save progress to, and to resume from")
+    parser.add_argument("--json", default=None, help="A file to write the full results to")
+    parser.add_argument("--database", default=None, help="A SQLite database to record every game in")
+    args = parser.parse_args()
+
+    tournament = Tournament.round_robin(args.agents, [read_deck(filename) for filename in args.decks], args.games,
+                                        args.batch_size, args.seed)
+    if args.database:
+        with ResultStore(args.database) as result_store:
+            tournament_results = tournament.run(args.processes, args.checkpoint, result_store)
+    else:
+        tournament_results = tournament.run(args.processes, args.checkpoint)
+    print(tournament_results.format_table())
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(tournament_results.__to_json__(), json_file, indent=1)
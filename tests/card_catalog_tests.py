@@ -0,0 +1,72 @@
+import json
+import random
+import unittest
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.cards import Abomination, Wisp, Moonfire, StonetuskBoar
+from hearthbreaker.cards.catalog import card_id, card_name, official_id, from_official_id, portable_id, register, \
+    CATALOG_SIZE
+from hearthbreaker.engine import card_table, card_lookup, Game
+from hearthbreaker.serialization.serialization import serialize
+from tests.agents.testing_agents import OneCardPlayingAgent
+from tests.testing_utils import generate_game_for
+
+
+class TestCardCatalog(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_all_cards_in_catalog(self):
+        for name in card_table:
+            self.assertLess(card_id(name), CATALOG_SIZE,
+                            "'{}' must be added to the end of the card catalog".format(name))
+            self.assertEqual(name, card_name(card_id(name)))
+
+    def test_ids_are_stable(self):
+        self.assertEqual(0, card_id("Abomination"))
+        self.assertEqual(0, Abomination().card_id)
+        self.assertEqual(683, Wisp().card_id)
+        self.assertEqual("Wisp", card_lookup(683).name)
+
+    def test_official_ids(self):
+        self.assertEqual("EX1_097", official_id("Abomination"))
+        self.assertEqual("CS2_008", official_id("Moonfire"))
+        self.assertEqual("Moonfire", from_official_id("EX1_166a"))
+        self.assertIsNone(official_id("Malfurion Stormrage"))
+        self.assertRaises(KeyError, from_official_id, "XXX_000")
+
+    def test_unknown_cards(self):
+        # Looking up a card doesn't add it to the catalog
+        self.assertRaises(KeyError, card_id, "A card which hasn't been written yet")
+        self.assertRaises(KeyError, card_id, "A card which hasn't been written yet")
+        new_id = register("A card which hasn't been written yet")
+        self.assertGreaterEqual(new_id, CATALOG_SIZE)
+        self.assertEqual(new_id, register("A card which hasn't been written yet"))
+        self.assertEqual(new_id, card_id("A card which hasn't been written yet"))
+        self.assertEqual(683, register("Wisp"))
+        self.assertEqual("A card which hasn't been written yet", card_name(new_id))
+        self.assertRaises(IndexError, card_name, -1)
+        self.assertEqual("A card which hasn't been written yet", portable_id(new_id))
+        self.assertEqual(683, portable_id(683))
+
+    def test_graveyard(self):
+        game = generate_game_for(StonetuskBoar, Moonfire, OneCardPlayingAgent, DoNothingAgent)
+        for turn in range(3):
+            game.play_single_turn()
+        self.assertEqual(StonetuskBoar().card_id, game.players[0].minions[0].card_id)
+        game.players[0].minions[0].die(None)
+        game.check_delayed()
+        self.assertEqual([StonetuskBoar().card_id], game.players[0].graveyard)
+
+        state = json.loads(serialize(game))
+        self.assertEqual(game.players[0].graveyard, state['players'][0]['graveyard'])
+        state['players'][0]['graveyard'] = ["Stonetusk Boar" for card in state['players'][0]['graveyard']]
+        copied = Game.__from_json__(state, [player.agent for player in game.players])
+        self.assertEqual(game.players[0].graveyard, copied.players[0].graveyard)
+
+        unknown = register("A card only this process knows")
+        game.players[0].graveyard.append(unknown)
+        state = json.loads(serialize(game))
+        self.assertEqual([StonetuskBoar().card_id, "A card only this process knows"],
+                         state['players'][0]['graveyard'])
+        copied = Game.__from_json__(state, [player.agent for player in game.players])
+        self.assertEqual(game.players[0].graveyard, copied.players[0].graveyard)
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import hearthbreaker.cards.loader
+from hearthbreaker.cards.loader import load_cards, load_definitions
+from hearthbreaker.engine import card_table
+from tests.agents.testing_agents import PlayAndAttackAgent
+from tests.testing_utils import generate_game_for
+
+
+def _to_json(obj):
+    return json.dumps(obj, default=lambda o: o.__to_json__(), sort_keys=True)
+
+
+class TestCardLoader(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "card_defs.json")
+        shutil.copy("card_defs.json", self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_matches_cards(self):
+        classes = load_cards(self.filename)
+        for name in ["Stonetusk Boar", "Abomination", "Wild Pyromancer", "Druid of the Claw", "Sylvanas Windrunner",
+                     "Loot Hoarder", "Harvest Golem", "Gorehowl", "Death's Bite", "Perdition's Blade"]:
+            loaded = classes[name]()
+            original = card_table[name]()
+            self.assertEqual(name, loaded.ref_name)
+            for attr in ["name", "mana", "character_class", "rarity", "collectible", "overload", "battlecry",
+                         "choices", "combo", "effects", "buffs"]:
+                self.assertEqual(_to_json(getattr(original, attr, None)), _to_json(getattr(loaded, attr, None)))
+            if original.is_minion():
+                original_minion = original.create_minion(None)
+                loaded_minion = loaded.create_minion(None)
+                for attr in ["base_attack", "base_health", "deathrattle", "effects", "auras", "buffs", "enrage"]:
+                    self.assertEqual(_to_json(getattr(original_minion, attr)), _to_json(getattr(loaded_minion, attr)))
+            else:
+                original_weapon = original.create_weapon(None)
+                loaded_weapon = loaded.create_weapon(None)
+                for attr in ["base_attack", "durability", "deathrattle", "effects", "auras", "buffs"]:
+                    self.assertEqual(_to_json(getattr(original_weapon, attr)), _to_json(getattr(loaded_weapon, attr)))
+
+    def test_copies_tags(self):
+        card_type = load_cards(self.filename)["Abomination"]
+        first = card_type()
+        second = card_type()
+        self.assertIsNot(first.create_minion(None).deathrattle[0], second.create_minion(None).deathrattle[0])
+        self.assertIsNot(first.create_minion(None).deathrattle[0], first.create_minion(None).deathrattle[0])
+
+    def test_play_game(self):
+        classes = load_cards(self.filename)
+        game = generate_game_for([classes["Loot Hoarder"], classes["Harvest Golem"]],
+                                 [classes["Stonetusk Boar"], classes["Abomination"]],
+                                 PlayAndAttackAgent, PlayAndAttackAgent)
+        for turn in range(12):
+            game.play_single_turn()
+        self.assertGreater(len(game.players[0].graveyard), 0)
+        self.assertGreater(len(game.players[1].graveyard), 0)
+
+    def test_cache(self):
+        definitions = load_definitions(self.filename)
+        self.assertTrue(os.path.exists(self.filename + ".cache"))
+        self.assertEqual(["card_defs.json", "card_defs.json.cache"], sorted(os.listdir(self.directory)))
+
+        with mock.patch.object(hearthbreaker.cards.loader, "_decode_definition") as decode:
+            self.assertEqual(definitions, load_definitions(self.filename))
+            self.assertFalse(decode.called)
+
+        with open(self.filename, "r") as file:
+            card_defs = json.load(file)
+        card_defs = [card_def for card_def in card_defs if card_def['name'] == "Wisp"]
+        with open(self.filename, "w") as file:
+            json.dump(card_defs, file)
+        self.assertEqual(["Wisp"], list(load_cards(self.filename).keys()))
+
+        with open(self.filename + ".cache", "wb") as file:
+            file.write(b"not a cache")
+        self.assertEqual(["Wisp"], list(load_cards(self.filename).keys()))
+
+    def test_register(self):
+        old_table = dict(card_table)
+        try:
+            classes = load_cards(self.filename, register=True)
+            self.assertIs(classes["Wisp"], card_table["Wisp"])
+            self.assertIs(card_table["Fireball"], old_table["Fireball"])
+        finally:
+            card_table.clear()
+            card_table.update(old_table)
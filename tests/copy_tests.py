@@ -90,6 +90,20 @@ class TestGameCopying(unittest.TestCase):
         for turn in range(0, 5):
             game.play_single_turn()
 
+    def test_hero_power_copying(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        for turn in range(0, 3):
+            game.play_single_turn()
+
+        hero = game.current_player.hero
+        copied_hero = hero.copy(game.other_player)
+        self.assertIs(hero, hero.power.hero)
+        self.assertIs(copied_hero, copied_hero.power.hero)
+
+        hero.power.use()
+        self.assertTrue(hero.power.used)
+        self.assertFalse(copied_hero.power.used)
+
 
 class TestMinionCopying(unittest.TestCase, TestUtilities):
     def setUp(self):
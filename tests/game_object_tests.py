@@ -8,8 +8,17 @@ from hearthbreaker.cards.minions.rogue import AnubarAmbusher
 from hearthbreaker.engine import Game, Deck, card_lookup
 from tests.agents.testing_agents import CardTestingAgent, OneCardPlayingAgent, PlayAndAttackAgent
 from tests.testing_utils import generate_game_for, mock
-from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, SylvanasWindrunner
+from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, \
+    SylvanasWindrunner, MurlocRaider, Wisp, SenjinShieldmasta, WorgenInfiltrator, LootHoarder, Fireball, SeaGiant, \
+    SorcerersApprentice, Snipe
+from hearthbreaker.constants import MINION_TYPE, KEYWORD
 from hearthbreaker.game_objects import Bindable
+from hearthbreaker.serialization.serialization import serialize, deserialize
+import hearthbreaker.targeting
+from hearthbreaker.tags.base import Buff
+from hearthbreaker.tags.condition import IsType, HasStatus, IsMinion, And, Not
+from hearthbreaker.tags.selector import MinionSelector, BothPlayer, RandomPicker
+from hearthbreaker.tags.status import ManaChange
 
 
 class TestGame(unittest.TestCase):
@@ -89,42 +98,65 @@ class TestGame(unittest.TestCase):
             for turn in range(0, secret.mana * 2 - 2):
                 game.play_single_turn()
 
-            def assert_different():
+            def current_events():
                 new_events = game.events.copy()
                 new_events.update(game.other_player.hero.events)
                 new_events.update(game.other_player.events)
                 new_events.update(game.current_player.hero.events)
                 new_events.update(game.current_player.events)
-                self.assertNotEqual(events, new_events, secret.name)
-
-            def assert_same():
-                new_events = game.events.copy()
-                new_events.update(game.current_player.hero.events)
-                new_events.update(game.current_player.events)
-                new_events.update(game.other_player.hero.events)
-                new_events.update(game.other_player.events)
-                self.assertEqual(events, new_events)
-
-            game.current_player.bind("turn_ended", assert_different)
-            game.other_player.bind("turn_ended", assert_same)
+                return new_events
 
             # save the events as they are prior to the secret being played
-            events = game.events.copy()
-            events.update(game.other_player.hero.events)
-            events.update(game.other_player.events)
-            events.update(game.current_player.hero.events)
-            events.update(game.current_player.events)
+            events = current_events()
 
-            # The secret is played, but the events aren't updated until the secret is activated
+            # The secret is bound as soon as it is played, but can't be revealed on its owner's turn
             game.play_single_turn()
+            owner = game.current_player
+
+            self.assertEqual(1, len(owner.secrets))
+            self.assertNotEqual(events, current_events(), secret.name)
+            self.assertIsNone(game.secret_player)
 
-            self.assertEqual(1, len(game.current_player.secrets))
+            # It stays bound through the opponent's turn, when it can be revealed
+            game._start_turn()
+            self.assertIs(owner, game.secret_player)
+            self.assertNotEqual(events, current_events(), secret.name)
+            game._end_turn()
+            self.assertIsNone(game.secret_player)
 
-            # Now the events should be changed
             game.play_single_turn()
+            self.assertNotEqual(events, current_events(), secret.name)
 
-            # Now the events should be reset
+    def test_secrets_copied(self):
+        game = generate_game_for(Snipe, StonetuskBoar, CardTestingAgent, CardTestingAgent)
+        for turn in range(0, 3):
             game.play_single_turn()
+        self.assertEqual(1, len(game.current_player.secrets))
+
+        # The copies have to bind their secrets themselves, since they aren't bound at the start of a turn any more
+        copied = game.copy()
+        restored = deserialize(serialize(game), [CardTestingAgent(), CardTestingAgent()])
+        for current in [game, copied, restored]:
+            random.seed(1857)
+            current.play_single_turn()
+            self.assertEqual(0, len(current.other_player.secrets))
+            self.assertEqual(2, len(current.current_player.minions))
+            self.assertEqual(1, current.current_player.minions[0].health)
+
+    def test_secret_player_restored(self):
+        game = generate_game_for(Snipe, StonetuskBoar, CardTestingAgent, CardTestingAgent)
+        for turn in range(0, 3):
+            game.play_single_turn()
+        # Saved between turns, when nobody's secrets can be revealed
+        self.assertIsNone(game.secret_player)
+        restored = deserialize(serialize(game), [CardTestingAgent(), CardTestingAgent()])
+        self.assertIsNone(restored.secret_player)
+
+        # Saved during the opponent's turn
+        game._start_turn()
+        restored = deserialize(serialize(game), [CardTestingAgent(), CardTestingAgent()])
+        self.assertIs(restored.other_player, restored.secret_player)
+        self.assertIs(restored.players[game.players.index(game.secret_player)], restored.secret_player)
 
     def test_physical_hero_attacks(self):
         game = generate_game_for(Naturalize, ArcaneIntellect, PredictableAgent, PredictableAgent)
@@ -167,6 +199,142 @@ class TestGame(unittest.TestCase):
 
         self.assertEqual(1, len(game.current_player.minions))
 
+    def test_target_cache(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        MurlocRaider().summon(game.players[0], game, 0)
+        Wisp().summon(game.players[0], game, 1)
+        MurlocRaider().summon(game.players[1], game, 0)
+        source = game.players[0].minions[0]
+        murlocs = MinionSelector(IsType(MINION_TYPE.MURLOC), BothPlayer())
+
+        targets = murlocs.get_targets(source)
+        self.assertEqual([game.players[1].minions[0]], targets)
+        self.assertEqual(1, len(game.target_cache))
+        targets.clear()
+        self.assertEqual([game.players[1].minions[0]], murlocs.get_targets(source))
+
+        version = game.board_version
+        MurlocRaider().summon(game.players[1], game, 1)
+        self.assertGreater(game.board_version, version)
+        self.assertEqual(game.players[1].minions, murlocs.get_targets(source))
+
+        game.players[1].minions[0].die(None)
+        self.assertEqual([game.players[1].minions[1]], murlocs.get_targets(source))
+        self.assertEqual(0, len(game.copy().target_cache))
+
+        game.target_cache.clear()
+        self.assertEqual([], MinionSelector(HasStatus("taunt"), BothPlayer()).get_targets(source))
+        self.assertEqual(0, len(game.target_cache))
+
+    def test_keywords(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        SenjinShieldmasta().summon(game.players[1], game, 0)
+        WorgenInfiltrator().summon(game.players[1], game, 1)
+        taunt = game.players[1].minions[0]
+        stealth = game.players[1].minions[1]
+        self.assertEqual(KEYWORD.TAUNT, taunt.keywords)
+        self.assertEqual(KEYWORD.STEALTH, stealth.keywords)
+        self.assertEqual(KEYWORD.TAUNT | KEYWORD.STEALTH, game.players[1].minion_keywords())
+        self.assertTrue(HasStatus("taunt").evaluate(stealth, taunt))
+        self.assertFalse(HasStatus("taunt").evaluate(taunt, stealth))
+
+        taunt.silence()
+        stealth.frozen = True
+        self.assertEqual(0, taunt.keywords)
+        self.assertEqual(KEYWORD.STEALTH | KEYWORD.FROZEN, stealth.keywords)
+        self.assertEqual(KEYWORD.STEALTH | KEYWORD.FROZEN, game.players[1].minion_keywords())
+        stealth.stealth = False
+        stealth.frozen = 0
+        self.assertEqual(0, game.players[1].minion_keywords())
+        self.assertEqual("divine_shield", KEYWORD.to_str(KEYWORD.from_str("divine_shield")))
+
+    def test_delayed_queue(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        for index in range(0, 3):
+            LootHoarder().summon(game.players[0], game, index)
+        first, second, third = game.players[0].minions
+        died = []
+        game.players[0].bind("minion_died", lambda minion, by: died.append(minion))
+
+        third.die(None)
+        first.die(None)
+        # Silencing a minion after it dies doesn't stop its deathrattle
+        first.silence()
+        self.assertEqual(2, len(game.delayed_queue))
+        self.assertEqual(3, len(game.players[0].minions))
+        hand_size = len(game.players[0].hand)
+
+        game.check_delayed()
+        self.assertEqual([first, third], died)
+        self.assertEqual([second], game.players[0].minions)
+        self.assertEqual(hand_size + 2, len(game.players[0].hand))
+        self.assertEqual([], game.delayed_queue)
+        game.check_delayed()
+        self.assertEqual([first, third], died)
+
+    def test_deathrattle_saved_with_died_event(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        LootHoarder().summon(game.players[0], game, 0)
+        hoarder = game.players[0].minions[0]
+        deathrattle = hoarder.deathrattle
+        # Queue another event for the minion while it is dying, after its died event
+        with mock.patch.object(game, "board_changed", side_effect=lambda: hoarder.delayed_trigger("test_event")):
+            died = hoarder.die(None)
+        self.assertEqual("died", died['event'])
+        self.assertIs(deathrattle, died['deathrattle'])
+        self.assertEqual([died, {'event': "test_event", 'args': ()}], hoarder.delayed)
+
+    def test_mana_cache(self):
+        game = generate_game_for([Fireball, SeaGiant, Wisp], StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        player = game.players[0]
+        fireball, giant, wisp = player.hand[0:3]
+        player.mana = 3
+        self.assertEqual(4, fireball.mana_cost())
+        self.assertEqual(10, giant.mana_cost())
+        self.assertIn(id(fireball), game.mana_cache)
+        self.assertNotIn(id(giant), game.mana_cache)
+        self.assertEqual([wisp], [card for card in player.playable_cards() if card in [fireball, giant, wisp]])
+
+        SorcerersApprentice().summon(player, game, 0)
+        self.assertEqual({}, game.mana_cache)
+        self.assertEqual(3, fireball.mana_cost())
+        self.assertEqual(9, giant.mana_cost())
+        self.assertIn(fireball, player.playable_cards())
+
+        player.minions[0].silence()
+        self.assertEqual(4, fireball.mana_cost())
+        fireball.add_buff(Buff(ManaChange(-2)))
+        self.assertEqual(2, fireball.mana_cost())
+
+    def test_random_selection(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        items = list(range(0, 20))
+        for seed in range(0, 10):
+            random.seed(seed)
+            expected = [[item for item in items if item % 3][random.randint(0, 12)] for i in range(0, 5)]
+            expected.append(random.randint(0, 100))
+            random.seed(seed)
+            actual = [game.random_draw(items, lambda item: item % 3) for i in range(0, 5)]
+            actual.append(random.randint(0, 100))
+            self.assertEqual(expected, actual)
+
+            random.seed(seed)
+            expected = [(items + [20, 21])[random.randint(0, 21)] for i in range(0, 5)]
+            random.seed(seed)
+            self.assertEqual(expected, [game.random_choice_from(items, [], [20, 21]) for i in range(0, 5)])
+        self.assertIsNone(game.random_draw(items, lambda item: item > 20))
+
+        for index in range(0, 3):
+            Wisp().summon(game.players[1], game, index)
+        wisps = game.players[1].minions
+        picker = RandomPicker(10)
+        picked = []
+        for target in picker.pick(game.players[0].hero, list(wisps)):
+            picked.append(target)
+            target.die(None)
+        self.assertEqual(3, len(picked))
+        self.assertEqual(set(wisps), set(picked))
+
 
 class TestBinding(unittest.TestCase):
     def test_bind(self):
@@ -191,3 +359,62 @@ class TestBinding(unittest.TestCase):
         binder.trigger("test")
         event.assert_called_once_with(1, 5, 6)
         self.assertEqual(event2.call_count, 2)
+
+    def test_bind_prefilter(self):
+        event = mock.Mock()
+        event2 = mock.Mock()
+        key = mock.Mock(side_effect=lambda value: value % 2)
+        binder = Bindable()
+        binder.bind("test", event, (key, 1))
+        binder.bind("test", event2, (key, 0))
+        binder.trigger("test", 3, 5)
+        event.assert_called_once_with(3, 5)
+        self.assertEqual(0, event2.call_count)
+        binder.trigger("test", 4)
+        event.assert_called_once_with(3, 5)
+        event2.assert_called_once_with(4)
+        # The key is only worked out once each time the event is triggered
+        self.assertEqual(2, key.call_count)
+
+        self.assertEqual(IsMinion().prefilter(), And(IsMinion(), IsType(MINION_TYPE.MURLOC)).prefilter())
+        self.assertEqual(IsType(MINION_TYPE.MURLOC).prefilter(),
+                         And(Not(IsMinion()), IsType(MINION_TYPE.MURLOC)).prefilter())
+        self.assertIsNone(Not(IsMinion()).prefilter())
+
+
+class TestTargeting(unittest.TestCase):
+    def test_targets(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        for index in range(0, 2):
+            MurlocRaider().summon(game.current_player, game, index)
+            Wisp().summon(game.other_player, game, index)
+        friendly = game.current_player.minions
+        enemy = game.other_player.minions
+        heroes = [game.other_player.hero, game.current_player.hero]
+        all_targets = enemy + friendly + heroes
+
+        self.assertEqual(all_targets, hearthbreaker.targeting.find_spell_target(game, lambda t: True))
+        self.assertEqual(enemy + friendly, hearthbreaker.targeting.find_minion_spell_target(game, lambda t: True))
+        self.assertEqual(enemy + heroes[:1], hearthbreaker.targeting.find_enemy_spell_target(game, lambda t: True))
+        self.assertEqual(friendly + heroes[1:],
+                         hearthbreaker.targeting.find_friendly_spell_target(game, lambda t: True))
+        self.assertIsNone(hearthbreaker.targeting.find_enemy_minion_battlecry_target(game, lambda t: False))
+
+        enemy[0].stealth = True
+        targetable = [target for target in all_targets if target.spell_targetable()]
+        self.assertEqual(targetable, hearthbreaker.targeting.find_spell_target(game, lambda t: t.spell_targetable()))
+        self.assertEqual(len(all_targets) - 1, hearthbreaker.targeting.count_targets(
+            game, hearthbreaker.targeting.find_spell_target, lambda t: t.spell_targetable()))
+
+        self.assertFalse(hearthbreaker.targeting.has_target(
+            game, hearthbreaker.targeting.find_enemy_minion_spell_target, lambda t: t.health > 1))
+        self.assertTrue(hearthbreaker.targeting.has_target(
+            game, hearthbreaker.targeting.find_enemy_minion_battlecry_target, lambda t: False))
+        self.assertEqual(0, hearthbreaker.targeting.count_targets(
+            game, hearthbreaker.targeting.find_enemy_minion_battlecry_target, lambda t: False))
+
+        Wisp().summon(game.other_player, game, 2)
+        self.assertEqual(3, hearthbreaker.targeting.count_targets(
+            game, hearthbreaker.targeting.find_enemy_minion_spell_target, lambda t: True))
+        self.assertEqual(game.other_player.minions + friendly,
+                         hearthbreaker.targeting.find_minion_spell_target(game, lambda t: True))
@@ -175,6 +175,29 @@ class TestReplay(unittest.TestCase):
         new_replay.write_json(other_output)
         self.assertEqual(other_output.getvalue(), old_output)
 
+    def test_json_card_ids(self):
+        deck1 = hearthbreaker.engine.Deck([RagnarosTheFirelord() for i in range(0, 30)], Jaina())
+        deck2 = hearthbreaker.engine.Deck([StonetuskBoar() for i in range(0, 30)], Malfurion())
+        random.seed(4879)
+        game = Game([deck1, deck2], [PlayAndAttackAgent(), OneCardPlayingAgent()])
+        replay = record(game)
+        game.pre_game()
+        for turn in range(0, 17):
+            game.play_single_turn()
+
+        output = StringIO()
+        replay.write_json(output)
+        id_output = StringIO()
+        replay.write_json(id_output, card_ids=True)
+        self.assertEqual([[RagnarosTheFirelord().card_id], [StonetuskBoar().card_id]],
+                         [deck['cards'] for deck in json.loads(id_output.getvalue())['header']['decks']])
+
+        new_replay = Replay()
+        new_replay.read_json(StringIO(id_output.getvalue()))
+        other_output = StringIO()
+        new_replay.write_json(other_output)
+        self.assertEqual(output.getvalue(), other_output.getvalue())
+
     # Due to bug #55 (thanks to dur3x)
     def test_deck_shortening(self):
         deck1 = Deck([RagnarosTheFirelord(), RagnarosTheFirelord(), RagnarosTheFirelord(), RagnarosTheFirelord(),
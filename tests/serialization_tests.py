@@ -1,6 +1,13 @@
 import json
+import unittest
+from hearthbreaker.cards import StonetuskBoar, ArcaneExplosion, Wisp, MurlocRaider, Misdirection
+from hearthbreaker.cards.catalog import CATALOG_SIZE
 from hearthbreaker.engine import Game
+from hearthbreaker.serialization.binary import serialize_binary, deserialize_binary, encode, decode, FORMAT_VERSION
+from hearthbreaker.serialization.serialization import serialize, to_primitive, diff, apply_diff
 import tests.copy_tests
+from tests.agents.testing_agents import PlayAndAttackAgent, OneCardPlayingAgent
+from tests.testing_utils import generate_game_for
 
 
 class TestGameSerialization(tests.copy_tests.TestGameCopying):
@@ -43,3 +50,111 @@ class TestMinionSerialization(tests.copy_tests.TestMinionCopying):
     def tearDown(self):
         super().tearDown()
         Game.copy = self._old_copy
+
+
+class TestGameBinarySerialization(tests.copy_tests.TestGameCopying):
+    def setUp(self):
+        def serialization_copy(old_game):
+            game = deserialize_binary(serialize_binary(old_game), [player.agent for player in old_game.players])
+            game._has_turn_ended = old_game._has_turn_ended
+            return game
+
+        super().setUp()
+        self._old_copy = Game.copy
+        Game.copy = serialization_copy
+
+    def tearDown(self):
+        super().tearDown()
+        Game.copy = self._old_copy
+
+
+class TestMinionBinarySerialization(tests.copy_tests.TestMinionCopying):
+    def setUp(self):
+        def serialization_copy(old_game):
+            game = deserialize_binary(serialize_binary(old_game), [player.agent for player in old_game.players])
+            game._has_turn_ended = old_game._has_turn_ended
+            return game
+
+        super().setUp()
+        self._old_copy = Game.copy
+        Game.copy = serialization_copy
+
+    def tearDown(self):
+        super().tearDown()
+        Game.copy = self._old_copy
+
+
+class TestBinaryFormat(unittest.TestCase):
+    def test_round_trip(self):
+        structure = {
+            'ints': [0, 1, -1, 63, -64, 64, 127, 128, -129, 300, 2 ** 40, -(2 ** 40)],
+            'constants': [None, True, False, 1.5, -0.25],
+            'names': ["Wisp", "not a card", "", "é"],
+            'repeated': [{'status': {'name': 'change_attack', 'amount': 1}},
+                         {'status': {'name': 'change_attack', 'amount': 1}},
+                         {'status': {'name': 'change_attack', 'amount': True}}],
+        }
+        decoded = decode(encode(structure))
+        self.assertEqual(structure, decoded)
+        self.assertEqual(json.dumps(structure), json.dumps(decoded))
+        self.assertIs(decoded['repeated'][0], decoded['repeated'][1])
+        self.assertIsNot(decoded['repeated'][0], decoded['repeated'][2])
+
+    def test_matches_json(self):
+        game = generate_game_for([StonetuskBoar, ArcaneExplosion, Wisp], [MurlocRaider, Misdirection],
+                                 PlayAndAttackAgent, OneCardPlayingAgent)
+        for turn in range(8):
+            game.play_single_turn()
+            self.assertEqual(json.loads(serialize(game)), decode(serialize_binary(game)))
+        self.assertLess(len(serialize_binary(game)), len(serialize(game)) / 4)
+
+    def test_rejects_other_formats(self):
+        data = encode({'name': 'Wisp'})
+        self.assertRaises(ValueError, decode, b"not a game")
+        self.assertRaises(ValueError, decode, data[:3] + bytes([FORMAT_VERSION + 1]) + data[4:])
+        newer_catalog = CATALOG_SIZE + 1
+        newer_header = data[:4] + bytes([(newer_catalog & 0x7f) | 0x80, newer_catalog >> 7])
+        self.assertRaises(ValueError, decode, newer_header + data[6:])
+
+
+class TestDeltaSerialization(unittest.TestCase):
+    def test_diff_structures(self):
+        old = {'a': 1, 'b': [1, 2, 3, 4], 'c': {'d': "x"}, 'e': [{'f': 1}, {'f': 2}, {'f': 3}]}
+        new = {'a': 1, 'b': [1, 3, 4, 5], 'c': {'g': "y"}, 'e': [{'f': 1}, {'f': 3, 'h': 4}], 'i': None}
+        self.assertIsNone(diff(old, json.loads(json.dumps(old))))
+        delta = diff(old, new)
+        self.assertEqual(new, apply_diff(old, delta))
+        self.assertEqual(new, apply_diff(old, json.loads(json.dumps(delta))))
+        self.assertEqual(new, apply_diff(old, decode(encode(delta))))
+        self.assertEqual({'a': 1, 'b': [1, 2, 3, 4], 'c': {'d': "x"}, 'e': [{'f': 1}, {'f': 2}, {'f': 3}]}, old)
+        self.assertEqual([5], apply_diff([], diff([], [5])))
+        self.assertEqual(3, apply_diff({'a': 1}, diff({'a': 1}, 3)))
+
+    def test_diff_type_changes(self):
+        old = {'a': 1, 'b': [True, 2], 'c': {'d': 1}}
+        new = {'a': True, 'b': [1, 2.0], 'c': {'d': 1.0}}
+        delta = diff(old, new)
+        self.assertIsNotNone(delta)
+        patched = apply_diff(old, delta)
+        self.assertEqual(new, patched)
+        self.assertIs(True, patched['a'])
+        self.assertIs(int, type(patched['b'][0]))
+        self.assertIs(float, type(patched['b'][1]))
+        self.assertIs(float, type(patched['c']['d']))
+        self.assertIs(True, apply_diff([1], diff([1], [True]))[0])
+
+    def test_consecutive_turns(self):
+        game = generate_game_for([StonetuskBoar, ArcaneExplosion, Wisp], [MurlocRaider, Misdirection],
+                                 PlayAndAttackAgent, OneCardPlayingAgent)
+        state = to_primitive(game)
+        for turn in range(10):
+            game.play_single_turn()
+            new_state = to_primitive(game)
+            delta = diff(state, new_state)
+            state = apply_diff(state, json.loads(json.dumps(delta)))
+            self.assertEqual(new_state, state)
+            self.assertLess(len(json.dumps(delta)), len(json.dumps(new_state)) / 2)
+
+        agents = [player.agent for player in game.players]
+        self.assertEqual(serialize(Game.__from_json__(json.loads(serialize(game)), agents)),
+                         serialize(Game.__from_json__(state, agents)))
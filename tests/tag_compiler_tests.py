@@ -0,0 +1,158 @@
+import copy
+import random
+import unittest
+import hearthbreaker.tags.compiler
+from hearthbreaker.agents.basic_agents import RandomAgent, DoNothingAgent
+from hearthbreaker.cards import *
+from hearthbreaker.cards.heroes import hero_for_class
+from hearthbreaker.constants import CHARACTER_CLASS, MINION_TYPE
+from hearthbreaker.engine import Game, Deck
+from hearthbreaker.serialization.serialization import serialize
+from hearthbreaker.tags.action import Damage, Heal, Summon
+from hearthbreaker.tags.base import ActionTag
+from hearthbreaker.tags.condition import IsType, OneIn
+from hearthbreaker.tags.selector import CharacterSelector, MinionSelector, BothPlayer, EnemyPlayer, RandomPicker, \
+    SelfSelector, PlayerSelector, PlayerOne
+from hearthbreaker.tags.compiler import compile_tag
+from tests.testing_utils import generate_game_for
+import tests.card_tests.druid_tests
+import tests.card_tests.mage_tests
+import tests.card_tests.hunter_tests
+import tests.card_tests.paladin_tests
+import tests.card_tests.priest_tests
+import tests.card_tests.rogue_tests
+import tests.card_tests.shaman_tests
+import tests.card_tests.warlock_tests
+import tests.card_tests.warrior_tests
+import tests.card_tests.neutral_tests
+
+
+class CompilerTester:
+    def setUp(self):
+        super().setUp()
+        hearthbreaker.tags.compiler.enable()
+
+    def tearDown(self):
+        super().tearDown()
+        hearthbreaker.tags.compiler.disable()
+
+
+class TestCompiledDruid(CompilerTester, tests.card_tests.druid_tests.TestDruid):
+    pass
+
+
+class TestCompiledMage(CompilerTester, tests.card_tests.mage_tests.TestMage):
+    pass
+
+
+class TestCompiledHunter(CompilerTester, tests.card_tests.hunter_tests.TestHunter):
+    pass
+
+
+class TestCompiledPaladin(CompilerTester, tests.card_tests.paladin_tests.TestPaladin):
+    pass
+
+
+class TestCompiledPriest(CompilerTester, tests.card_tests.priest_tests.TestPriest):
+    pass
+
+
+class TestCompiledRogue(CompilerTester, tests.card_tests.rogue_tests.TestRogue):
+    pass
+
+
+class TestCompiledShaman(CompilerTester, tests.card_tests.shaman_tests.TestShaman):
+    pass
+
+
+class TestCompiledWarlock(CompilerTester, tests.card_tests.warlock_tests.TestWarlock):
+    pass
+
+
+class TestCompiledWarrior(CompilerTester, tests.card_tests.warrior_tests.TestWarrior):
+    pass
+
+
+class TestCompiledNeutral(CompilerTester, tests.card_tests.neutral_tests.TestCommon):
+    pass
+
+
+class TestTagCompiler(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+        self.game = generate_game_for(Wisp, Wisp, DoNothingAgent, DoNothingAgent)
+        for player in self.game.players:
+            for index in range(0, 3):
+                ChillwindYeti().summon(player, self.game, index)
+        self.owner = self.game.players[0].minions[0]
+
+    def tearDown(self):
+        hearthbreaker.tags.compiler.disable()
+
+    def test_compiled_matches_interpreted(self):
+        tags = [
+            ActionTag(Damage(1), CharacterSelector(players=BothPlayer())),
+            ActionTag(Heal(2), MinionSelector(IsType(MINION_TYPE.BEAST), EnemyPlayer())),
+            ActionTag(Damage(3), MinionSelector(OneIn(2), BothPlayer(), RandomPicker(2))),
+            ActionTag(Damage(4), CharacterSelector(None, PlayerOne(), RandomPicker())),
+            ActionTag(Summon(Wisp()), PlayerSelector(), OneIn(2)),
+        ]
+        for tag in tags:
+            expected = self.game.copy()
+            random.seed(1857)
+            found = tag.do(expected.players[0].minions[0])
+            expected_state = serialize(expected)
+
+            actual = self.game.copy()
+            random.seed(1857)
+            self.assertEqual(found, compile_tag(tag)(actual.players[0].minions[0]))
+            self.assertEqual(expected_state, serialize(actual))
+
+    def test_shares_generated_code(self):
+        first = compile_tag(ActionTag(Damage(1), CharacterSelector(players=BothPlayer())))
+        second = compile_tag(ActionTag(Damage(1), CharacterSelector(players=BothPlayer())))
+        third = compile_tag(ActionTag(Damage(2), CharacterSelector(players=BothPlayer())))
+        self.assertIs(first.__code__, second.__code__)
+        self.assertIsNot(first.__code__, third.__code__)
+
+    def test_replaced_nodes(self):
+        hearthbreaker.tags.compiler.enable()
+        self.assertTrue(hearthbreaker.tags.compiler.is_enabled())
+        tag = ActionTag(Damage(1), SelfSelector())
+        tag.do(self.owner)
+        self.assertEqual(4, self.owner.health)
+
+        tag.selector = MinionSelector(players=EnemyPlayer())
+        tag.do(self.owner)
+        self.assertEqual(4, self.owner.health)
+        self.assertEqual([4, 4, 4], [minion.health for minion in self.game.players[1].minions])
+
+        self.assertIn("_compiled", tag.__dict__)
+        self.assertNotIn("_compiled", copy.deepcopy(tag).__dict__)
+        hearthbreaker.tags.compiler.disable()
+        self.assertFalse(hearthbreaker.tags.compiler.is_enabled())
+
+    def test_random_games(self):
+        decks = []
+        for character_class in [CHARACTER_CLASS.MAGE, CHARACTER_CLASS.PRIEST, CHARACTER_CLASS.WARLOCK]:
+            decks.append((character_class, [ArcaneMissiles, Flamestrike, HolyNova, Hellfire, KnifeJuggler,
+                                            WildPyromancer, Abomination, AmaniBerserker, Consecration, Swipe,
+                                            ArcaneExplosion, RaidLeader, StormwindChampion, HarvestGolem,
+                                            CircleOfHealing] * 2))
+
+        def play(seed):
+            random.seed(seed)
+            game = Game([Deck([card() for card in decks[seed % 3][1]], hero_for_class(decks[seed % 3][0])),
+                         Deck([card() for card in decks[(seed + 1) % 3][1]],
+                              hero_for_class(decks[(seed + 1) % 3][0]))],
+                        [RandomAgent(), RandomAgent()])
+            for turn in range(0, 16):
+                game.play_single_turn()
+            return serialize(game)
+
+        for seed in range(0, 5):
+            expected = play(seed)
+            hearthbreaker.tags.compiler.enable()
+            actual = play(seed)
+            hearthbreaker.tags.compiler.disable()
+            self.assertEqual(expected, actual)
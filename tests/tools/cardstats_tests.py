@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from hearthbreaker.cards.catalog import card_id, register
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.cardstats import CardStatistics, CardCounter, COLUMNS, DRAWN, PLAYED, DRAWN_BY_WINNER, \
+        PLAYED_BY_WINNER, FIRST_TURN
+    from hearthbreaker.tools.jobs import Job, JobRunner
+    from hearthbreaker.tools.simulation import play_game, read_deck
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestCardStatistics(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.decks = (read_deck("zoo.hsdeck"), read_deck("example.hsdeck"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_counter(self):
+        counter = CardCounter()
+        results = [counter.play(self.decks, ("Random", "Random"), seed) for seed in range(5)]
+        self.assertEqual([play_game(self.decks, ("Random", "Random"), seed).cards_played for seed in range(5)],
+                         [result.cards_played for result in results])
+
+        with CardStatistics() as table:
+            counter.flush(table)
+            self.assertEqual({}, counter.counts)
+            self.assertEqual(5, table.games)
+            rows = table.rows()
+            played = sum(row[PLAYED] for name, row in rows)
+            self.assertEqual(sum(len(result.cards_played) for result in results), played)
+            self.assertEqual(played, sum(sum(row[FIRST_TURN:]) for name, row in rows))
+            # At least the opening hands are drawn in every game
+            self.assertLessEqual(5 * 7, sum(row[DRAWN] for name, row in rows))
+            for name, row in rows:
+                self.assertLessEqual(row[DRAWN_BY_WINNER], row[DRAWN])
+                self.assertLessEqual(row[PLAYED_BY_WINNER], row[PLAYED])
+                self.assertEqual(len(COLUMNS), len(row))
+            self.assertEqual(0, table.count("The Coin", DRAWN))
+            self.assertEqual(sum(result.cards_played.count("The Coin") for result in results),
+                             table.count("The Coin", PLAYED))
+
+            # Only the cards in the catalog are counted, and looking one up doesn't add it to the catalog
+            self.assertRaises(KeyError, table.count, "A card nobody has heard of", PLAYED)
+            self.assertRaises(KeyError, card_id, "A card nobody has heard of")
+            self.assertRaises(KeyError, table.count, register("A card only this process knows"), PLAYED)
+
+            # Another process can attach to the table by its name.  This process shares its own resource tracker.
+            attached = CardStatistics(table.name, tracked=True)
+            self.assertEqual(rows, attached.rows())
+            attached.close()
+            # A process with a tracker of its own takes the table off it, and so do the processes it sends the table to
+            with mock.patch("hearthbreaker.tools.cardstats.resource_tracker.unregister") as unregister:
+                untracked = CardStatistics(table.name)
+            unregister.assert_called_once_with(untracked._memory._name, "shared_memory")
+            self.assertTrue(table.__getstate__()[2])
+            self.assertFalse(untracked.__getstate__()[2])
+            untracked.close()
+
+            filename = os.path.join(self.directory, "cards.csv")
+            table.write_csv(filename)
+            with open(filename) as csv_file:
+                self.assertEqual(len(rows) + 1, len(csv_file.readlines()))
+
+    def test_jobs(self):
+        jobs = [Job(self.decks, ("Random", "Random"), range(0, 12))]
+        with CardStatistics() as serial, CardStatistics() as parallel:
+            JobRunner(jobs, os.path.join(self.directory, "serial.csv"), batch_size=5).run(1, card_stats=serial)
+            JobRunner(jobs, os.path.join(self.directory, "parallel.csv"), batch_size=5).run(2, card_stats=parallel)
+            self.assertEqual(12, serial.games)
+            self.assertEqual(12, parallel.games)
+            self.assertEqual(serial.rows(), parallel.rows())
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        counter = CardCounter()
+        counter.play(self.decks, ("Random", "Random"), 0)
+        with CardStatistics() as table:
+            counter.flush(table)
+            array = table.to_numpy()
+            self.assertEqual(len(COLUMNS), array.shape[1])
+            self.assertEqual(sum(row[PLAYED] for name, row in table.rows()), array[:, PLAYED].sum())
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from hearthbreaker.tools.cluster import start_local_workers
+
+# These use async syntax, so they are kept out of cluster_tests.py, which has to be importable by versions of Python
+# which are too old for the tools, so that its tests can be skipped
+
+
+def send(writer, message):
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+
+
+async def take_batch(port):
+    # Connect as a worker, and ask for a single batch
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    send(writer, {"type": "hello", "name": "test"})
+    await reader.readline()
+    send(writer, {"type": "request"})
+    batch = json.loads((await reader.readline()).decode("utf-8"))
+    return reader, writer, batch
+
+
+async def lost_workers(coordinator):
+    await coordinator.start()
+    # One worker disconnects as soon as it is sent a batch, and another just stops responding
+    reader, writer, first_batch = await take_batch(coordinator.port)
+    writer.close()
+    silent_reader, silent_writer, second_batch = await take_batch(coordinator.port)
+    workers = start_local_workers("127.0.0.1", coordinator.port, 1, heartbeat=0.1)
+    results = await coordinator.wait()
+    for worker in workers:
+        worker.join()
+    silent_writer.close()
+    return results, first_batch, second_batch
+
+
+async def send_after_batch(coordinator, message):
+    # Take a batch, then answer it with the given message, with the batch's id filled in
+    await coordinator.start()
+    reader, writer, batch = await take_batch(coordinator.port)
+    send(writer, dict(message, batch=batch["batch"]))
+    try:
+        return await coordinator.wait()
+    finally:
+        writer.close()
+
+
+class SlowWriter:
+    """
+    Stands in for a stream writer whose transport is paused, so that waiting for it to drain takes a while
+    """
+
+    def __init__(self):
+        self.written = []
+        self.draining = 0
+        #: The most tasks which were waiting for the writer to drain at the same time
+        self.most_draining = 0
+
+    def write(self, data):
+        self.written.append(data)
+
+    async def drain(self):
+        self.draining += 1
+        self.most_draining = max(self.most_draining, self.draining)
+        await asyncio.sleep(0.01)
+        self.draining -= 1
+
+
+async def send_together(worker, count):
+    # Send messages from several tasks at once, as the heartbeat and the batches being played do
+    worker._sending = asyncio.Lock()
+    writer = SlowWriter()
+    await asyncio.gather(*[worker._send(writer, {"type": "heartbeat"}) for i in range(count)])
+    return writer
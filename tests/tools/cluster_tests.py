@@ -0,0 +1,67 @@
+import unittest
+from unittest import mock
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    import asyncio
+    from hearthbreaker.tools.cluster import Coordinator, Worker
+    from hearthbreaker.tools.jobs import Job
+    from hearthbreaker.tools.simulation import DeckList, play_games, read_deck
+    from tests.tools.cluster_scenarios import lost_workers, send_after_batch, send_together
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestCluster(unittest.TestCase):
+    def setUp(self):
+        zoo = read_deck("zoo.hsdeck")
+        self.jobs = [Job((zoo, read_deck("example.hsdeck")), ("Random", "Random"), range(0, 18)),
+                     Job((zoo, read_deck("patron.hsdeck")), ("Random", "Random"), range(50, 60))]
+        self.expected = [play_games(job.decks, job.agents, job.seeds) for job in self.jobs]
+
+    def assertResults(self, results):
+        self.assertEqual(self.expected, [(result.wins, result.losses, result.draws) for result in results])
+        self.assertTrue(all(result.finished for result in results))
+
+    def test_local_workers(self):
+        coordinator = Coordinator(self.jobs, batch_size=4)
+        self.assertResults(coordinator.run(local_workers=2))
+        self.assertEqual(8, coordinator.finished_batches)
+        self.assertEqual(0, coordinator.retried)
+
+    def test_lost_workers(self):
+        coordinator = Coordinator(self.jobs, batch_size=4, timeout=0.5)
+        results, first_batch, second_batch = asyncio.run(lost_workers(coordinator))
+        self.assertEqual({"type": "batch", "batch": 0, "job": 0, "seeds": [0, 4]}, first_batch)
+        # The batch lost with the first worker is handed out again straight away
+        self.assertEqual(0, second_batch["batch"])
+        self.assertResults(results)
+        self.assertEqual(2, coordinator.retried)
+
+    def test_failed_batch(self):
+        coordinator = Coordinator(self.jobs, batch_size=4)
+        self.assertRaises(RuntimeError, asyncio.run,
+                          send_after_batch(coordinator, {"type": "error", "message": "broken"}))
+
+    def test_many_jobs(self):
+        # Enough different decks that sending them all in full would be longer than the default limit on a line
+        zoo = read_deck("zoo.hsdeck")
+        example = read_deck("example.hsdeck")
+        jobs = [Job((DeckList("zoo {}".format(index), zoo.cards), DeckList("example {}".format(index), example.cards)),
+                    ("Random", "Random"), range(index, index + 1)) for index in range(70)]
+        coordinator = Coordinator(jobs, batch_size=4)
+        results = coordinator.run(local_workers=1)
+        self.assertEqual([play_games(job.decks, job.agents, job.seeds) for job in jobs],
+                         [(result.wins, result.losses, result.draws) for result in results])
+        self.assertEqual(0, coordinator.retried)
+
+    def test_message_too_long(self):
+        coordinator = Coordinator(self.jobs, batch_size=4)
+        # A message which can't be read stops everything, rather than its batch being retried forever
+        with mock.patch("hearthbreaker.tools.cluster.MESSAGE_LIMIT", 1024):
+            self.assertRaises(RuntimeError, asyncio.run,
+                              send_after_batch(coordinator, {"type": "result", "games": [[0, 0, 0, 10, 0.1]] * 200}))
+        self.assertEqual(0, coordinator.retried)
+
+    def test_one_drain_at_a_time(self):
+        writer = asyncio.run(send_together(Worker("127.0.0.1", 0), 5))
+        self.assertEqual(5, len(writer.written))
+        self.assertEqual(1, writer.most_draining)
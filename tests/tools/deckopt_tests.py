@@ -0,0 +1,73 @@
+import random
+import unittest
+from collections import Counter
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.engine import card_lookup
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.deckopt import CardPool, DeckOptimizer, deck_hash
+    from hearthbreaker.tools.simulation import read_deck
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestDeckOptimizer(unittest.TestCase):
+    def setUp(self):
+        self.pool = CardPool(CHARACTER_CLASS.WARLOCK)
+
+    def test_card_pool(self):
+        self.assertEqual(1, self.pool.limits["Leeroy Jenkins"])
+        self.assertEqual(2, self.pool.limits["Flame Imp"])
+        self.assertNotIn("Fireball", self.pool.limits)
+
+        zoo = read_deck("zoo.hsdeck")
+        self.assertTrue(self.pool.is_legal(zoo.cards))
+        self.assertFalse(self.pool.is_legal(zoo.cards[1:]))
+        self.assertFalse(self.pool.is_legal(zoo.cards[1:] + ["Fireball"]))
+        self.assertFalse(self.pool.is_legal(zoo.cards[3:] + ["Shieldbearer"] * 3))
+
+        rng = random.Random(1857)
+        for i in range(0, 20):
+            deck = self.pool.random_deck(rng)
+            self.assertTrue(self.pool.is_legal(deck))
+            for card in deck:
+                self.assertIn(card_lookup(card).character_class, [CHARACTER_CLASS.ALL, CHARACTER_CLASS.WARLOCK])
+
+        # Cards over the limit, or from other classes, are replaced
+        deck = self.pool.fill(["Flame Imp"] * 5 + ["Leeroy Jenkins"] * 2 + ["Fireball"], rng)
+        self.assertTrue(self.pool.is_legal(deck))
+        self.assertEqual(2, Counter(deck)["Flame Imp"])
+        self.assertEqual(1, Counter(deck)["Leeroy Jenkins"])
+        self.assertEqual(tuple(sorted(deck)), deck)
+
+    def test_deck_hash(self):
+        zoo = read_deck("zoo.hsdeck")
+        self.assertEqual(deck_hash(zoo.cards), deck_hash(list(reversed(zoo.cards))))
+        self.assertNotEqual(deck_hash(zoo.cards), deck_hash(zoo.cards[1:] + ["Wisp"]))
+
+    def test_optimizer(self):
+        gauntlet = [read_deck("example.hsdeck")]
+        optimizer = DeckOptimizer(CHARACTER_CLASS.WARLOCK, gauntlet, games=2, population=6, elite=2, seed=3)
+        best, score = optimizer.run(3, processes=1, initial=[read_deck("zoo.hsdeck")])
+        self.assertTrue(self.pool.is_legal(best.cards))
+        self.assertEqual(CHARACTER_CLASS.WARLOCK, best.character_class)
+        self.assertEqual(4, len(optimizer.history))
+        self.assertEqual(score, optimizer.history[-1])
+        self.assertEqual(sorted(optimizer.history), optimizer.history)
+
+        # The elite decks are never played again
+        self.assertLessEqual(optimizer.evaluated, 6 + 3 * 4)
+        self.assertEqual(optimizer.evaluated, len(optimizer.memo))
+
+        # With the same settings and the saved scores, nothing needs to be played
+        again = DeckOptimizer(CHARACTER_CLASS.WARLOCK, gauntlet, games=2, population=6, elite=2, seed=3,
+                              memo=dict(optimizer.memo))
+        again_best, again_score = again.run(3, processes=1, initial=[read_deck("zoo.hsdeck")])
+        self.assertEqual(best.cards, again_best.cards)
+        self.assertEqual(score, again_score)
+        self.assertEqual(0, again.evaluated)
+
+        # Scores from different settings aren't reused
+        different = DeckOptimizer(CHARACTER_CLASS.WARLOCK, gauntlet, games=3, population=6, seed=3,
+                                  memo=dict(optimizer.memo))
+        different.score([best.cards])
+        self.assertEqual(1, different.evaluated)
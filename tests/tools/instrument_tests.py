@@ -0,0 +1,94 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from hearthbreaker.game_objects import Bindable
+import hearthbreaker.tags.compiler
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.instrument import Instrumentation, COLUMNS
+    from hearthbreaker.tools.simulation import play_game, read_deck
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.decks = (read_deck("zoo.hsdeck"), read_deck("example.hsdeck"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_counts(self):
+        trigger = Bindable.trigger
+        expected = play_game(self.decks, ("Random", "Random"), 3)
+        with Instrumentation() as instrumentation:
+            self.assertIsNot(trigger, Bindable.trigger)
+            self.assertRaises(RuntimeError, Instrumentation().enable)
+            result = play_game(self.decks, ("Random", "Random"), 3)
+        self.assertIs(trigger, Bindable.trigger)
+        self.assertEqual(expected.cards_played, result.cards_played)
+
+        totals = instrumentation.totals()
+        self.assertEqual(len(result.cards_played), totals[("play_card", "play_card")][0])
+        self.assertLessEqual(totals[("use", "use")][0], totals[("play_card", "play_card")][0])
+        self.assertLessEqual(1, totals[("attack", "attack")][0])
+        self.assertLessEqual(1, totals[("trigger", "turn_started")][0])
+        self.assertIn(("check_delayed", "check_delayed"), totals)
+        turns = totals[("agent", "RandomAgent.do_turn")][0]
+        self.assertIn(turns, [2 * result.turns - 1, 2 * result.turns])
+        # The time spent choosing where to put minions is part of the time spent taking turns
+        self.assertGreater(totals[("agent", "RandomAgent.do_turn")][1],
+                           totals[("agent", "RandomAgent.choose_index")][1])
+
+        by_card = instrumentation.totals(by_card=True)
+        for card in set(result.cards_played):
+            # Cards which are played are counted against their own names
+            if card != "The Coin":
+                self.assertIn(("play_card", card), by_card)
+
+        # Nothing is counted once the instrumentation is disabled
+        count = totals[("play_card", "play_card")][0]
+        play_game(self.decks, ("Random", "Random"), 4)
+        self.assertEqual(count, instrumentation.totals()[("play_card", "play_card")][0])
+
+    def test_compiled_tags(self):
+        compiler = hearthbreaker.tags.compiler
+        expected = play_game(self.decks, ("Random", "Random"), 5)
+        compiler.enable()
+        try:
+            with Instrumentation() as instrumentation:
+                self.assertTrue(compiler.is_enabled())
+                # Switching the compiler would throw the instrumentation away
+                self.assertRaises(RuntimeError, compiler.disable)
+                self.assertRaises(RuntimeError, compiler.enable)
+                result = play_game(self.decks, ("Random", "Random"), 5)
+            self.assertTrue(compiler.is_enabled())
+            compiler.disable()
+            self.assertFalse(compiler.is_enabled())
+        finally:
+            compiler.disable()
+        self.assertEqual(expected.cards_played, result.cards_played)
+        self.assertTrue(any(category == "action" for category, name in instrumentation.totals()))
+
+        with Instrumentation():
+            self.assertFalse(compiler.is_enabled())
+
+    def test_export(self):
+        with Instrumentation() as instrumentation:
+            play_game(self.decks, ("Random", "Random"), 0)
+        copied = Instrumentation.__from_json__(json.loads(json.dumps(instrumentation.__to_json__())))
+        self.assertEqual(instrumentation.rows(), copied.rows())
+
+        copied.merge(instrumentation)
+        for key, (calls, seconds, fanout) in instrumentation.stats.items():
+            self.assertEqual(2 * calls, copied.stats[key][0])
+            self.assertEqual(2 * fanout, copied.stats[key][2])
+
+        filename = os.path.join(self.directory, "engine.csv")
+        instrumentation.write_csv(filename)
+        with open(filename) as csv_file:
+            lines = csv_file.read().splitlines()
+        self.assertEqual(",".join(COLUMNS), lines[0])
+        self.assertEqual(len(instrumentation.stats) + 1, len(lines))
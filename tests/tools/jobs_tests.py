@@ -0,0 +1,85 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.jobs import Job, JobRunner, Checkpoint, read_manifest, write_manifest
+    from hearthbreaker.tools.simulation import read_deck
+
+
+def _games(filename):
+    # Everything but the duration, which changes from run to run
+    with open(filename, "r", newline="") as results_file:
+        return sorted((int(row[0]), int(row[1]), row[2], row[3], row[4]) for row in list(csv.reader(results_file))[1:])
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestJobs(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        zoo = read_deck("zoo.hsdeck")
+        self.jobs = [Job((zoo, read_deck("example.hsdeck")), ("Random", "Random"), range(0, 23)),
+                     Job((zoo, read_deck("patron.hsdeck")), ("Random", "Random"), range(100, 110))]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_manifest(self):
+        filename = os.path.join(self.directory, "jobs.json")
+        write_manifest(self.jobs, filename)
+        jobs = read_manifest(filename)
+        self.assertEqual(self.jobs, jobs)
+        self.assertEqual(self.jobs[0].decks[0].character_class, jobs[0].decks[0].character_class)
+
+        with open(filename, "w") as manifest_file:
+            manifest_file.write('{"jobs": [{"decks": ["zoo.hsdeck", "example.hsdeck"], "seeds": [5, 10]}]}')
+        shutil.copy("zoo.hsdeck", self.directory)
+        shutil.copy("example.hsdeck", self.directory)
+        self.assertEqual([Job(self.jobs[0].decks, ("Random", "Random"), range(5, 10))], read_manifest(filename))
+
+    def test_checkpoint(self):
+        checkpoint = Checkpoint(self.jobs)
+        checkpoint.finish(0, 0)
+        checkpoint.finish(0, 22)
+        checkpoint.finish(1, 109)
+        checkpoint.log_size = 1234
+        filename = os.path.join(self.directory, "checkpoint")
+        checkpoint.save(filename)
+        self.assertEqual([3, 2], [len(bitmap) for bitmap in checkpoint.bitmaps])
+
+        loaded = Checkpoint.load(filename, self.jobs)
+        self.assertEqual(1234, loaded.log_size)
+        self.assertTrue(loaded.is_finished(0, 22))
+        self.assertFalse(loaded.is_finished(0, 21))
+        self.assertTrue(loaded.is_finished(1, 109))
+        self.assertEqual(2, loaded.count(0))
+        self.assertEqual(1, loaded.count(1))
+        self.assertRaises(ValueError, Checkpoint.load, filename, self.jobs[:1])
+
+    def test_resume(self):
+        complete = os.path.join(self.directory, "complete.csv")
+        runner = JobRunner(self.jobs, complete, batch_size=4)
+        self.assertEqual(33, runner.run(processes=1))
+        self.assertEqual(0, runner.run(processes=1))
+        expected = runner.results()
+        self.assertEqual([23, 10], [result.games for result in expected])
+        self.assertTrue(all(result.finished for result in expected))
+
+        resumed = os.path.join(self.directory, "resumed.csv")
+        runner = JobRunner(self.jobs, resumed, batch_size=4)
+        self.assertEqual(8, runner.run(processes=1, limit=5))
+        self.assertEqual([8, 0], [result.games for result in runner.results()])
+        self.assertFalse(runner.results()[0].finished)
+
+        # Games written after the checkpoint was saved, as if the runner had been killed, are thrown away
+        with open(resumed, "a") as results_file:
+            results_file.write("0,8,1,0,12,0.1\n0,9,")
+        self.assertEqual([8, 0], [result.games for result in runner.results()])
+
+        self.assertEqual(25, runner.run(processes=2))
+        self.assertEqual(_games(complete), _games(resumed))
+        results = runner.results()
+        self.assertEqual([(result.wins, result.losses, result.draws) for result in expected],
+                         [(result.wins, result.losses, result.draws) for result in results])
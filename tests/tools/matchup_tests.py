@@ -0,0 +1,53 @@
+import unittest
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.matchup import SequentialTest, MatchupRunner
+    from hearthbreaker.tools.simulation import read_deck
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestMatchup(unittest.TestCase):
+    def setUp(self):
+        self.decks = [read_deck("zoo.hsdeck"), read_deck("example.hsdeck"), read_deck("patron.hsdeck")]
+
+    def test_sequential_test(self):
+        test = SequentialTest(0.1)
+        self.assertEqual(0, test.decide(0, 0))
+        self.assertEqual(1, test.decide(40, 40))
+        self.assertEqual(-1, test.decide(0, 40))
+        self.assertEqual(0, test.decide(20, 40))
+        self.assertEqual(0, test.decide(2, 2))
+
+        # A smaller margin needs more games to decide the same win rate
+        self.assertEqual(1, test.decide(70, 100))
+        self.assertEqual(0, SequentialTest(0.01).decide(70, 100))
+
+    def test_runner(self):
+        matchups = [((self.decks[0], self.decks[1]), ("Random", "Random")),
+                    ((self.decks[1], self.decks[2]), ("Random", "Random"))]
+        runner = MatchupRunner(matchups, SequentialTest(0.2), batch_size=10, max_games=60, seed=5)
+        results = runner.run(processes=1)
+        for result in results:
+            self.assertTrue(result.finished)
+            self.assertLessEqual(result.games, 60)
+            self.assertEqual(0, result.games % 10)
+            if result.games < 60:
+                self.assertNotEqual(0, result.decision)
+
+        # Each matchup stops after the same games, however many processes play them
+        parallel = runner.run(processes=2)
+        for result, parallel_result in zip(results, parallel):
+            self.assertEqual((result.wins, result.losses, result.draws, result.decision),
+                             (parallel_result.wins, parallel_result.losses, parallel_result.draws,
+                              parallel_result.decision))
+
+    def test_width(self):
+        matchups = [((self.decks[0], self.decks[2]), ("Random", "Random"))]
+        result = MatchupRunner(matchups, width=0.35, batch_size=5, max_games=100).run(processes=1)[0]
+        lower, upper = result.confidence_interval()
+        self.assertLessEqual(upper - lower, 0.35)
+        self.assertLess(result.games, 100)
+
+        result = MatchupRunner(matchups, batch_size=7, max_games=10).run(processes=1)[0]
+        self.assertEqual(10, result.games)
+        self.assertEqual(0, result.decision)
@@ -0,0 +1,64 @@
+import unittest
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.paired import align, compare, PairedResult
+    from hearthbreaker.tools.simulation import read_deck, DeckList
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestPaired(unittest.TestCase):
+    def setUp(self):
+        self.zoo = read_deck("zoo.hsdeck")
+        cards = list(self.zoo.cards)
+        cards.remove("Flame Imp")
+        self.variant = DeckList("zoo with wisp", ["Wisp"] + cards)
+        self.opponents = [read_deck("example.hsdeck"), read_deck("patron.hsdeck")]
+
+    def test_align(self):
+        aligned = align(self.zoo, self.variant)
+        self.assertEqual("zoo with wisp", aligned.name)
+        self.assertEqual(sorted(self.variant.cards), sorted(aligned.cards))
+        differences = [index for index in range(30) if aligned.cards[index] != self.zoo.cards[index]]
+        self.assertEqual(1, len(differences))
+        self.assertEqual("Wisp", aligned.cards[differences[0]])
+        self.assertEqual("Flame Imp", self.zoo.cards[differences[0]])
+
+        self.assertEqual(self.zoo.cards, align(self.zoo, DeckList("zoo", reversed(self.zoo.cards))).cards)
+
+    def test_same_deck(self):
+        # With the same deck on both sides, every pair of games is identical
+        result = compare(self.zoo, self.zoo, self.opponents[:1], games=10, processes=1)[0]
+        self.assertEqual(10, result.games)
+        self.assertEqual(10, result.ties)
+        self.assertEqual(0, result.difference)
+        self.assertEqual(0, result.variance)
+
+    def test_compare(self):
+        results = compare(self.zoo, self.variant, self.opponents, games=30, batch_size=10, processes=1)
+        overall = PairedResult()
+        for result in results:
+            self.assertEqual(30, result.games)
+            self.assertAlmostEqual(result.variant_win_rate - result.base_win_rate, result.difference)
+            lower, upper = result.confidence_interval()
+            self.assertLess(lower, result.difference)
+            self.assertGreater(upper, result.difference)
+            overall.merge(result)
+        self.assertEqual(60, overall.games)
+        self.assertGreater(overall.ties, 30)
+        self.assertLess(overall.variance, overall.unpaired_variance)
+
+        parallel = compare(self.zoo, self.variant, self.opponents, games=30, batch_size=10, processes=2)
+        for result, parallel_result in zip(results, parallel):
+            self.assertEqual((result.base_total, result.variant_total, result.ties),
+                             (parallel_result.base_total, parallel_result.variant_total, parallel_result.ties))
+
+    def test_paired_result(self):
+        result = PairedResult()
+        for base, variant in [(1, 1), (0, 1), (0.5, 0), (1, 1)]:
+            result.add(base, variant)
+        self.assertEqual(4, result.games)
+        self.assertEqual(2, result.ties)
+        self.assertAlmostEqual(0.125, result.difference)
+        differences = [0, 1, -0.5, 0]
+        mean = sum(differences) / 4
+        self.assertAlmostEqual(sum((d - mean) ** 2 for d in differences) / 3, result.variance)
@@ -0,0 +1,46 @@
+import multiprocessing
+import os
+import unittest
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.pool import WarmPool, shared
+
+
+def _lookup(index):
+    return shared()[index], os.getpid()
+
+
+def _call(argument):
+    return shared()(argument)
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestWarmPool(unittest.TestCase):
+    def test_shared_state(self):
+        with WarmPool(2, ["zero", "one", "two"]) as pool:
+            results = sorted(pool.imap_unordered(_lookup, [2, 0, 1]))
+            self.assertEqual(["one", "two", "zero"], sorted(value for value, pid in results))
+            self.assertNotIn(os.getpid(), [pid for value, pid in results])
+            self.assertEqual(["two", "two"], [value for value, pid in pool.map(_lookup, [2, 2])])
+        self.assertIsNone(shared())
+
+    @unittest.skipUnless(hearthbreaker.tools.SUPPORTED and "spawn" in multiprocessing.get_all_start_methods(),
+                         "Needs the spawn start method")
+    def test_started_workers(self):
+        # Workers which aren't forked are sent the state when they start
+        with WarmPool(2, ["zero", "one"], start_method="spawn") as pool:
+            self.assertEqual(["one", "zero"], [value for value, pid in pool.map(_lookup, [1, 0])])
+
+    def test_in_process(self):
+        with WarmPool(1, ["outer"]):
+            with WarmPool(1, ["inner"]) as pool:
+                self.assertEqual([("inner", os.getpid())], list(pool.imap_unordered(_lookup, [0])))
+            self.assertEqual(["outer"], shared())
+        self.assertIsNone(shared())
+
+    @unittest.skipUnless(hearthbreaker.tools.SUPPORTED and "fork" in multiprocessing.get_all_start_methods(),
+                         "Workers can only inherit state by forking")
+    def test_inherited(self):
+        # A lambda can't be pickled, so the workers must have inherited it
+        with WarmPool(2, lambda value: value * 2, start_method="fork") as pool:
+            self.assertEqual([2, 4, 6], pool.map(_call, [1, 2, 3]))
@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    import hearthbreaker.tools.tournament
+    from hearthbreaker.tools.pool import WarmPool
+    from hearthbreaker.tools.results import ResultStore
+    from hearthbreaker.tools.simulation import DeckList, GameResult, read_deck, play_game
+    from hearthbreaker.tools.tournament import Tournament
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, "games.db")
+        self.decks = (read_deck("zoo.hsdeck"), read_deck("example.hsdeck"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_record(self):
+        agents = ("Random", "Random")
+        with ResultStore(self.filename, batch_size=3) as store:
+            results = [play_game(self.decks, agents, seed) for seed in range(10)]
+            for result in results:
+                store.add(self.decks, agents, result)
+            store.flush()
+            self.assertEqual(10, store.count())
+
+            wins = sum(1 for result in results if result.winner == 0)
+            losses = sum(1 for result in results if result.winner == 1)
+            draws = sum(1 for result in results if result.winner is None)
+            self.assertEqual((wins, losses, draws), store.record("zoo"))
+            self.assertEqual((losses, wins, draws), store.record("example"))
+            self.assertEqual((wins, losses, draws), store.record("zoo", "example", "Random"))
+            self.assertEqual((0, 0, 0), store.record("zoo", "patron"))
+            self.assertAlmostEqual((wins + draws / 2) / 10, store.win_rate("zoo"))
+            self.assertIsNone(store.win_rate("patron"))
+            self.assertEqual([("zoo", "example", "Random", "Random", wins, losses, draws)], store.matchups())
+
+            row = store._connection.execute("SELECT went_first, turns, cards_played FROM games WHERE seed = 3")\
+                .fetchone()
+            self.assertEqual((1 if results[3].first == 0 else 0, results[3].turns), row[:2])
+            self.assertEqual(list(results[3].cards_played), json.loads(row[2]))
+
+        # Opening the database again keeps the games, and adding the same games again doesn't count them twice
+        with ResultStore(self.filename) as store:
+            for result in results:
+                store.add(self.decks, agents, result)
+            store.add(self.decks, ("Trade", "Random"), results[0])
+            store.flush()
+            self.assertEqual(11, store.count())
+            self.assertEqual((wins, losses, draws), store.record("zoo", agent="Random"))
+
+    def test_edited_deck(self):
+        agents = ("Random", "Random")
+        result = play_game(self.decks, agents, 0)
+        edited = DeckList("zoo", self.decks[0].cards[1:] + ["Wisp"], self.decks[0].character_class)
+        with ResultStore(self.filename) as store:
+            store.add(self.decks, agents, result)
+            # The same seed with a deck which has been changed, but kept its name, is a different game
+            store.add((edited, self.decks[1]), agents, GameResult(0, None, 0, 10, 0.1, ("Wisp",)))
+            store.add(self.decks, agents, result)
+            store.flush()
+            self.assertEqual(2, store.count())
+            self.assertEqual(2, sum(store.record("zoo")))
+            self.assertEqual(1 + (result.winner is None), store.record("zoo")[2])
+
+    def test_old_database(self):
+        connection = sqlite3.connect(self.filename)
+        with connection:
+            # The table as it was before the decks' hashes were stored
+            connection.execute("CREATE TABLE games (deck, opponent, agent, opponent_agent, seed, winner, went_first, "
+                               "turns, duration, cards_played, "
+                               "PRIMARY KEY (deck, opponent, agent, opponent_agent, seed))")
+        connection.close()
+        self.assertRaises(ValueError, ResultStore, self.filename)
+
+    def test_tournament(self):
+        tournament = Tournament.round_robin(["Random"], list(self.decks), 6, batch_size=2)
+        writing = []
+
+        def start_pool(*args):
+            writing.append(store._writer.is_alive())
+            return WarmPool(*args)
+
+        with ResultStore(self.filename) as store:
+            # The workers are forked before the store starts writing
+            with mock.patch.object(hearthbreaker.tools.tournament, "WarmPool", side_effect=start_pool):
+                results = tournament.run(processes=2, store=store)
+            self.assertEqual([False], writing)
+            store.flush()
+            self.assertEqual(6, store.count())
+            self.assertEqual((results.wins[0][1], results.wins[1][0], results.draws[0][1]),
+                             store.record("zoo", "example"))
+
+    def test_checkpoint_after_write(self):
+        tournament = Tournament.round_robin(["Random"], list(self.decks), 6, batch_size=2)
+        checkpoint = os.path.join(self.directory, "checkpoint.json")
+        saved = []
+        save_checkpoint = tournament._save_checkpoint
+
+        def check_written(filename, finished):
+            # Every game in a batch marked as finished must already be in the database
+            saved.append((sum(sum(counts) for counts in finished.values()), store.count()))
+            save_checkpoint(filename, finished)
+
+        tournament._save_checkpoint = check_written
+        with ResultStore(self.filename) as store:
+            tournament.run(processes=1, checkpoint=checkpoint, store=store)
+        self.assertEqual([(2, 2), (4, 4), (6, 6)], saved)
+
+    def test_close_writes_everything(self):
+        store = ResultStore(self.filename)
+        for seed in range(50):
+            store.add(self.decks, ("Random", "Random"), GameResult(seed, seed % 2, 0, 10, 0.1, ("Wisp",)))
+        store.close()
+        with ResultStore(self.filename) as store:
+            self.assertEqual(50, store.count())
+            self.assertEqual((25, 25, 0), store.record("zoo"))
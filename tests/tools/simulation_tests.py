@@ -0,0 +1,90 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.engine import Game
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.simulation import read_deck, write_deck, play_game, wilson_interval, DeckList
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestSimulation(unittest.TestCase):
+    def test_read_deck(self):
+        deck = read_deck("zoo.hsdeck")
+        self.assertEqual("zoo", deck.name)
+        self.assertEqual(30, len(deck.cards))
+        self.assertEqual(2, deck.cards.count("Flame Imp"))
+        self.assertEqual(CHARACTER_CLASS.WARLOCK, deck.character_class)
+        self.assertEqual(deck, read_deck("zoo.hsdeck"))
+
+        first = deck.to_deck()
+        second = deck.to_deck()
+        self.assertEqual(30, first.left)
+        self.assertIsNot(first.cards[0], second.cards[0])
+
+    def test_write_deck(self):
+        deck = read_deck("patron.hsdeck")
+        directory = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(directory, "copy.hsdeck")
+            write_deck(deck, filename)
+            copied = read_deck(filename)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual("copy", copied.name)
+        self.assertEqual(sorted(deck.cards), sorted(copied.cards))
+        self.assertEqual(deck.character_class, copied.character_class)
+
+    def test_play_game(self):
+        decks = (read_deck("zoo.hsdeck"), read_deck("example.hsdeck"))
+        results = [play_game(decks, ("Random", "Random"), seed) for seed in range(0, 4)]
+        for seed, result in enumerate(results):
+            self.assertEqual(seed, result.seed)
+            self.assertIn(result.winner, [0, 1, None])
+            self.assertIn(result.first, [0, 1])
+            self.assertGreater(result.turns, 0)
+            self.assertGreater(len(result.cards_played), 0)
+
+        # The same seed always gives the same game
+        for seed, result in enumerate(results):
+            self.assertEqual(result[:4], play_game(decks, ("Random", "Random"), seed)[:4])
+            self.assertEqual(result.cards_played, play_game(decks, ("Random", "Random"), seed).cards_played)
+
+    def test_separate_draws(self):
+        zoo = read_deck("zoo.hsdeck")
+        hands = []
+        for index, opponent in enumerate([read_deck("example.hsdeck"), read_deck("patron.hsdeck")]):
+            random.seed(1857)
+            game = Game([zoo.to_deck("seed"), opponent.to_deck()], [DoNothingAgent(), DoNothingAgent()])
+            game.pre_game()
+            for turn in range(0, 4):
+                # Using the game's random numbers differently doesn't change which cards are drawn
+                if index:
+                    random.random()
+                game.play_single_turn()
+            hands.append([card.name for card in game.players[game.first_player].hand])
+        self.assertEqual(hands[0], hands[1])
+
+        decks = (zoo, read_deck("example.hsdeck"))
+        self.assertEqual(play_game(decks, ("Random", "Random"), 3, True).cards_played,
+                         play_game(decks, ("Random", "Random"), 3, True).cards_played)
+
+    def test_wilson_interval(self):
+        self.assertEqual((0.0, 1.0), wilson_interval(0, 0))
+        lower, upper = wilson_interval(50, 100)
+        self.assertAlmostEqual(0.5, (lower + upper) / 2)
+        self.assertAlmostEqual(0.4038, lower, 4)
+        lower, upper = wilson_interval(10, 10)
+        self.assertLess(lower, 1.0)
+        self.assertEqual(1.0, upper)
+        narrow = wilson_interval(500, 1000)
+        self.assertLess(narrow[1] - narrow[0], 0.1)
+
+    def test_deck_list_class(self):
+        self.assertEqual(CHARACTER_CLASS.MAGE, DeckList("neutral", ["Wisp"] * 30).character_class)
+        deck = DeckList("neutral", ["Wisp"] * 30, CHARACTER_CLASS.ROGUE)
+        self.assertEqual(CHARACTER_CLASS.ROGUE, deck.character_class)
@@ -0,0 +1,85 @@
+import json
+import math
+import os
+import shutil
+import tempfile
+import unittest
+import hearthbreaker.tools
+if hearthbreaker.tools.SUPPORTED:
+    from hearthbreaker.tools.simulation import read_deck
+    from hearthbreaker.tools.tournament import Tournament, TournamentResults, Entrant
+
+
+@unittest.skipUnless(hearthbreaker.tools.SUPPORTED, "hearthbreaker.tools needs Python 3.8 or later")
+class TestTournament(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.decks = [read_deck("zoo.hsdeck"), read_deck("example.hsdeck"), read_deck("patron.hsdeck")]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_robin(self):
+        tournament = Tournament.round_robin(["Random"], self.decks, 5, batch_size=2, seed=10)
+        self.assertEqual(3, len(tournament.entrants))
+        self.assertEqual([(0, 1), (0, 2), (1, 2)], tournament.pairings)
+
+        results = tournament.run(processes=1)
+        for first, second in tournament.pairings:
+            self.assertEqual(5, results.games(first, second))
+            self.assertAlmostEqual(1.0, results.win_rate(first, second) + results.win_rate(second, first))
+            lower, upper = results.confidence_interval(first, second)
+            self.assertLessEqual(lower, results.win_rate(first, second))
+            self.assertGreaterEqual(upper, results.win_rate(first, second))
+        self.assertIsNone(results.win_rate(0, 0))
+        self.assertAlmostEqual(1500, sum(results.ratings()) / 3)
+        self.assertIn("Random/zoo", results.format_table())
+
+        # The same games are played no matter how many processes are used
+        parallel = tournament.run(processes=2)
+        self.assertEqual(results.wins, parallel.wins)
+        self.assertEqual(results.draws, parallel.draws)
+
+    def test_checkpoint(self):
+        checkpoint = os.path.join(self.directory, "checkpoint.json")
+        tournament = Tournament.round_robin(["Random"], self.decks[:2], 6, batch_size=2)
+        results = tournament.run(processes=1, checkpoint=checkpoint)
+        self.assertTrue(os.path.exists(checkpoint))
+
+        # Nothing is left to play, so the results all come from the checkpoint
+        self.assertEqual([], list(tournament._batches(tournament._load_checkpoint(checkpoint))))
+        resumed = tournament.run(processes=1, checkpoint=checkpoint)
+        self.assertEqual(results.wins, resumed.wins)
+        self.assertEqual(6, resumed.games(0, 1))
+
+        # Only the batch missing from the checkpoint is played again
+        with open(checkpoint) as checkpoint_file:
+            saved = json.load(checkpoint_file)
+        del saved['finished']["0:2"]
+        with open(checkpoint, "w") as checkpoint_file:
+            json.dump(saved, checkpoint_file)
+        self.assertEqual(1, len(list(tournament._batches(tournament._load_checkpoint(checkpoint)))))
+        resumed = tournament.run(processes=1, checkpoint=checkpoint)
+        self.assertEqual(results.wins, resumed.wins)
+        self.assertEqual(results.draws, resumed.draws)
+
+        different = Tournament.round_robin(["Random"], self.decks[:2], 8, batch_size=2)
+        self.assertRaises(ValueError, different.run, 1, checkpoint)
+
+    def test_ratings(self):
+        entrants = [Entrant("Random", deck) for deck in self.decks]
+        results = TournamentResults(entrants)
+        results.add(0, 1, 30, 10, 0)
+        results.add(1, 2, 30, 10, 0)
+        results.add(0, 2, 20, 20, 0)
+        ratings = results.ratings()
+        self.assertGreater(ratings[0], ratings[1])
+        self.assertGreater(ratings[1], ratings[2])
+        self.assertAlmostEqual(1500, sum(ratings) / 3)
+
+        results = TournamentResults(entrants[:2])
+        results.add(0, 1, 10, 0, 0)
+        ratings = results.ratings()
+        self.assertGreater(ratings[0], ratings[1])
+        self.assertAlmostEqual(results.ratings(prior=0.5)[0] - results.ratings(prior=0.5)[1],
+                               400 * math.log10(10.25 / 0.25), 3)